@@ -1,4 +1,5 @@
 pytest_plugins = (
+    "pd_django_small.core.pytest_memory",
     "pd_django_small.organizations.tests.fixtures",
     "pd_django_small.subscriptions.tests.fixtures",
     "pd_django_small.users.tests.fixtures",
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "pd_django_small.core"
+
+    def ready(self):
+        # Registers the integrity checks of every app (see core.integrity).
+        autodiscover_modules("integrity")
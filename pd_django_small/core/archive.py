@@ -0,0 +1,161 @@
+"""
+Move soft-deleted rows out of the live tables.
+
+Rows with is_removed=True whose updated_at is older than a cutoff are deleted in
+batches, each batch is one statement in its own transaction: the selected rows,
+and the rows referencing them through a cascading foreign key or an auto-created
+many-to-many table, are deleted and inserted into core_archivedrecord as JSON.
+Rows still pointed to by a live row, through a cascading foreign key or a soft
+reference (uuid columns listed in SoftReferenceQuerySet.soft_references), are
+kept.
+Batches lock with SKIP LOCKED, rows locked by a concurrent request are left
+for the next run.
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+
+from pd_django_small.core.models import ArchivedRecord
+
+ARCHIVE_BATCH_SIZE = 1000
+# Referencing models first, a membership may outlive its removed workspace otherwise.
+ARCHIVED_MODELS = ("workspaces.Membership", "workspaces.Workspace", "users.User")
+
+
+def _has_is_removed(meta: models.options.Options) -> bool:
+    return any(field.name == "is_removed" for field in meta.concrete_fields)
+
+
+def dependent_tables(
+    model: type[models.Model],
+) -> Iterator[tuple[str, str, str, str, bool]]:
+    """
+    (label, table, column, primary key column, has is_removed) of tables
+    referencing "model" rows.
+    """
+
+    for relation in model._meta.related_objects:
+        if relation.many_to_many or relation.on_delete is not models.CASCADE:
+            continue
+        related = relation.related_model._meta
+        yield (
+            related.label,
+            related.db_table,
+            relation.field.column,
+            related.pk.column,
+            _has_is_removed(related),
+        )
+
+    for field in model._meta.local_many_to_many:
+        through = field.remote_field.through._meta
+        if through.auto_created:
+            yield (
+                through.label,
+                through.db_table,
+                field.m2m_column_name(),
+                through.pk.column,
+                False,
+            )
+
+
+def soft_referencing(model: type[models.Model]) -> Iterator[tuple[str, str, bool]]:
+    """(table, column, has is_removed) of soft references to "model" rows."""
+
+    for referencing in apps.get_models():
+        queryset_class = referencing._default_manager._queryset_class
+        for name, label in getattr(queryset_class, "soft_references", {}).items():
+            if label == model._meta.label:
+                meta = referencing._meta
+                yield (
+                    meta.db_table,
+                    meta.get_field(name).column,
+                    _has_is_removed(meta),
+                )
+
+
+def archive_sql(model: type[models.Model], using: str = DEFAULT_DB_ALIAS) -> str:
+    """One batch, params are (cutoff, batch size), returns a row per archived "model" row."""
+
+    qn = connections[using].ops.quote_name
+    meta = model._meta
+    table, pk = qn(meta.db_table), qn(meta.pk.column)
+    insert = (
+        f"INSERT INTO {qn(ArchivedRecord._meta.db_table)} "
+        "(model, object_id, data, removed_at, archived_at) "
+    )
+
+    conditions = ["is_removed", "updated_at < %s"]
+    for referencing, column, has_is_removed in soft_referencing(model):
+        conditions.append(
+            f"NOT EXISTS (SELECT 1 FROM {qn(referencing)} AS referencing "
+            f"WHERE referencing.{qn(column)} = {table}.{pk}"
+            f"{' AND NOT referencing.is_removed' if has_is_removed else ''})"
+        )
+
+    dependents = list(dependent_tables(model))
+    for _, dependent, column, _, has_is_removed in dependents:
+        if has_is_removed:
+            conditions.append(
+                f"NOT EXISTS (SELECT 1 FROM {qn(dependent)} AS dependent "
+                f"WHERE dependent.{qn(column)} = {table}.{pk} "
+                "AND NOT dependent.is_removed)"
+            )
+
+    ctes = [
+        f"batch AS (SELECT {pk} FROM {table} WHERE {' AND '.join(conditions)} "
+        "ORDER BY updated_at LIMIT %s FOR UPDATE SKIP LOCKED)"
+    ]
+    for i, (label, dependent, column, dependent_pk, _) in enumerate(dependents):
+        ctes.append(
+            f"dependent_{i} AS (DELETE FROM {qn(dependent)} "
+            f"WHERE {qn(column)} IN (SELECT {pk} FROM batch) RETURNING *)"
+        )
+        ctes.append(
+            f"archived_{i} AS ({insert}SELECT '{label}', {qn(dependent_pk)}::text, "
+            f"to_jsonb(dependent_{i}), NULL, now() FROM dependent_{i})"
+        )
+    ctes.append(
+        f"moved AS (DELETE FROM {table} "
+        f"WHERE {pk} IN (SELECT {pk} FROM batch) RETURNING *)"
+    )
+    return (
+        f"WITH {', '.join(ctes)} "
+        f"{insert}SELECT '{meta.label}', {pk}::text, to_jsonb(moved), updated_at, now() "
+        "FROM moved"
+    )
+
+
+def archive_removed(
+    model: type[models.Model],
+    cutoff: datetime,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    pause: float = 0,
+    using: str = DEFAULT_DB_ALIAS,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Archive removed "model" rows last updated before "cutoff", sleeping "pause"
+    seconds between batches, returns number of "model" rows archived.
+    """
+
+    sql = archive_sql(model, using=using)
+    archived = 0
+    while True:
+        with transaction.atomic(using=using), connections[using].cursor() as cursor:
+            cursor.execute(sql, (cutoff, batch_size))
+            moved = cursor.rowcount
+        archived += moved
+        if progress:
+            progress(moved)
+        if moved < batch_size:
+            return archived
+        if pause:
+            time.sleep(pause)
+
+
+def archived_models() -> list[type[models.Model]]:
+    return [apps.get_model(label) for label in ARCHIVED_MODELS]
@@ -0,0 +1,147 @@
+import asyncio
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from urllib.parse import urlsplit
+
+from django.db import connections
+
+from pd_django_small.core.benchmarks.timing import percentile
+
+HOST = "localhost"
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    requests: int
+    errors: int
+    seconds: float
+    p50: float
+    p95: float
+    p99: float
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "rps": self.rps}
+
+
+def _result(samples: list[float], errors: int, seconds: float) -> LoadResult:
+    return LoadResult(
+        requests=len(samples),
+        errors=errors,
+        seconds=seconds,
+        p50=percentile(samples, 50),
+        p95=percentile(samples, 95),
+        p99=percentile(samples, 99),
+    )
+
+
+def wsgi_get(application, url: str) -> int:
+    """GET "url" through a WSGI application, returns the status code."""
+
+    parts = urlsplit(url)
+    status = []
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": parts.path,
+        "QUERY_STRING": parts.query,
+        "SERVER_NAME": HOST,
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": HOST,
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "http",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    response = application(environ, lambda s, headers, exc_info=None: status.append(s))
+    try:
+        for _ in response:
+            pass
+    finally:
+        if hasattr(response, "close"):
+            response.close()
+    return int(status[0].split()[0])
+
+
+async def asgi_get(application, url: str) -> int:
+    """GET "url" through an ASGI application, returns the status code."""
+
+    parts = urlsplit(url)
+    status = []
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "headers": [(b"host", HOST.encode())],
+        "server": (HOST, 80),
+        "client": ("127.0.0.1", 0),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await application(scope, receive, send)
+    return status[0]
+
+
+def run_wsgi(application, urls: list[str], concurrency: int) -> LoadResult:
+    def request(url):
+        started = time.perf_counter()
+        status = wsgi_get(application, url)
+        return (time.perf_counter() - started) * 1000, status
+
+    def worker(chunk):
+        try:
+            return [request(url) for url in chunk]
+        finally:
+            connections.close_all()
+
+    chunks = [urls[i::concurrency] for i in range(concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = [item for chunk in executor.map(worker, chunks) for item in chunk]
+    seconds = time.perf_counter() - started
+    return _result(
+        [ms for ms, _ in results],
+        sum(1 for _, status in results if status >= 400),
+        seconds,
+    )
+
+
+def run_asgi(application, urls: list[str], concurrency: int) -> LoadResult:
+    async def request(semaphore, url):
+        async with semaphore:
+            started = time.perf_counter()
+            status = await asgi_get(application, url)
+            return (time.perf_counter() - started) * 1000, status
+
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(request(semaphore, url) for url in urls))
+
+    started = time.perf_counter()
+    results = asyncio.run(main())
+    seconds = time.perf_counter() - started
+    return _result(
+        [ms for ms, _ in results],
+        sum(1 for _, status in results if status >= 400),
+        seconds,
+    )
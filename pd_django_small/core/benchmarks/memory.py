@@ -0,0 +1,137 @@
+"""
+Memory used to read a model's rows through the usual queryset paths.
+
+Every path consumes the whole queryset and only counts the rows, so the memory
+measured is what the path itself holds: peak RSS sampled by memory_profiler
+(above the RSS before the run) and the peak of Python allocations traced by
+tracemalloc.
+"""
+
+import gc
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.db import models
+from memory_profiler import memory_usage
+
+PROFILED_MODELS = (
+    "users.User",
+    "organizations.Organization",
+    "subscriptions.Subscription",
+    "workspaces.Workspace",
+    "workspaces.Membership",
+)
+MEMORY_CHUNK_SIZE = 2000
+MIB = 1 << 20
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    rows: int
+    rss_mib: float
+    traced_mib: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def traced_peak(fn: Callable[[], int]) -> tuple[int, float]:
+    """Result of "fn" and the peak of memory allocated while it ran, in MiB."""
+
+    gc.collect()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = fn()
+        return result, (tracemalloc.get_traced_memory()[1] - baseline) / MIB
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def measure_memory(fn: Callable[[], int]) -> MemoryUsage:
+    """ "fn" runs twice, under the RSS sampler and under tracemalloc, which slows it down."""
+
+    gc.collect()
+    baseline = memory_usage(-1, interval=0.01, timeout=0.05, max_usage=True)
+    peak, rows = memory_usage((fn, (), {}), interval=0.01, max_usage=True, retval=True)
+    _, traced = traced_peak(fn)
+    return MemoryUsage(rows=rows, rss_mib=max(peak - baseline, 0.0), traced_mib=traced)
+
+
+def materialization_paths(
+    queryset: models.QuerySet, chunk_size: int = MEMORY_CHUNK_SIZE
+) -> dict[str, Callable[[], int]]:
+    """Functions reading "queryset" to the end and returning the number of rows."""
+
+    pk = queryset.model._meta.pk.name
+    fields = [f.attname for f in queryset.model._meta.concrete_fields]
+
+    # .all() clones, the result cache of "queryset" is never filled.
+    def as_list():
+        return len(list(queryset.all()))
+
+    def iterator():
+        return sum(1 for _ in queryset.iterator(chunk_size=chunk_size))
+
+    def values_list():
+        """Whole result as a list of tuples instead of instances."""
+
+        return len(list(queryset.values_list(*fields)))
+
+    def chunked():
+        """Keyset pages of "chunk_size" instances, no server-side cursor needed."""
+
+        rows, last = 0, None
+        ordered = queryset.order_by(pk)
+        while True:
+            page = ordered if last is None else ordered.filter(**{f"{pk}__gt": last})
+            chunk = list(page[:chunk_size])
+            rows += len(chunk)
+            if len(chunk) < chunk_size:
+                return rows
+            last = getattr(chunk[-1], pk)
+
+    return {
+        "list": as_list,
+        "iterator": iterator,
+        "values_list": values_list,
+        "chunked": chunked,
+    }
+
+
+def profile_models(
+    labels=PROFILED_MODELS,
+    chunk_size: int = MEMORY_CHUNK_SIZE,
+    limit: Optional[int] = None,
+) -> dict[str, dict[str, MemoryUsage]]:
+    report = {}
+    for label in labels:
+        queryset = apps.get_model(label)._default_manager.all()
+        if limit is not None:
+            queryset = queryset.filter(
+                pk__in=queryset.order_by("pk").values("pk")[:limit]
+            )
+        report[label] = {
+            name: measure_memory(fn)
+            for name, fn in materialization_paths(queryset, chunk_size).items()
+        }
+    return report
+
+
+def format_memory_report(report: dict[str, dict[str, MemoryUsage]]) -> list[str]:
+    lines = [
+        f"{'model':<28}{'path':<14}{'rows':>10}{'peak RSS MiB':>15}{'traced MiB':>13}"
+    ]
+    for label, paths in report.items():
+        for name, usage in paths.items():
+            lines.append(
+                f"{label:<28}{name:<14}{usage.rows:>10}"
+                f"{usage.rss_mib:>15.1f}{usage.traced_mib:>13.1f}"
+            )
+    return lines
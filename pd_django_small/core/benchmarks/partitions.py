@@ -0,0 +1,167 @@
+"""
+Per-organization and per-workspace queries against the plain and the hash
+partitioned workspace / membership tables, both exist between the prepare and
+the swap step of partition_tables (and after it, until the backup is dropped).
+The partitioned table is read in place of the plain one by rewriting the SQL.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from django.db import DEFAULT_DB_ALIAS, connections, models
+
+from pd_django_small.core.partitioning import (
+    PartitioningError,
+    backup_table,
+    partitioned_models,
+    shadow_table,
+    table_kind,
+)
+from pd_django_small.workspaces.models import Membership, Workspace
+
+PRUNING_PAGE_SIZE = 50
+
+
+@dataclass(frozen=True)
+class PruningResult:
+    partitions: int
+    scanned: int
+    unpartitioned_ms: float
+    partitioned_ms: float
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def pruning_queries() -> dict[str, Callable[[object, object], models.QuerySet]]:
+    """Querysets of a (workspace, organization) sample."""
+
+    return {
+        "organization_workspaces": lambda workspace, organization: (
+            Workspace.objects.filter(organization=organization).order_by(
+                "created_at", "uuid"
+            )[:PRUNING_PAGE_SIZE]
+        ),
+        "organization_owners": lambda workspace, organization: (
+            Workspace.objects.all_with_removed()
+            .filter(organization=organization)
+            .values_list("owner", flat=True)
+            .distinct()
+        ),
+        "workspace_memberships": lambda workspace, organization: (
+            Membership.objects.filter(workspace=workspace)
+        ),
+        "organization_memberships": lambda workspace, organization: (
+            Membership.objects.filter(workspace__organization=organization)
+        ),
+    }
+
+
+def table_variants(using: str = DEFAULT_DB_ALIAS) -> dict[str, tuple[str, str]]:
+    """Table name to its (plain, partitioned) variants."""
+
+    variants = {}
+    for model, _ in partitioned_models():
+        table = model._meta.db_table
+        if table_kind(table, using) == "p":
+            variants[table] = (backup_table(model), table)
+        else:
+            variants[table] = (table, shadow_table(model))
+        if any(table_kind(name, using) is None for name in variants[table]):
+            raise PartitioningError(
+                f"{table} has no partitioned copy, run partition_tables prepare copy"
+            )
+    return variants
+
+
+def rewrite(sql: str, tables: dict[str, str], using: str = DEFAULT_DB_ALIAS) -> str:
+    qn = connections[using].ops.quote_name
+    for table, variant in tables.items():
+        if variant != table:
+            sql = sql.replace(qn(table), qn(variant))
+    return sql
+
+
+def scanned_partitions(plan: dict) -> set[str]:
+    relations = set()
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        relations |= scanned_partitions(child)
+    return relations
+
+
+def compare_pruning(
+    samples: int = 100, repeat: int = 3, using: str = DEFAULT_DB_ALIAS
+) -> dict[str, PruningResult]:
+    """
+    Best of "repeat" runs over "samples" workspaces, in ms per query, and the
+    number of partitions in the plan of the first sample against all partitions
+    of the tables the query reads.
+    """
+
+    qn = connections[using].ops.quote_name
+    variants = table_variants(using)
+    plain = {table: names[0] for table, names in variants.items()}
+    partitioned = {table: names[1] for table, names in variants.items()}
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"SELECT uuid, organization FROM {qn(plain[Workspace._meta.db_table])} "
+            "LIMIT %s",
+            [samples],
+        )
+        keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT parent.relname, array_agg(c.relname) FROM pg_inherits AS i "
+            "JOIN pg_class AS c ON c.oid = i.inhrelid "
+            "JOIN pg_class AS parent ON parent.oid = i.inhparent "
+            "WHERE parent.relname = ANY(%s) GROUP BY parent.relname",
+            [list(partitioned.values())],
+        )
+        partitions = dict(cursor.fetchall())
+
+    report = {}
+    for name, build in pruning_queries().items():
+        statements = [build(*key).query.sql_with_params() for key in keys]
+        timings = {
+            label: _best_ms(
+                [(rewrite(sql, tables, using), params) for sql, params in statements],
+                repeat,
+                using,
+            )
+            for label, tables in (("plain", plain), ("partitioned", partitioned))
+        }
+
+        sql, params = statements[0]
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                f"EXPLAIN (FORMAT JSON) {rewrite(sql, partitioned, using)}", params
+            )
+            plan = cursor.fetchone()[0][0]["Plan"]
+        read = {
+            partition
+            for table, variant in partitioned.items()
+            if qn(table) in sql
+            for partition in partitions[variant]
+        }
+        report[name] = PruningResult(
+            partitions=len(read),
+            scanned=len(scanned_partitions(plan) & read),
+            unpartitioned_ms=timings["plain"],
+            partitioned_ms=timings["partitioned"],
+        )
+    return report
+
+
+def _best_ms(statements: list, repeat: int, using: str) -> float:
+    best = None
+    with connections[using].cursor() as cursor:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for sql, params in statements:
+                cursor.execute(sql, params)
+                cursor.fetchall()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    return best * 1000 / len(statements)
@@ -0,0 +1,51 @@
+"""Full model instances against values_list() tuples and projection rows."""
+
+import time
+from dataclasses import asdict, dataclass
+
+from django.db import models
+
+from pd_django_small.core.benchmarks.memory import traced_peak
+
+
+@dataclass(frozen=True)
+class ProjectionTiming:
+    rows: int
+    seconds: float
+    traced_mib: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "rows_per_second": self.rows_per_second}
+
+
+def projection_paths(queryset: models.QuerySet, projection: type, rows: int) -> dict:
+    fields = projection._fields
+    return {
+        "instances": lambda: len(list(queryset.all()[:rows])),
+        "values_list": lambda: len(list(queryset.values_list(*fields)[:rows])),
+        "projection": lambda: len(list(queryset.project(projection)[:rows])),
+    }
+
+
+def compare_projections(
+    queryset: models.QuerySet, projection: type, rows: int, repeat: int = 3
+) -> dict[str, ProjectionTiming]:
+    """Best of "repeat" wall times, allocations are traced in a separate run."""
+
+    report = {}
+    for name, fn in projection_paths(queryset, projection, rows).items():
+        fn()
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = fn()
+            timings.append(time.perf_counter() - started)
+        _, traced = traced_peak(fn)
+        report[name] = ProjectionTiming(
+            rows=count, seconds=min(timings), traced_mib=traced
+        )
+    return report
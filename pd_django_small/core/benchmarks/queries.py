@@ -0,0 +1,264 @@
+import itertools
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, Lag, Lead, Least
+
+from pd_django_small.organizations.models import Organization
+from pd_django_small.subscriptions.models import (
+    DomainRevenue,
+    Subscription,
+    SubscriptionState,
+)
+from pd_django_small.users.models import AccountType, User
+from pd_django_small.workspaces.models import Workspace
+
+
+def access_paths(sample_size: int, using: str = DEFAULT_DB_ALIAS):
+    """Access paths of the organizations and workspaces queries, keyed by name."""
+
+    organizations = itertools.cycle(
+        Organization.objects.using(using)
+        .order_by("?")
+        .values_list("uuid", "owner")[:sample_size]
+    )
+
+    def organizations_by_owner():
+        _, owner = next(organizations)
+        return list(Organization.objects.using(using).filter(owner=owner))
+
+    def workspaces_count_per_organization():
+        organization, _ = next(organizations)
+        return Workspace.objects.using(using).filter(organization=organization).count()
+
+    def live_workspaces_per_organization():
+        organization, _ = next(organizations)
+        return list(
+            Workspace.objects.using(using)
+            .filter(organization=organization)
+            .order_by("created_at", "uuid")
+            .values_list("uuid", flat=True)
+        )
+
+    def workspaces_owned_by_organization_owner():
+        organization, _ = next(organizations)
+        return list(
+            Workspace.objects.using(using).filter(
+                organization=organization,
+                owner=Subquery(
+                    Organization.objects.filter(uuid=OuterRef("organization")).values(
+                        "owner"
+                    )
+                ),
+            )
+        )
+
+    def workspaces_by_owner():
+        _, owner = next(organizations)
+        return list(Workspace.objects.using(using).filter(owner=owner))
+
+    def active_subscriptions_in_price_range():
+        return (
+            Subscription.objects.using(using)
+            .filter(state=SubscriptionState.ACTIVE.value, price__range=(50, 100))
+            .count()
+        )
+
+    return {
+        "organizations_by_owner": organizations_by_owner,
+        "workspaces_count_per_organization": workspaces_count_per_organization,
+        "live_workspaces_per_organization": live_workspaces_per_organization,
+        "workspaces_owned_by_organization_owner": workspaces_owned_by_organization_owner,
+        "workspaces_by_owner": workspaces_by_owner,
+        "active_subscriptions_in_price_range": active_subscriptions_in_price_range,
+    }
+
+
+def canonical_queries(page_size: int = 100):
+    """
+    Query shapes of the tests/test_queries.py modules, keyed by test name.
+    Listings are evaluated one page at a time, writes are rolled back.
+    """
+
+    emails = itertools.cycle(
+        User.objects.order_by("?").values_list("email", flat=True)[:250]
+    )
+
+    def organization_workspaces():
+        # Removed workspaces are counted, same as WorkspaceSummary.workspaces_count.
+        return (
+            Workspace.objects.all_with_removed()
+            .filter(organization=OuterRef("uuid"))
+            .order_by()
+        )
+
+    def organizations_annotate():
+        return list(
+            Organization.objects.annotate(
+                workspaces_count=Coalesce(
+                    Subquery(
+                        organization_workspaces()
+                        .values("organization")
+                        .annotate(count=Count("*"))
+                        .values("count")
+                    ),
+                    0,
+                ),
+                workspaces=Subquery(
+                    organization_workspaces()
+                    .filter(is_removed=False)
+                    .values("organization")
+                    .annotate(uuids=ArrayAgg("uuid", ordering=("created_at", "uuid")))
+                    .values("uuids")
+                ),
+            ).order_by("uuid")[:page_size]
+        )
+
+    def organizations_annotate_summary():
+        return list(
+            Organization.objects.with_workspace_summary().order_by("uuid")[:page_size]
+        )
+
+    def organizations_subscription():
+        return list(
+            Organization.objects.annotate(
+                workspaces_count=Subquery(
+                    organization_workspaces()
+                    .values("organization")
+                    .annotate(count=Count("*"))
+                    .values("count")
+                )
+            ).filter(
+                workspaces_count__gt=2,
+                subscription__state=SubscriptionState.ACTIVE.value,
+                subscription__price__gt=50,
+                subscription__price__lt=100,
+            )[
+                :page_size
+            ]
+        )
+
+    def subscription_orders():
+        return list(
+            Subscription.objects.annotate(
+                state_order=Case(
+                    When(state=SubscriptionState.CANCELLED.value, then=Value(0)),
+                    When(state=SubscriptionState.EXPIRED.value, then=Value(1)),
+                    When(state=SubscriptionState.ACTIVE.value, then=Value(2)),
+                    output_field=IntegerField(),
+                )
+            ).order_by("state_order", "-price")[:page_size]
+        )
+
+    def subscription_orders_ranked():
+        return list(Subscription.objects.order_by_state()[:page_size])
+
+    def total_subscriptions_price_for_abc_com():
+        return Subscription.objects.filter(
+            state=SubscriptionState.ACTIVE.value,
+            organization__owner__in=User.objects.filter(
+                email__endswith="@abc.com"
+            ).values("uuid"),
+        ).aggregate(Sum("price"))
+
+    def domain_revenue_for_abc_com():
+        return DomainRevenue.objects.total_for("abc.com")
+
+    def subscriptions_discount():
+        return list(
+            Subscription.objects.filter(state=SubscriptionState.ACTIVE.value)
+            .annotate(
+                discount=Least(
+                    F("price") - F("quantity") * 10,
+                    50,
+                    output_field=DecimalField(max_digits=12, decimal_places=2),
+                )
+            )
+            .order_by("uuid")[:page_size]
+        )
+
+    def user_corrupted_information():
+        return list(
+            User.objects.filter(
+                Q(first_name__iexact=F("email")) | Q(last_name__iexact=F("email")),
+                account_type=AccountType.BUSINESS.value,
+            ).order_by("-created_at")[:page_size]
+        )
+
+    def users_bulk_create_or_update():
+        with transaction.atomic():
+            User.objects.bulk_upsert(
+                itertools.chain(
+                    itertools.islice(emails, 125),
+                    (f"benchmark{i}@example.com" for i in range(125)),
+                )
+            )
+            transaction.set_rollback(True)
+
+    def user_update_or_create():
+        with transaction.atomic():
+            User.objects.all_with_removed().update_or_create(
+                email=next(emails), defaults={"is_active": True, "is_removed": False}
+            )
+            transaction.set_rollback(True)
+
+    def user_upsert():
+        with transaction.atomic():
+            User.objects.upsert(
+                email=next(emails), defaults={"is_active": True, "is_removed": False}
+            )
+            transaction.set_rollback(True)
+
+    def workspaces_annotate():
+        return list(
+            Workspace.objects.filter(
+                owner=Subquery(
+                    Organization.objects.filter(uuid=OuterRef("organization")).values(
+                        "owner"
+                    )
+                )
+            )[:page_size]
+        )
+
+    def workspaces_next_prev_uuid():
+        return list(
+            Workspace.objects.annotate(
+                prev_workspace_uuid=Window(
+                    Lag("uuid"), order_by=("created_at", "uuid")
+                ),
+                next_workspace_uuid=Window(
+                    Lead("uuid"), order_by=("created_at", "uuid")
+                ),
+            ).order_by("created_at", "uuid")[:page_size]
+        )
+
+    return {
+        "organizations_annotate": organizations_annotate,
+        "organizations_annotate_summary": organizations_annotate_summary,
+        "organizations_subscription": organizations_subscription,
+        "subscription_orders": subscription_orders,
+        "subscription_orders_ranked": subscription_orders_ranked,
+        "total_subscriptions_price_for_abc_com": total_subscriptions_price_for_abc_com,
+        "domain_revenue_for_abc_com": domain_revenue_for_abc_com,
+        "subscriptions_discount": subscriptions_discount,
+        "user_corrupted_information": user_corrupted_information,
+        "users_bulk_create_or_update": users_bulk_create_or_update,
+        "user_update_or_create": user_update_or_create,
+        "user_upsert": user_upsert,
+        "workspaces_annotate": workspaces_annotate,
+        "workspaces_next_prev_uuid": workspaces_next_prev_uuid,
+    }
@@ -0,0 +1,78 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from pd_django_small.core.benchmarks.timing import measure
+
+REPORT_METRICS = ("p50", "p95", "p99")
+
+
+@dataclass(frozen=True)
+class Regression:
+    query: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self):
+        return f"{self.query}: {self.metric} {self.baseline:.2f} -> {self.current:.2f}"
+
+
+def run_suite(
+    queries: dict[str, Callable[[], object]],
+    repeat: int,
+    dataset: Optional[dict] = None,
+    using: str = "default",
+) -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+        "dataset": dataset or {},
+        "queries": {
+            name: measure(fn, repeat, using).as_dict() for name, fn in queries.items()
+        },
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[Regression]:
+    """
+    Queries slower than baseline by more than "threshold" (0.2 => 20%)
+    or running more SQL queries than baseline are regressions.
+    Queries missing from baseline are ignored.
+    """
+
+    regressions = []
+    for name, current in report["queries"].items():
+        previous = baseline["queries"].get(name)
+        if previous is None:
+            continue
+
+        for metric in REPORT_METRICS:
+            if current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(
+                    Regression(name, metric, previous[metric], current[metric])
+                )
+        if current["queries"] > previous["queries"]:
+            regressions.append(
+                Regression(name, "queries", previous["queries"], current["queries"])
+            )
+    return regressions
+
+
+def write_report(report: dict, path: Path) -> None:
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def read_report(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def format_report(report: dict) -> Iterable[str]:
+    yield f"{'query':<42}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}"
+    for name, timing in report["queries"].items():
+        yield (
+            f"{name:<42}{timing['p50']:>10.2f}{timing['p95']:>10.2f}"
+            f"{timing['p99']:>10.2f}{timing['queries']:>9}"
+        )
@@ -0,0 +1,136 @@
+"""
+Cold start cost of the WSGI / ASGI entry points: every entry point is imported
+in a fresh interpreter with "python -X importtime", which reports the time
+spent importing each module, and the interpreter reports its own wall time and
+peak RSS once the application is built.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+
+ENTRYPOINTS = {
+    "wsgi": "pd_django_small.wsgi",
+    "asgi": "pd_django_small.asgi",
+}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+# ru_maxrss survives exec() on Linux, it would report the forking process' peak,
+# VmHWM belongs to the new address space.
+STARTUP_SCRIPT = """
+import importlib, json, resource, sys, time
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - started
+try:
+    with open("/proc/self/status") as status:
+        max_rss_kib = next(
+            int(line.split()[1]) for line in status if line.startswith("VmHWM:")
+        )
+except OSError:
+    max_rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": seconds, "max_rss_kib": max_rss_kib}))
+"""
+
+
+@dataclass(frozen=True)
+class ModuleImport:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass(frozen=True)
+class StartupProfile:
+    entrypoint: str
+    settings_module: str
+    seconds: float
+    max_rss_mib: float
+    modules: list[ModuleImport] = field(repr=False)
+
+    def slowest(self, count: int = 20) -> list[ModuleImport]:
+        return sorted(self.modules, key=lambda m: m.self_ms, reverse=True)[:count]
+
+    def by_package(self) -> dict[str, float]:
+        """Self time in ms per top-level package, slowest first."""
+
+        totals = {}
+        for module in self.modules:
+            package = module.module.split(".", 1)[0]
+            totals[package] = totals.get(package, 0.0) + module.self_ms
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def as_dict(self, top: int = 20) -> dict:
+        return {
+            "entrypoint": self.entrypoint,
+            "settings_module": self.settings_module,
+            "seconds": self.seconds,
+            "max_rss_mib": self.max_rss_mib,
+            "modules": len(self.modules),
+            "slowest": [asdict(module) for module in self.slowest(top)],
+            "packages": self.by_package(),
+        }
+
+
+def startup_budget() -> dict:
+    return settings.STARTUP_BUDGET
+
+
+def parse_importtime(output: str) -> list[ModuleImport]:
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append(
+                ModuleImport(
+                    module=module,
+                    self_ms=int(self_us) / 1000,
+                    cumulative_ms=int(cumulative_us) / 1000,
+                    depth=len(indent) // 2,
+                )
+            )
+    return modules
+
+
+def profile_startup(
+    entrypoint: str = "wsgi", settings_module: str = "pd_django_small.settings_api"
+) -> StartupProfile:
+    """Import "entrypoint" (wsgi or asgi) with "settings_module" in a new interpreter."""
+
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            STARTUP_SCRIPT,
+            ENTRYPOINTS[entrypoint],
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=Path(settings.BASE_DIR),
+        check=False,
+    )
+    if completed.returncode:
+        raise RuntimeError(
+            f"{ENTRYPOINTS[entrypoint]} failed to start:\n{completed.stderr[-2000:]}"
+        )
+    measured = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupProfile(
+        entrypoint=entrypoint,
+        settings_module=settings_module,
+        seconds=measured["seconds"],
+        max_rss_mib=measured["max_rss_kib"] / 1024,
+        modules=parse_importtime(completed.stderr),
+    )
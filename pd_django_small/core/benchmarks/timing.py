@@ -0,0 +1,43 @@
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass(frozen=True)
+class Timing:
+    p50: float
+    p95: float
+    p99: float
+    queries: int
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def measure(fn: Callable[[], object], repeat: int, using: str = "default") -> Timing:
+    """Run "fn" once to warm up, then "repeat" times, timings are in milliseconds."""
+
+    fn()
+    samples = []
+    with CaptureQueriesContext(connections[using]) as context:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - started) * 1000)
+
+    return Timing(
+        p50=percentile(samples, 50),
+        p95=percentile(samples, 95),
+        p99=percentile(samples, 99),
+        queries=len(context.captured_queries) // repeat,
+    )
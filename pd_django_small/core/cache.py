@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable, Iterable
+
+from django.core.cache import caches
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    local_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.shared_hits
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "hits": self.hits}
+
+
+class TwoTierCache:
+    """
+    Read-through cache: bounded in-process LRU in front of a Django cache.
+
+    None is a regular value, so "not found" results are cached too (negative caching).
+    Local entries live at most "local_ttl" seconds, which bounds staleness
+    in other processes after invalidate().
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        max_entries: int = 1024,
+        local_ttl: float = 5,
+        timeout: float = 300,
+        cache_alias: str = "default",
+    ):
+        self.prefix = prefix
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.stats = CacheStats()
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.cache_alias]
+
+    def key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get_or_load(self, key: Hashable, load: Callable[[Hashable], Any]) -> Any:
+        return self.get_many_or_load([key], lambda keys: {key: load(key)})[key]
+
+    def get_many_or_load(
+        self,
+        keys: Iterable[Hashable],
+        load_many: Callable[[list], dict],
+    ) -> dict:
+        """
+        "load_many" gets keys missing in both tiers and returns {key: value},
+        keys it leaves out are cached as None.
+        """
+
+        result, missing = {}, []
+        for key in dict.fromkeys(keys):
+            value = self._get_local(key)
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                result[key] = value
+
+        if missing:
+            shared = self.shared.get_many([self.key(key) for key in missing])
+            loaded = []
+            for key in missing:
+                value = shared.get(self.key(key), _MISSING)
+                if value is _MISSING:
+                    loaded.append(key)
+                else:
+                    self.stats.shared_hits += 1
+                    self._set_local(key, value)
+                    result[key] = value
+
+            if loaded:
+                self.stats.misses += len(loaded)
+                values = load_many(loaded)
+                values = {key: values.get(key) for key in loaded}
+                self.shared.set_many(
+                    {self.key(key): value for key, value in values.items()},
+                    timeout=self.timeout,
+                )
+                for key, value in values.items():
+                    self._set_local(key, value)
+                result.update(values)
+
+        return result
+
+    def invalidate(self, key: Hashable) -> None:
+        self.invalidate_many([key])
+
+    def invalidate_many(self, keys: Iterable[Hashable]) -> None:
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+        self.shared.delete_many([self.key(key) for key in keys])
+
+    def reset_stats(self) -> None:
+        self.stats = CacheStats()
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return _MISSING
+            self._local.move_to_end(key)
+            self.stats.local_hits += 1
+            return value
+
+    def _set_local(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._local[key] = (value, time.monotonic() + self.local_ttl)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+                self.stats.evictions += 1
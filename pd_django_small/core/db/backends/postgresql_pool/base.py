@@ -0,0 +1,176 @@
+"""
+PostgreSQL backend which takes connections from a per-process psycopg_pool.ConnectionPool
+instead of opening a new one, closing a Django connection returns it to the pool.
+
+    DATABASES = {
+        "default": {
+            "ENGINE": "pd_django_small.core.db.backends.postgresql_pool",
+            ...
+            "OPTIONS": {
+                "pool": {"min_size": 2, "max_size": 20, "max_idle": 600, "check": True},
+            },
+        },
+    }
+"""
+
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgresDatabaseWrapper,
+)
+from django.db.backends.postgresql.psycopg_any import IsolationLevel, is_psycopg3
+from django.utils.asyncio import async_unsafe
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as e:
+    raise ImproperlyConfigured("Error loading psycopg_pool module: %s" % e)
+
+from .creation import DatabaseCreation
+
+POOL_DEFAULTS = {
+    "min_size": 1,
+    "max_size": 10,
+    "max_idle": 10 * 60,
+    "max_lifetime": 60 * 60,
+    "timeout": 30,
+    "check": False,
+}
+
+
+def reset_connection(connection) -> None:
+    """
+    Drop the session state (SET, SET ROLE, temporary tables, prepared statements,
+    advisory locks, LISTEN) of a connection put back to the pool.
+    """
+
+    connection.autocommit = True
+    connection.execute("DISCARD ALL")
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    # One pool per process and (alias, database), shared by all threads. Django
+    # keeps a connection per thread (WSGI) or per sync_to_async thread (ASGI), each
+    # of them checks a connection out of the pool and puts it back on close().
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        if not is_psycopg3:
+            raise ImproperlyConfigured("postgresql_pool backend requires psycopg 3.")
+        super().__init__(*args, **kwargs)
+
+    @property
+    def pool_options(self) -> dict:
+        options = {**POOL_DEFAULTS, **self.settings_dict["OPTIONS"].get("pool", {})}
+        unknown = set(options) - set(POOL_DEFAULTS)
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Unknown pool options: {', '.join(sorted(unknown))}."
+            )
+        return options
+
+    @property
+    def pool_enabled(self) -> bool:
+        # Throwaway connections to the "postgres" database (test database
+        # creation, _nodb_cursor()) are not worth pooling.
+        return self.alias != NO_DB_ALIAS
+
+    @property
+    def pool(self) -> ConnectionPool:
+        key = self._pool_key()
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+
+        with self._pools_lock:
+            if key not in self._pools:
+                options = self.pool_options
+                check = options.pop("check")
+                self._pools[key] = ConnectionPool(
+                    kwargs=self.get_connection_params(),
+                    check=ConnectionPool.check_connection if check else None,
+                    reset=reset_connection,
+                    name=self.alias,
+                    open=True,
+                    **options,
+                )
+            return self._pools[key]
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop("pool", None)
+        return conn_params
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        if not self.pool_enabled:
+            return super().get_new_connection(conn_params)
+
+        # Same isolation level handling as the parent, the connection itself
+        # comes out of the pool.
+        options = self.settings_dict["OPTIONS"]
+        self.isolation_level = IsolationLevel.READ_COMMITTED
+        if "isolation_level" in options:
+            try:
+                self.isolation_level = IsolationLevel(options["isolation_level"])
+            except ValueError:
+                raise ImproperlyConfigured(
+                    f"Invalid transaction isolation level "
+                    f"{options['isolation_level']} specified. Use one of the "
+                    f"psycopg.IsolationLevel values."
+                )
+        connection = self.pool.getconn()
+        connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is None or not self.pool_enabled:
+            return super()._close()
+        with self.wrap_database_errors:
+            # The pool rolls back an open transaction, resets the session and
+            # discards broken connections.
+            self.pool.putconn(self.connection)
+
+    def pool_stats(self) -> dict:
+        """
+        Checkouts, time spent waiting for a connection and connections in use
+        of this process' pool, counters are cumulative since the pool was opened.
+        """
+
+        stats = self.pool.get_stats()
+        return {
+            "size": stats["pool_size"],
+            "available": stats["pool_available"],
+            "in_use": stats["pool_size"] - stats["pool_available"],
+            "waiting": stats["requests_waiting"],
+            "checkouts": stats.get("requests_num", 0),
+            "queued": stats.get("requests_queued", 0),
+            "wait_ms": stats.get("requests_wait_ms", 0),
+            "errors": stats.get("requests_errors", 0),
+            "connections": stats.get("connections_num", 0),
+            "connections_lost": stats.get("connections_lost", 0),
+        }
+
+    def close_pool(self):
+        """Close pools of this alias, whatever database they were opened for."""
+
+        with self._pools_lock:
+            keys = [key for key in self._pools if key[0] == self.alias]
+            pools = [self._pools.pop(key) for key in keys]
+        for pool in pools:
+            pool.close()
+
+    def _pool_key(self) -> tuple:
+        settings_dict = self.settings_dict
+        return (
+            self.alias,
+            settings_dict["NAME"],
+            settings_dict["HOST"],
+            settings_dict["PORT"],
+            settings_dict["USER"],
+        )
@@ -0,0 +1,11 @@
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresDatabaseCreation,
+)
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Pooled connections to the test database would block DROP DATABASE.
+        self.connection.close()
+        self.connection.close_pool()
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,189 @@
+"""
+Read replica routing with read-your-writes stickiness.
+
+    DATABASE_ROUTERS = ["pd_django_small.core.db.routers.ReplicaRouter"]
+    REPLICA_ROUTING = {"REPLICAS": ["replica1"], "PIN_SECONDS": 5, ...}
+
+Reads go to a random healthy replica, writes and everything else to the primary
+("default"). Reads stay on the primary:
+
+- inside a transaction on the primary,
+- within a routing_scope() opened with pinned=True (pin_to_primary()),
+- for PIN_SECONDS after a write in the same scope (ReplicaPinningMiddleware
+  carries the window over to the next requests of the client with a cookie),
+- when every replica lags more than MAX_LAG_SECONDS or is unreachable, the lag
+  of each replica is measured at most once per LAG_CHECK_INTERVAL per process.
+"""
+
+import logging
+import math
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+REPLICA_ROUTING_DEFAULTS = {
+    "REPLICAS": [],
+    "PIN_SECONDS": 5.0,
+    "MAX_LAG_SECONDS": 2.0,
+    "LAG_CHECK_INTERVAL": 1.0,
+    "PIN_COOKIE": "primary_pin",
+}
+
+# Zero on a primary and on a standby which replayed everything it received from
+# a streaming primary, otherwise the age of the last replayed transaction.
+REPLICATION_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+            AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming')
+            THEN 0
+        ELSE coalesce(
+            extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 'Infinity'
+        )
+    END::float
+"""
+
+
+def routing_config() -> dict:
+    return {**REPLICA_ROUTING_DEFAULTS, **getattr(settings, "REPLICA_ROUTING", {})}
+
+
+@dataclass
+class RoutingState:
+    pinned: bool = False
+    # time.monotonic() of the last write routed to the primary.
+    last_write: Optional[float] = None
+
+    @property
+    def wrote(self) -> bool:
+        return self.last_write is not None
+
+
+_current_state: ContextVar[Optional[RoutingState]] = ContextVar(
+    "replica_routing_state", default=None
+)
+
+
+def current_routing_state() -> Optional[RoutingState]:
+    return _current_state.get()
+
+
+@contextmanager
+def routing_scope(pinned: bool = False):
+    """Track writes within the block, ReplicaPinningMiddleware opens one per request."""
+
+    state = RoutingState(pinned=pinned)
+    token = _current_state.set(state)
+    try:
+        yield state
+    finally:
+        _current_state.reset(token)
+
+
+@contextmanager
+def pin_to_primary():
+    """Route reads of the block to the primary, writes still count for the scope."""
+
+    state = _current_state.get()
+    if state is None:
+        with routing_scope(pinned=True) as state:
+            yield state
+        return
+
+    pinned, state.pinned = state.pinned, True
+    try:
+        yield state
+    finally:
+        state.pinned = pinned
+
+
+def replication_lag(connection) -> float:
+    """Seconds "connection" is behind its primary, 0 for a primary."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(REPLICATION_LAG_SQL)
+        return cursor.fetchone()[0]
+
+
+class ReplicaLagMonitor:
+    """Last measured lag per replica alias, unreachable replicas lag infinitely."""
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._lags: dict[str, tuple[float, float]] = {}
+
+    def lag(self, alias: str) -> float:
+        now = time.monotonic()
+        checked = self._lags.get(alias)
+        if checked is None or now - checked[0] >= self.interval:
+            checked = (now, self.measure(alias))
+            self._lags[alias] = checked
+        return checked[1]
+
+    def measure(self, alias: str) -> float:
+        try:
+            return replication_lag(connections[alias])
+        except DatabaseError:
+            logger.warning("Replica %s is unreachable", alias, exc_info=True)
+            # A broken connection goes back to the pool, which discards it.
+            connections[alias].close()
+            return math.inf
+
+    def reset(self):
+        self._lags.clear()
+
+
+class ReplicaRouter:
+    def __init__(self, config: Optional[dict] = None):
+        self.config = {**routing_config(), **(config or {})}
+        self.replicas = list(self.config["REPLICAS"])
+        self.monitor = ReplicaLagMonitor(self.config["LAG_CHECK_INTERVAL"])
+
+    def db_for_read(self, model, **hints) -> str:
+        if not self.replicas or self.pinned():
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        healthy = self.healthy_replicas()
+        return random.choice(healthy) if healthy else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        state = _current_state.get()
+        if state is None:
+            # Outside of a scope (shell, management commands) the write window
+            # is kept for the rest of the context.
+            state = RoutingState()
+            _current_state.set(state)
+        state.last_write = time.monotonic()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        return False if db in self.replicas else None
+
+    def pinned(self) -> bool:
+        state = _current_state.get()
+        if state is None:
+            return False
+        if state.pinned:
+            return True
+        return (
+            state.wrote
+            and time.monotonic() - state.last_write < self.config["PIN_SECONDS"]
+        )
+
+    def healthy_replicas(self) -> list[str]:
+        max_lag = self.config["MAX_LAG_SECONDS"]
+        return [alias for alias in self.replicas if self.monitor.lag(alias) <= max_lag]
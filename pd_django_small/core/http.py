@@ -0,0 +1,30 @@
+import uuid
+from typing import Optional
+
+from django.core.exceptions import BadRequest
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+TRUE_VALUES = ("1", "true", "yes")
+
+
+def page_size(request) -> int:
+    try:
+        size = int(request.GET.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise BadRequest("limit must be an integer")
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def uuid_param(request, name: str) -> Optional[uuid.UUID]:
+    value = request.GET.get(name)
+    if value is None:
+        return None
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be a uuid")
+
+
+def flag_param(request, name: str) -> bool:
+    return request.GET.get(name, "").lower() in TRUE_VALUES
@@ -0,0 +1,69 @@
+import re
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Optional
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES \(\?(?:, \?)*\)(?:,\s*\(\?(?:, \?)*\))*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """
+    SQL with literals and placeholders replaced by "?", IN (...) and multi-row VALUES
+    collapsed, queries differing only in parameters share the fingerprint.
+    """
+
+    sql = _STRING.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _NUMBER.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _VALUES_LIST.sub("VALUES (...)", sql)
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper() which counts queries and their time per fingerprint.
+
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            ...
+        recorder.count, recorder.duration, recorder.repeated(threshold=5)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.durations = defaultdict(float)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            key = fingerprint(sql)
+            self.count += 1
+            self.duration += elapsed
+            self.fingerprints[key] += 1
+            self.durations[key] += elapsed
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Fingerprints executed at least "threshold" times, probable N+1 queries."""
+
+        return {
+            key: count
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+    def slowest(self) -> Optional[str]:
+        if not self.durations:
+            return None
+        return max(self.durations, key=self.durations.get)
@@ -0,0 +1,181 @@
+"""
+Resumable, parallel scan of a model for rows breaking an integrity rule.
+
+A check is an IntegrityCheck subclass registered with @register in an app's
+"integrity" module. A run splits the uuid primary key space into ranges, each
+range is read in keyset order in batches, every batch commits its findings,
+optional fix and checkpoint together, so an interrupted run resumes where it stopped.
+"""
+
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from pd_django_small.core import integrity_worker
+from pd_django_small.core.models import IntegrityFinding, ScanCheckpoint, ScanRun
+
+SCAN_BATCH_SIZE = 5000
+UUID_SPACE = 1 << 128
+
+
+class IntegrityCheck:
+    name: str = ""
+    model: type[models.Model]
+    # Fields stored in IntegrityFinding.detail.
+    detail_fields: tuple[str, ...] = ()
+
+    def violations(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Rows of "queryset" breaking the rule."""
+
+        raise NotImplementedError
+
+    def fix(self, queryset: models.QuerySet) -> int:
+        """Repair the violating rows of "queryset" with a single UPDATE, returns rows fixed."""
+
+        raise NotImplementedError(f"{self.name} can not fix rows")
+
+
+CHECKS: dict[str, IntegrityCheck] = {}
+
+
+def register(check_class: type[IntegrityCheck]) -> type[IntegrityCheck]:
+    CHECKS[check_class.name] = check_class()
+    return check_class
+
+
+def get_check(name: str) -> IntegrityCheck:
+    return CHECKS[name]
+
+
+def uuid_ranges(partitions: int) -> list[tuple[uuid.UUID, Optional[uuid.UUID]]]:
+    """Split the uuid space in "partitions" equal [start, end) ranges, the last one open."""
+
+    bounds = [uuid.UUID(int=i * UUID_SPACE // partitions) for i in range(partitions)]
+    return list(zip(bounds, [*bounds[1:], None]))
+
+
+def start_run(check: IntegrityCheck, partitions: int, fix: bool = False) -> ScanRun:
+    with transaction.atomic():
+        run = ScanRun.objects.create(check_name=check.name, fix=fix)
+        ScanCheckpoint.objects.bulk_create(
+            ScanCheckpoint(run=run, range_start=start, range_end=end)
+            for start, end in uuid_ranges(partitions)
+        )
+    return run
+
+
+def scan_checkpoint(
+    checkpoint_id: int, batch_size: int = SCAN_BATCH_SIZE
+) -> ScanCheckpoint:
+    """Scan the rest of one checkpoint's range batch by batch."""
+
+    checkpoint = ScanCheckpoint.objects.select_related("run").get(pk=checkpoint_id)
+    check = get_check(checkpoint.run.check_name)
+    pk = check.model._meta.pk.name
+
+    while not checkpoint.done:
+        remaining = check.model._base_manager.all()
+        if checkpoint.last_key is None:
+            remaining = remaining.filter(**{f"{pk}__gte": checkpoint.range_start})
+        else:
+            remaining = remaining.filter(**{f"{pk}__gt": checkpoint.last_key})
+        if checkpoint.range_end is not None:
+            remaining = remaining.filter(**{f"{pk}__lt": checkpoint.range_end})
+
+        keys = list(remaining.order_by(pk).values_list(pk, flat=True)[:batch_size])
+        with transaction.atomic():
+            if keys:
+                batch = check.violations(
+                    remaining.filter(**{f"{pk}__lte": keys[-1]})
+                ).order_by()
+                findings = list(batch.values(pk, *check.detail_fields))
+                fixed = check.fix(batch) if checkpoint.run.fix and findings else 0
+                IntegrityFinding.objects.bulk_create(
+                    (
+                        IntegrityFinding(
+                            run=checkpoint.run,
+                            check_name=check.name,
+                            object_id=finding.pop(pk),
+                            detail=finding,
+                            fixed=checkpoint.run.fix,
+                        )
+                        for finding in findings
+                    ),
+                    ignore_conflicts=True,
+                )
+                checkpoint.last_key = keys[-1]
+                checkpoint.scanned += len(keys)
+                checkpoint.found += len(findings)
+                checkpoint.fixed += fixed
+            checkpoint.done = len(keys) < batch_size
+            checkpoint.save()
+    return checkpoint
+
+
+def pending_checkpoints(run: ScanRun) -> list[int]:
+    return list(
+        run.checkpoints.filter(done=False).order_by("pk").values_list("pk", flat=True)
+    )
+
+
+def resume_run(
+    run: ScanRun,
+    workers: int = 1,
+    batch_size: int = SCAN_BATCH_SIZE,
+    progress: Optional[Callable[[ScanCheckpoint], None]] = None,
+) -> ScanRun:
+    """
+    Scan unfinished checkpoints of "run", in "workers" processes when more than one.
+    Worker processes use the same databases as this one.
+    """
+
+    checkpoint_ids = pending_checkpoints(run)
+    if workers > 1 and len(checkpoint_ids) > 1:
+        # Connections must not be shared with the children, spawn starts clean.
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=integrity_worker.init,
+            initargs=(
+                {
+                    alias: connections[alias].settings_dict["NAME"]
+                    for alias in connections
+                },
+            ),
+        ) as executor:
+            results = executor.map(
+                integrity_worker.scan,
+                checkpoint_ids,
+                [batch_size] * len(checkpoint_ids),
+            )
+            _report(results, progress)
+    else:
+        _report((scan_checkpoint(pk, batch_size) for pk in checkpoint_ids), progress)
+
+    if not run.checkpoints.filter(done=False).exists():
+        run.finished_at = timezone.now()
+        run.save(update_fields=["finished_at"])
+    return run
+
+
+def run_check(
+    check: IntegrityCheck,
+    workers: int = 1,
+    partitions: Optional[int] = None,
+    batch_size: int = SCAN_BATCH_SIZE,
+    fix: bool = False,
+    progress: Optional[Callable[[ScanCheckpoint], None]] = None,
+) -> ScanRun:
+    run = start_run(check, partitions or workers * 4, fix=fix)
+    return resume_run(run, workers=workers, batch_size=batch_size, progress=progress)
+
+
+def _report(checkpoints: Iterable[ScanCheckpoint], progress) -> None:
+    for checkpoint in checkpoints:
+        if progress:
+            progress(checkpoint)
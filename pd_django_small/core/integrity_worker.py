@@ -0,0 +1,23 @@
+"""
+Entry points of spawned integrity scan workers, importable before Django is set up.
+"""
+
+import django
+
+
+def init(database_names: dict[str, str]) -> None:
+    django.setup()
+
+    from django.conf import settings
+    from django.db import connections
+
+    # Test runs rename the databases in-process only.
+    for alias, name in database_names.items():
+        settings.DATABASES[alias]["NAME"] = name
+        connections[alias].settings_dict["NAME"] = name
+
+
+def scan(checkpoint_id: int, batch_size: int):
+    from pd_django_small.core.integrity import scan_checkpoint
+
+    return scan_checkpoint(checkpoint_id, batch_size)
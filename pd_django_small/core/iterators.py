@@ -0,0 +1,51 @@
+import logging
+import time
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Throughput:
+    """Pass items through, counting them, "rate" is items per second so far."""
+
+    def __init__(self, iterable: Iterable[T], name: str = "rows"):
+        self._iterable = iterable
+        self.name = name
+        self.count = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def __iter__(self) -> Iterator[T]:
+        self.started = time.perf_counter()
+        try:
+            for item in self._iterable:
+                self.count += 1
+                yield item
+        finally:
+            self.finished = time.perf_counter()
+            logger.info(
+                "%s: %d in %.2fs (%.0f/s)",
+                self.name,
+                self.count,
+                self.elapsed,
+                self.rate,
+            )
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.count / self.elapsed if self.elapsed else 0.0
@@ -0,0 +1,150 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Hashable, Iterable, Optional
+
+from django.apps import apps
+from django.db import models
+
+
+class BatchLoader:
+    """
+    Resolve model instances by key, keys asked for with defer() are loaded
+    together with the next load()/load_many() in one IN query, results (including
+    missing keys, as None) are memoized for the lifetime of the loader.
+    Removed rows are resolved too, same as a foreign key through _base_manager.
+    """
+
+    def __init__(self, model: type[models.Model], field: str = "pk"):
+        self.model = model
+        self.field = field
+        self.queries = 0
+        self._cache: dict[Hashable, Optional[models.Model]] = {}
+        self._pending: set[Hashable] = set()
+
+    def defer(self, keys: Iterable[Hashable]):
+        self._pending.update(key for key in keys if key not in self._cache)
+
+    def load(self, key: Hashable) -> Optional[models.Model]:
+        return self.load_many([key])[key]
+
+    def load_many(self, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        keys = list(keys)
+        self.defer(keys)
+        if self._pending:
+            self._dispatch()
+        return {key: self._cache[key] for key in keys}
+
+    def prime(self, instance: models.Model):
+        self._cache[getattr(instance, self.field)] = instance
+
+    def clear(self):
+        self._cache.clear()
+        self._pending.clear()
+
+    def _dispatch(self):
+        pending, self._pending = self._pending, set()
+        found = self.model._base_manager.in_bulk(pending, field_name=self.field)
+        self.queries += 1
+        for key in pending:
+            self._cache[key] = found.get(key)
+
+
+class Loaders:
+    """BatchLoader per model, one instance is shared by everything within a request."""
+
+    def __init__(self):
+        self._loaders: dict[type[models.Model], BatchLoader] = {}
+
+    def __getitem__(self, model) -> BatchLoader:
+        if isinstance(model, str):
+            model = apps.get_model(model)
+        if model not in self._loaders:
+            self._loaders[model] = BatchLoader(model)
+        return self._loaders[model]
+
+    @property
+    def queries(self) -> int:
+        return sum(loader.queries for loader in self._loaders.values())
+
+
+_current_loaders: ContextVar[Optional[Loaders]] = ContextVar(
+    "current_loaders", default=None
+)
+
+
+def current_loaders() -> Optional[Loaders]:
+    return _current_loaders.get()
+
+
+@contextmanager
+def loaders_scope():
+    """Share memoized loaders within the block, LoadersMiddleware opens one per request."""
+
+    loaders = Loaders()
+    token = _current_loaders.set(loaders)
+    try:
+        yield loaders
+    finally:
+        _current_loaders.reset(token)
+
+
+class SoftReferenceQuerySet(models.QuerySet):
+    """
+    QuerySet of a model which references other models by bare uuid, "soft_references"
+    maps the uuid field to the referenced model ("app_label.Model").
+
+        Workspace.objects.resolve("owner", "organization")
+
+    sets "resolved_owner" / "resolved_organization" on each fetched instance (None
+    when the row does not exist) with one query per referenced model.
+    Not applied to values()/values_list() results and iterator().
+    """
+
+    soft_references: dict[str, str] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolve_fields = ()
+
+    def resolve(self, *fields: str):
+        unknown = set(fields) - set(self.soft_references)
+        if unknown:
+            raise ValueError(
+                f"{self.model.__name__} has no soft references: "
+                f"{', '.join(sorted(unknown))}"
+            )
+        clone = self._chain()
+        clone._resolve_fields = (*self._resolve_fields, *fields)
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._resolve_fields = self._resolve_fields
+        return clone
+
+    def _fetch_all(self):
+        fetched = self._result_cache is not None
+        super()._fetch_all()
+        if not fetched and self._resolve_fields:
+            self._attach_references(self._result_cache)
+
+    def _attach_references(self, instances: list):
+        instances = [
+            instance for instance in instances if isinstance(instance, self.model)
+        ]
+        if not instances:
+            return
+
+        loaders = current_loaders() or Loaders()
+        for field in self._resolve_fields:
+            loaders[self.soft_references[field]].defer(
+                getattr(instance, field) for instance in instances
+            )
+        for field in self._resolve_fields:
+            resolved = loaders[self.soft_references[field]].load_many(
+                {getattr(instance, field) for instance in instances}
+            )
+            for instance in instances:
+                setattr(
+                    instance, f"resolved_{field}", resolved[getattr(instance, field)]
+                )
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from pd_django_small.core.archive import (
+    ARCHIVE_BATCH_SIZE,
+    ARCHIVED_MODELS,
+    archive_removed,
+    archived_models,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move removed users, workspaces and memberships older than --days "
+        "into core_archivedrecord, in batches of one transaction each."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Archive rows removed (last updated) more than this many days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=ARCHIVED_MODELS,
+            help="Archive only the given model, may be repeated.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to archive. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        for model in archived_models():
+            if options["models"] and model._meta.label not in options["models"]:
+                continue
+            archived = archive_removed(
+                model,
+                cutoff,
+                batch_size=options["batch_size"],
+                pause=options["pause"],
+                using=options["database"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Archived {archived} {model._meta.label} rows.")
+            )
@@ -0,0 +1,103 @@
+import itertools
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+
+from pd_django_small.core.benchmarks.http import run_asgi, run_wsgi
+from pd_django_small.organizations.models import Organization
+from pd_django_small.subscriptions.models import Subscription
+from pd_django_small.workspaces.models import Workspace
+
+
+def endpoint_urls(sample_size: int) -> dict[str, list[str]]:
+    """List and detail URLs of organizations, workspaces and subscriptions."""
+
+    urls = {
+        "organizations:list": [reverse("organizations:list")],
+        "workspaces:list": [reverse("workspaces:list")],
+        "subscriptions:list": [reverse("subscriptions:list")],
+    }
+    for name, model in (
+        ("organizations:detail", Organization),
+        ("workspaces:detail", Workspace),
+        ("subscriptions:detail", Subscription),
+    ):
+        urls[name] = [
+            reverse(name, args=[pk])
+            for pk in model.objects.order_by("?").values_list("pk", flat=True)[
+                :sample_size
+            ]
+        ]
+    return urls
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the async list/detail endpoints through the ASGI (asgi.py) and "
+        "WSGI (wsgi.py) applications in-process and compare throughput and latency."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--concurrency", type=int, default=32)
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            dest="endpoints",
+            help="Load only the given URL name (e.g. workspaces:list), may be repeated.",
+        )
+        parser.add_argument("--json", action="store_true", help="Print JSON report.")
+
+    def handle(self, *args, **options):
+        from pd_django_small.asgi import application as asgi_application
+        from pd_django_small.wsgi import application as wsgi_application
+
+        urls = endpoint_urls(sample_size=100)
+        if options["endpoints"]:
+            unknown = set(options["endpoints"]) - set(urls)
+            if unknown:
+                raise CommandError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+            urls = {name: urls[name] for name in options["endpoints"]}
+
+        report = {}
+        for name, endpoint_urls_ in urls.items():
+            if not endpoint_urls_:
+                continue
+            load = list(
+                itertools.islice(itertools.cycle(endpoint_urls_), options["requests"])
+            )
+            report[name] = {
+                "wsgi": run_wsgi(
+                    wsgi_application, load, options["concurrency"]
+                ).as_dict(),
+                "asgi": run_asgi(
+                    asgi_application, load, options["concurrency"]
+                ).as_dict(),
+            }
+
+        pool_stats = (
+            connection.pool_stats() if hasattr(connection, "pool_stats") else None
+        )
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({"endpoints": report, "pool": pool_stats}, indent=2)
+            )
+            return
+
+        self.stdout.write(
+            f"{'endpoint':<24}{'server':<7}{'rps':>9}{'p50 ms':>9}"
+            f"{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}"
+        )
+        for name, servers in report.items():
+            for server, result in servers.items():
+                self.stdout.write(
+                    f"{name:<24}{server:<7}{result['rps']:>9.0f}{result['p50']:>9.2f}"
+                    f"{result['p95']:>9.2f}{result['p99']:>9.2f}{result['errors']:>8}"
+                )
+        if pool_stats:
+            self.stdout.write(
+                "pool: "
+                + ", ".join(f"{name}={value}" for name, value in pool_stats.items())
+            )
@@ -0,0 +1,80 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from pd_django_small.core.benchmarks.queries import access_paths
+from pd_django_small.core.benchmarks.timing import measure
+from pd_django_small.core.seeding import SeedConfig, seed
+
+PROJECT_APPS = ("organizations", "subscriptions", "users", "workspaces")
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the organizations/workspaces/subscriptions access paths "
+        "without (before) and with (after) the project indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Seed the dataset before running the benchmark.",
+        )
+        parser.add_argument("--users", type=int, default=SeedConfig.users)
+        parser.add_argument(
+            "--organizations", type=int, default=SeedConfig.organizations
+        )
+        parser.add_argument("--workspaces", type=int, default=SeedConfig.workspaces)
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to benchmark. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if options["seed"]:
+            seed(
+                SeedConfig(
+                    users=options["users"],
+                    organizations=options["organizations"],
+                    workspaces=options["workspaces"],
+                ),
+                using=using,
+            )
+
+        paths = access_paths(sample_size=options["repeat"], using=using)
+        before = self._run(paths, options["repeat"], using, drop_indexes=True)
+        after = self._run(paths, options["repeat"], using, drop_indexes=False)
+
+        self.stdout.write(
+            f"{'access path':<42}{'before p50 ms':>15}{'after p50 ms':>15}{'speedup':>10}"
+        )
+        for name in paths:
+            speedup = before[name].p50 / after[name].p50 if after[name].p50 else 0
+            self.stdout.write(
+                f"{name:<42}{before[name].p50:>15.2f}{after[name].p50:>15.2f}"
+                f"{speedup:>9.1f}x"
+            )
+
+    def _run(self, paths, repeat, using, drop_indexes):
+        """Indexes are dropped inside a transaction which is always rolled back."""
+
+        connection = connections[using]
+        with transaction.atomic(using=using):
+            if drop_indexes:
+                with connection.cursor() as cursor:
+                    for index in self._project_indexes():
+                        cursor.execute(f"DROP INDEX {connection.ops.quote_name(index)}")
+
+            timings = {name: measure(fn, repeat, using) for name, fn in paths.items()}
+            transaction.set_rollback(True, using=using)
+        return timings
+
+    def _project_indexes(self):
+        for app_label in PROJECT_APPS:
+            for model in apps.get_app_config(app_label).get_models():
+                for index in model._meta.indexes:
+                    yield index.name
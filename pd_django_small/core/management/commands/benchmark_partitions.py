@@ -0,0 +1,49 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.core.benchmarks.partitions import compare_pruning
+from pd_django_small.core.partitioning import PartitioningError
+
+
+class Command(BaseCommand):
+    help = (
+        "Time per-organization and per-workspace queries against the plain and "
+        "the partitioned workspace and membership tables (after partition_tables "
+        "prepare copy), with the number of partitions left after pruning."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--json", action="store_true", help="Print JSON report.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        try:
+            report = compare_pruning(
+                samples=options["samples"],
+                repeat=options["repeat"],
+                using=options["database"],
+            )
+        except PartitioningError as e:
+            raise CommandError(str(e))
+
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {name: result.as_dict() for name, result in report.items()},
+                    indent=2,
+                )
+            )
+            return
+
+        self.stdout.write(
+            f"{'query':<28}{'partitions':>12}{'plain ms':>10}{'partitioned ms':>16}"
+        )
+        for name, result in report.items():
+            self.stdout.write(
+                f"{name:<28}{f'{result.scanned}/{result.partitions}':>12}"
+                f"{result.unpartitioned_ms:>10.3f}{result.partitioned_ms:>16.3f}"
+            )
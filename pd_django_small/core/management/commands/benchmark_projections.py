@@ -0,0 +1,56 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from pd_django_small.core.benchmarks.projections import compare_projections
+from pd_django_small.organizations.models import Organization
+from pd_django_small.organizations.projections import OrganizationRow
+from pd_django_small.workspaces.models import Workspace
+from pd_django_small.workspaces.projections import WorkspaceRow
+
+
+class Command(BaseCommand):
+    help = (
+        "Read --rows workspaces and organizations as model instances, "
+        "values_list() tuples and projection rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--json", action="store_true", help="Print JSON report.")
+
+    def handle(self, *args, **options):
+        report = {
+            label: compare_projections(
+                queryset.order_by("uuid"),
+                projection,
+                rows=options["rows"],
+                repeat=options["repeat"],
+            )
+            for label, queryset, projection in (
+                ("workspaces", Workspace.objects.all(), WorkspaceRow),
+                ("organizations", Organization.objects.all(), OrganizationRow),
+            )
+        }
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        label: {name: t.as_dict() for name, t in paths.items()}
+                        for label, paths in report.items()
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        self.stdout.write(
+            f"{'model':<16}{'path':<14}{'rows':>9}{'ms':>10}{'rows/s':>12}{'traced MiB':>13}"
+        )
+        for label, paths in report.items():
+            for name, timing in paths.items():
+                self.stdout.write(
+                    f"{label:<16}{name:<14}{timing.rows:>9}{timing.seconds * 1000:>10.1f}"
+                    f"{timing.rows_per_second:>12.0f}{timing.traced_mib:>13.1f}"
+                )
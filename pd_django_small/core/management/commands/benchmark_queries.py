@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pd_django_small.core.benchmarks.queries import canonical_queries
+from pd_django_small.core.benchmarks.report import (
+    compare,
+    format_report,
+    read_report,
+    run_suite,
+    write_report,
+)
+from pd_django_small.core.seeding import SeedConfig, seed
+from pd_django_small.organizations.models import Organization
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Workspace
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the canonical tests/test_queries.py query shapes (p50/p95/p99 and "
+        "number of SQL queries), optionally comparing them with a baseline report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Seed the dataset unless the database already holds users.",
+        )
+        parser.add_argument("--users", type=int, default=SeedConfig.users)
+        parser.add_argument(
+            "--organizations", type=int, default=SeedConfig.organizations
+        )
+        parser.add_argument("--workspaces", type=int, default=SeedConfig.workspaces)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Run only the given query, may be repeated.",
+        )
+        parser.add_argument("--output", type=Path, help="Write JSON report to path.")
+        parser.add_argument("--baseline", type=Path, help="Baseline JSON report.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed slowdown against baseline, 0.2 means 20%%.",
+        )
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            if User.objects.all_with_removed().exists():
+                self.stdout.write("Database already holds users, seeding skipped.")
+            else:
+                seed(
+                    SeedConfig(
+                        users=options["users"],
+                        organizations=options["organizations"],
+                        workspaces=options["workspaces"],
+                    ),
+                )
+
+        queries = canonical_queries(page_size=options["page_size"])
+        if options["queries"]:
+            unknown = set(options["queries"]) - set(queries)
+            if unknown:
+                raise CommandError(f"Unknown queries: {', '.join(sorted(unknown))}")
+            queries = {name: queries[name] for name in options["queries"]}
+
+        report = run_suite(
+            queries,
+            repeat=options["repeat"],
+            dataset={
+                "users": User.objects.all_with_removed().count(),
+                "organizations": Organization.objects.count(),
+                "workspaces": Workspace.objects.all_with_removed().count(),
+            },
+        )
+        for line in format_report(report):
+            self.stdout.write(line)
+
+        if options["output"]:
+            write_report(report, options["output"])
+
+        if options["baseline"]:
+            regressions = compare(
+                report, read_report(options["baseline"]), options["threshold"]
+            )
+            if regressions:
+                raise CommandError(
+                    "Queries regressed against baseline:\n"
+                    + "\n".join(str(regression) for regression in regressions)
+                )
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
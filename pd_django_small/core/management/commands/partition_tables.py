@@ -0,0 +1,94 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.core.partitioning import (
+    PARTITION_BATCH_SIZE,
+    PARTITION_COUNT,
+    PARTITIONED_MODELS,
+    SWAP_LOCK_TIMEOUT,
+    PartitioningError,
+    copy_partitioned,
+    partitioned_models,
+    prepare_partitioned,
+    swap_partitioned,
+)
+
+STEPS = ("prepare", "copy", "swap")
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert workspaces (by organization) and memberships (by workspace) into "
+        "hash partitioned tables while they are in use: prepare the partitioned "
+        "table, copy the rows in batches, then swap it in."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "steps",
+            nargs="*",
+            help="Steps to run (prepare, copy, swap), all three in order by default.",
+        )
+        parser.add_argument("--partitions", type=int, default=PARTITION_COUNT)
+        parser.add_argument("--batch-size", type=int, default=PARTITION_BATCH_SIZE)
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between copied batches.",
+        )
+        parser.add_argument(
+            "--lock-timeout",
+            default=SWAP_LOCK_TIMEOUT,
+            help="Give up the swap when the table lock is not granted in time.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=PARTITIONED_MODELS,
+            help="Partition only the given model, may be repeated.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to partition. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        # Not argparse choices, an empty nargs="*" list fails their check.
+        unknown = set(options["steps"]) - set(STEPS)
+        if unknown:
+            raise CommandError(
+                f"Unknown steps {', '.join(sorted(unknown))}, "
+                f"choose from {', '.join(STEPS)}."
+            )
+        steps = [step for step in STEPS if step in (options["steps"] or STEPS)]
+        using = options["database"]
+        for model, key in partitioned_models():
+            label = model._meta.label
+            if options["models"] and label not in options["models"]:
+                continue
+            try:
+                if "prepare" in steps:
+                    prepare_partitioned(
+                        model, key, partitions=options["partitions"], using=using
+                    )
+                    self.stdout.write(f"Prepared {label} partitioned by {key}.")
+                if "copy" in steps:
+                    copied = copy_partitioned(
+                        model,
+                        batch_size=options["batch_size"],
+                        pause=options["pause"],
+                        using=using,
+                    )
+                    self.stdout.write(f"Copied {copied} {label} rows.")
+                if "swap" in steps:
+                    swap_partitioned(
+                        model, key, lock_timeout=options["lock_timeout"], using=using
+                    )
+                    self.stdout.write(
+                        self.style.SUCCESS(f"{label} is partitioned by {key}.")
+                    )
+            except PartitioningError as e:
+                raise CommandError(f"{label}: {e}")
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from pd_django_small.core.benchmarks.memory import (
+    MEMORY_CHUNK_SIZE,
+    PROFILED_MODELS,
+    format_memory_report,
+    profile_models,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Peak RSS and traced allocations of reading each model as a list, "
+        "with .iterator(), with values_list() and in keyset chunks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            choices=PROFILED_MODELS,
+            help="Profile only the given model, may be repeated.",
+        )
+        parser.add_argument(
+            "--limit", type=int, help="Read at most this many rows per model."
+        )
+        parser.add_argument("--chunk-size", type=int, default=MEMORY_CHUNK_SIZE)
+        parser.add_argument("--json", action="store_true", help="Print JSON report.")
+
+    def handle(self, *args, **options):
+        report = profile_models(
+            options["models"] or PROFILED_MODELS,
+            chunk_size=options["chunk_size"],
+            limit=options["limit"],
+        )
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    {
+                        label: {name: usage.as_dict() for name, usage in paths.items()}
+                        for label, paths in report.items()
+                    },
+                    indent=2,
+                )
+            )
+            return
+
+        for line in format_memory_report(report):
+            self.stdout.write(line)
@@ -0,0 +1,70 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from pd_django_small.core.benchmarks.startup import ENTRYPOINTS, profile_startup
+
+SETTINGS_MODULES = ("pd_django_small.settings", "pd_django_small.settings_api")
+
+
+class Command(BaseCommand):
+    help = (
+        "Import the WSGI and ASGI entry points in a fresh interpreter with the full "
+        "and the API-only settings, report import time, peak RSS and the slowest "
+        "modules."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--entrypoint",
+            action="append",
+            dest="entrypoints",
+            choices=ENTRYPOINTS,
+            help="Profile only the given entry point, may be repeated.",
+        )
+        parser.add_argument(
+            "--settings-module",
+            action="append",
+            dest="settings_modules",
+            help=f"Settings to start with, may be repeated. Defaults to "
+            f"{' and '.join(SETTINGS_MODULES)}.",
+        )
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument("--json", action="store_true", help="Print JSON report.")
+
+    def handle(self, *args, **options):
+        profiles = [
+            profile_startup(entrypoint, settings_module)
+            for entrypoint in options["entrypoints"] or ENTRYPOINTS
+            for settings_module in options["settings_modules"] or SETTINGS_MODULES
+        ]
+        if options["json"]:
+            self.stdout.write(
+                json.dumps([p.as_dict(options["top"]) for p in profiles], indent=2)
+            )
+            return
+
+        self.stdout.write(
+            f"{'entrypoint':<12}{'settings':<32}{'ms':>9}{'RSS MiB':>10}{'modules':>9}"
+        )
+        for profile in profiles:
+            self.stdout.write(
+                f"{profile.entrypoint:<12}{profile.settings_module:<32}"
+                f"{profile.seconds * 1000:>9.1f}{profile.max_rss_mib:>10.1f}"
+                f"{len(profile.modules):>9}"
+            )
+        for profile in profiles:
+            self.stdout.write(
+                f"\n{profile.entrypoint} {profile.settings_module}, "
+                "slowest modules (self / cumulative ms):"
+            )
+            for module in profile.slowest(options["top"]):
+                self.stdout.write(
+                    f"  {module.module:<56}{module.self_ms:>9.1f}"
+                    f"{module.cumulative_ms:>10.1f}"
+                )
+            packages = list(profile.by_package().items())[: options["top"]]
+            self.stdout.write(
+                "  packages: "
+                + ", ".join(f"{package} {ms:.1f}" for package, ms in packages)
+            )
@@ -0,0 +1,97 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from pd_django_small.core.integrity import (
+    CHECKS,
+    SCAN_BATCH_SIZE,
+    get_check,
+    resume_run,
+    start_run,
+)
+from pd_django_small.core.models import ScanRun
+
+
+class Command(BaseCommand):
+    help = (
+        "Scan a model for rows breaking an integrity check, in uuid ranges across "
+        "worker processes. Progress is checkpointed, --resume continues an "
+        "interrupted run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("check", nargs="?", help="Registered check name.")
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument(
+            "--partitions",
+            type=int,
+            help="Number of uuid ranges, 4 per worker by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=SCAN_BATCH_SIZE)
+        parser.add_argument(
+            "--fix", action="store_true", help="Repair violating rows while scanning."
+        )
+        parser.add_argument(
+            "--resume",
+            nargs="?",
+            const=0,
+            type=int,
+            metavar="RUN_ID",
+            help="Resume the given run, or the latest unfinished run of the check.",
+        )
+        parser.add_argument("--list", action="store_true", help="List checks.")
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for name in sorted(CHECKS):
+                self.stdout.write(name)
+            return
+
+        run = self._run(options)
+        total = run.checkpoints.count()
+
+        def progress(checkpoint):
+            self.stdout.write(
+                f"range {checkpoint.range_start}: scanned={checkpoint.scanned} "
+                f"found={checkpoint.found} fixed={checkpoint.fixed}"
+            )
+
+        self.stdout.write(
+            f"Run {run.pk} ({run.check_name}): "
+            f"{total - len(run.checkpoints.filter(done=False))}/{total} ranges done"
+        )
+        resume_run(
+            run,
+            workers=options["workers"],
+            batch_size=options["batch_size"],
+            progress=progress,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Run {run.pk} finished: {run.findings.count()} findings, "
+                f"see IntegrityFinding(run={run.pk})."
+            )
+        )
+
+    def _run(self, options) -> ScanRun:
+        if options["resume"] is not None:
+            runs = ScanRun.objects.filter(finished_at__isnull=True)
+            if options["resume"]:
+                runs = runs.filter(pk=options["resume"])
+            elif options["check"]:
+                runs = runs.filter(check_name=options["check"])
+            run = runs.order_by("-pk").first()
+            if run is None:
+                raise CommandError("No unfinished run to resume.")
+            if run.check_name not in CHECKS:
+                raise CommandError(f"Unknown check {run.check_name!r}.")
+            return run
+
+        if options["check"] not in CHECKS:
+            raise CommandError(
+                f"Unknown check {options['check']!r}, choose one of: "
+                f"{', '.join(sorted(CHECKS))}"
+            )
+        return start_run(
+            get_check(options["check"]),
+            options["partitions"] or options["workers"] * 4,
+            fix=options["fix"],
+        )
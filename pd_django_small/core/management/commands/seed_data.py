@@ -0,0 +1,91 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.core.seeding import SeedConfig, seed
+
+
+class Command(BaseCommand):
+    help = (
+        "Load generated users, organizations, subscriptions, workspaces and "
+        "memberships with COPY, the same --seed always produces the same rows."
+    )
+
+    def add_arguments(self, parser):
+        defaults = SeedConfig()
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument("--users", type=int, default=defaults.users)
+        parser.add_argument("--organizations", type=int, default=defaults.organizations)
+        parser.add_argument("--workspaces", type=int, default=defaults.workspaces)
+        parser.add_argument(
+            "--memberships-per-workspace",
+            type=int,
+            default=defaults.memberships_per_workspace,
+        )
+        parser.add_argument(
+            "--subscription-ratio",
+            type=float,
+            default=defaults.subscription_ratio,
+            help="Share of organizations with a subscription.",
+        )
+        parser.add_argument(
+            "--removed-ratio",
+            type=float,
+            default=defaults.removed_ratio,
+            help="Share of removed users, workspaces and memberships.",
+        )
+        parser.add_argument(
+            "--business-ratio", type=float, default=defaults.business_ratio
+        )
+        parser.add_argument(
+            "--corrupted-ratio",
+            type=float,
+            default=defaults.corrupted_ratio,
+            help="Share of users with first name equal to email.",
+        )
+        parser.add_argument(
+            "--owner-workspace-ratio",
+            type=float,
+            default=defaults.owner_workspace_ratio,
+            help="Share of workspaces owned by the organization owner.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to seed. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        config = SeedConfig(
+            seed=options["seed"],
+            users=options["users"],
+            organizations=options["organizations"],
+            workspaces=options["workspaces"],
+            memberships_per_workspace=options["memberships_per_workspace"],
+            subscription_ratio=options["subscription_ratio"],
+            removed_ratio=options["removed_ratio"],
+            business_ratio=options["business_ratio"],
+            corrupted_ratio=options["corrupted_ratio"],
+            owner_workspace_ratio=options["owner_workspace_ratio"],
+        )
+
+        started = time.perf_counter()
+        table_started = started
+
+        def progress(table, rows):
+            nonlocal table_started
+            elapsed = time.perf_counter() - table_started
+            self.stdout.write(
+                f"{table}: {rows} rows in {elapsed:.1f}s "
+                f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+            table_started = time.perf_counter()
+
+        counts = seed(config, using=options["database"], progress=progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {sum(counts.values())} rows "
+                f"in {time.perf_counter() - started:.1f}s."
+            )
+        )
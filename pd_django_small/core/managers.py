@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class SoftDeleteManager(models.Manager):
+    """
+    Default manager of models with "is_removed", removed rows are left out of
+    every query, all_with_removed() is the escape hatch. Related lookups
+    (workspace.membership_set) go through this manager too, forward foreign keys
+    and Model.refresh_from_db() use the unfiltered _base_manager.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_removed=False)
+
+    def all_with_removed(self):
+        return super().get_queryset()
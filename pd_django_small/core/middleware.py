@@ -0,0 +1,186 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from pd_django_small.core.db.routers import routing_config, routing_scope
+from pd_django_small.core.instrumentation import QueryRecorder
+from pd_django_small.core.loaders import loaders_scope
+
+logger = logging.getLogger(__name__)
+
+SQL_INSTRUMENTATION_DEFAULTS = {
+    "SAMPLE_RATE": 1.0,
+    "N_PLUS_ONE_THRESHOLD": 5,
+    "SERVER_TIMING": True,
+}
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Record query count, DB time and query fingerprints of a sampled share of requests,
+    add a Server-Timing header and log one line per request, repeated fingerprints
+    are logged as a warning as probable N+1 queries.
+
+    Queries run while a streaming response is consumed are not recorded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = {
+            **SQL_INSTRUMENTATION_DEFAULTS,
+            **getattr(settings, "SQL_INSTRUMENTATION", {}),
+        }
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        with self.wrap_connections(recorder):
+            response = self.get_response(request)
+        self.report(request, response, recorder)
+        return response
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        # Connections are context local, sync_to_async() ORM calls of the view
+        # use the same connection objects as this coroutine.
+        recorder = QueryRecorder()
+        with self.wrap_connections(recorder):
+            response = await self.get_response(request)
+        self.report(request, response, recorder)
+        return response
+
+    def sampled(self) -> bool:
+        rate = self.config["SAMPLE_RATE"]
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def wrap_connections(self, recorder: QueryRecorder) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def report(self, request, response, recorder: QueryRecorder):
+        duration_ms = recorder.duration * 1000
+        if self.config["SERVER_TIMING"]:
+            timing = f'db;dur={duration_ms:.2f};desc="{recorder.count} queries"'
+            existing = response.get("Server-Timing")
+            response["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+
+        repeated = recorder.repeated(self.config["N_PLUS_ONE_THRESHOLD"])
+        extra = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(duration_ms, 2),
+            "repeated": repeated,
+        }
+        logger.info(
+            "%s %s %s queries=%d db_ms=%.2f",
+            request.method,
+            request.path,
+            response.status_code,
+            recorder.count,
+            duration_ms,
+            extra=extra,
+        )
+        if repeated:
+            logger.warning(
+                "Probable N+1 queries in %s %s: %s",
+                request.method,
+                request.path,
+                "; ".join(f"{count}x {sql}" for sql, count in repeated.items()),
+                extra=extra,
+            )
+
+
+class LoadersMiddleware:
+    """Open a loaders_scope() per request, batch loaders memoize within the request."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with loaders_scope() as request.loaders:
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with loaders_scope() as request.loaders:
+            return await self.get_response(request)
+
+
+class ReplicaPinningMiddleware:
+    """
+    Open a routing_scope() per request, pinned to the primary for unsafe methods
+    and while the pin cookie set after the client's last write is fresh, so the
+    client reads its own writes until replicas have caught up.
+    """
+
+    sync_capable = True
+    async_capable = True
+    safe_methods = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = routing_config()
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with routing_scope(pinned=self.pinned(request)) as state:
+            response = self.get_response(request)
+        return self.remember(response, state)
+
+    async def __acall__(self, request):
+        with routing_scope(pinned=self.pinned(request)) as state:
+            response = await self.get_response(request)
+        return self.remember(response, state)
+
+    def pinned(self, request) -> bool:
+        if request.method not in self.safe_methods:
+            return True
+        try:
+            pinned_until = float(request.COOKIES.get(self.config["PIN_COOKIE"], 0))
+        except ValueError:
+            return False
+        return pinned_until > time.time()
+
+    def remember(self, response, state):
+        if state.wrote:
+            pin_seconds = self.config["PIN_SECONDS"]
+            response.set_cookie(
+                self.config["PIN_COOKIE"],
+                f"{time.time() + pin_seconds:.3f}",
+                max_age=pin_seconds,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
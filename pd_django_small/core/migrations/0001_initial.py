@@ -0,0 +1,94 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ScanRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("check_name", models.CharField(max_length=100)),
+                ("fix", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ScanCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("range_start", models.UUIDField()),
+                ("range_end", models.UUIDField(null=True)),
+                ("last_key", models.UUIDField(null=True)),
+                ("scanned", models.BigIntegerField(default=0)),
+                ("found", models.IntegerField(default=0)),
+                ("fixed", models.IntegerField(default=0)),
+                ("done", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkpoints",
+                        to="core.scanrun",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="IntegrityFinding",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("check_name", models.CharField(max_length=100)),
+                ("object_id", models.UUIDField()),
+                ("detail", models.JSONField(default=dict)),
+                ("fixed", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="findings",
+                        to="core.scanrun",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="integrityfinding",
+            constraint=models.UniqueConstraint(
+                fields=("run", "object_id"), name="integrity_finding_run_object"
+            ),
+        ),
+    ]
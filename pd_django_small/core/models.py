@@ -0,0 +1,65 @@
+from django.db import models
+
+
+class ScanRun(models.Model):
+    """One run of an integrity check (pd_django_small.core.integrity) over a model."""
+
+    check_name = models.CharField(max_length=100)
+    fix = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True)
+
+
+class ScanCheckpoint(models.Model):
+    """
+    Progress of a run over one primary key range [range_start, range_end),
+    rows up to "last_key" are scanned.
+    """
+
+    run = models.ForeignKey(
+        ScanRun, on_delete=models.CASCADE, related_name="checkpoints"
+    )
+    range_start = models.UUIDField()
+    range_end = models.UUIDField(null=True)
+    last_key = models.UUIDField(null=True)
+    scanned = models.BigIntegerField(default=0)
+    found = models.IntegerField(default=0)
+    fixed = models.IntegerField(default=0)
+    done = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class IntegrityFinding(models.Model):
+    run = models.ForeignKey(ScanRun, on_delete=models.CASCADE, related_name="findings")
+    check_name = models.CharField(max_length=100)
+    object_id = models.UUIDField()
+    detail = models.JSONField(default=dict)
+    fixed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["run", "object_id"], name="integrity_finding_run_object"
+            )
+        ]
+
+
+class ArchivedRecord(models.Model):
+    """
+    Row moved out of a live table by pd_django_small.core.archive, "data" is
+    the whole row as JSON, "removed_at" is its updated_at when it was archived.
+    """
+
+    model = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=64)
+    data = models.JSONField()
+    removed_at = models.DateTimeField(null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["model", "object_id"], name="archived_model_object_idx"
+            )
+        ]
@@ -0,0 +1,354 @@
+"""
+Online conversion of a table into a hash partitioned one, in three steps:
+
+- prepare: create "<table>_partitioned" with the same columns and indexes,
+  PARTITION BY HASH (partition key), and a trigger on the table mirroring every
+  insert, update and delete into it,
+- copy: move the existing rows in primary key order, batches are one
+  transaction each and lock their rows FOR SHARE, so a concurrent update waits
+  for the batch and its mirrored version wins,
+- swap: check row counts without locking, then under a short ACCESS EXCLUSIVE
+  lock rename the table to "<table>_unpartitioned" (kept until dropped by
+  hand) and the partitioned one to the table name, move the other triggers over.
+
+Postgres only enforces a unique index on a partitioned table when it contains
+the partition key, so:
+
+- the primary key becomes (primary key, partition key),
+- foreign keys to and from the table are dropped (e.g. membership to workspace),
+- other unique indexes become plain ones checked by a trigger which
+  serializes writers of the same key with an advisory lock (read committed
+  transactions only), ON CONFLICT can no longer use them as arbiter.
+
+None of it is reflected in the migration state, which keeps the foreign keys,
+constraints and single column primary keys, and CREATE INDEX CONCURRENTLY
+(AddIndexConcurrently) is not supported on a partitioned table.
+"""
+
+import re
+import time
+from typing import Callable, Optional
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+
+PARTITION_COUNT = 16
+PARTITION_BATCH_SIZE = 5000
+SWAP_LOCK_TIMEOUT = "5s"
+# Model to the field its table is hashed on.
+PARTITIONED_MODELS = {
+    "workspaces.Workspace": "organization",
+    "workspaces.Membership": "workspace",
+}
+
+INDEX_NAME_PATTERN = re.compile(r"^CREATE (UNIQUE )?INDEX \S+ ON \S+ ")
+MAX_NAME_LENGTH = 63
+
+
+class PartitioningError(RuntimeError):
+    pass
+
+
+def partitioned_models() -> list[tuple[type[models.Model], str]]:
+    return [(apps.get_model(label), key) for label, key in PARTITIONED_MODELS.items()]
+
+
+def shadow_table(model: type[models.Model]) -> str:
+    return f"{model._meta.db_table}_partitioned"
+
+
+def backup_table(model: type[models.Model]) -> str:
+    return f"{model._meta.db_table}_unpartitioned"
+
+
+def sync_trigger(model: type[models.Model]) -> str:
+    return f"{model._meta.db_table}_partition_sync"
+
+
+def suffixed(name: str, suffix: str) -> str:
+    return f"{name[:MAX_NAME_LENGTH - len(suffix)]}{suffix}"
+
+
+def table_kind(table: str, using: str = DEFAULT_DB_ALIAS) -> Optional[str]:
+    """relkind of "table": "p" when partitioned, "r" when plain, None when missing."""
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            [connections[using].ops.quote_name(table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def is_partitioned(model: type[models.Model], using: str = DEFAULT_DB_ALIAS) -> bool:
+    return table_kind(model._meta.db_table, using) == "p"
+
+
+def unique_lock_sql(name: str, columns: list[str]) -> str:
+    """Advisory lock taken by the uniqueness trigger of index "name" for a key."""
+
+    return (
+        f"pg_advisory_xact_lock(hashtext('{name}'), "
+        f"hashtext(ROW({', '.join(columns)})::text))"
+    )
+
+
+def table_indexes(cursor, table: str) -> list[tuple]:
+    """(name, definition, primary, unique, columns, predicate) of "table" indexes."""
+
+    cursor.execute(
+        """
+        SELECT
+            index.relname,
+            pg_get_indexdef(i.indexrelid),
+            i.indisprimary,
+            i.indisunique,
+            CASE WHEN 0 = ANY(i.indkey) THEN NULL ELSE ARRAY(
+                SELECT a.attname FROM pg_attribute AS a
+                WHERE a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                ORDER BY array_position(i.indkey::int2[], a.attnum)
+            ) END,
+            pg_get_expr(i.indpred, i.indrelid)
+        FROM pg_index AS i
+        JOIN pg_class AS index ON index.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass(%s)
+        ORDER BY index.relname
+        """,
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def table_triggers(cursor, table: str) -> list[tuple[str, str]]:
+    cursor.execute(
+        "SELECT tgname, pg_get_triggerdef(oid) FROM pg_trigger "
+        "WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal ORDER BY tgname",
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def prepare_partitioned(
+    model: type[models.Model],
+    key: str,
+    partitions: int = PARTITION_COUNT,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    meta = model._meta
+    table, shadow, sync = meta.db_table, shadow_table(model), sync_trigger(model)
+    pk, key_column = meta.pk.column, meta.get_field(key).column
+    if table_kind(table, using) != "r":
+        raise PartitioningError(f"{table} is already partitioned")
+    if table_kind(shadow, using) is not None:
+        raise PartitioningError(f"{shadow} already exists")
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {qn(shadow)} "
+            f"(LIKE {qn(table)} INCLUDING DEFAULTS INCLUDING GENERATED "
+            f"INCLUDING STORAGE) PARTITION BY HASH ({qn(key_column)})"
+        )
+        for remainder in range(partitions):
+            cursor.execute(
+                f"CREATE TABLE {qn(f'{table}_p{remainder}')} "
+                f"PARTITION OF {qn(shadow)} "
+                f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            )
+        cursor.execute(
+            f"ALTER TABLE {qn(shadow)} "
+            f"ADD CONSTRAINT {qn(suffixed(table, '_pkey_p'))} "
+            f"PRIMARY KEY ({qn(pk)}, {qn(key_column)})"
+        )
+
+        for name, definition, primary, unique, columns, _ in table_indexes(
+            cursor, qn(table)
+        ):
+            if primary:
+                continue
+            if columns is None:
+                raise PartitioningError(f"Expression index {name} is not supported")
+            if unique and key_column not in columns:
+                definition = definition.replace("CREATE UNIQUE INDEX", "CREATE INDEX")
+            cursor.execute(
+                INDEX_NAME_PATTERN.sub(
+                    lambda match: f"CREATE {match[1] or ''}INDEX "
+                    f"{qn(suffixed(name, '_p'))} ON {qn(shadow)} ",
+                    definition,
+                    count=1,
+                )
+            )
+
+        cursor.execute(
+            f"""
+            CREATE FUNCTION {qn(sync)}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                    DELETE FROM {qn(shadow)} WHERE {qn(pk)} = OLD.{qn(pk)};
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO {qn(shadow)} VALUES (NEW.*);
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """
+        )
+        cursor.execute(
+            f"CREATE TRIGGER {qn(sync)} AFTER INSERT OR UPDATE OR DELETE "
+            f"ON {qn(table)} FOR EACH ROW EXECUTE FUNCTION {qn(sync)}()"
+        )
+
+
+def copy_partitioned(
+    model: type[models.Model],
+    batch_size: int = PARTITION_BATCH_SIZE,
+    pause: float = 0,
+    using: str = DEFAULT_DB_ALIAS,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """
+    Copy rows into the prepared partitioned table, returns the number of rows
+    read. Rows already there are left alone, the copy can be restarted.
+    """
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    table, shadow = qn(model._meta.db_table), qn(shadow_table(model))
+    pk = qn(model._meta.pk.column)
+    if table_kind(shadow_table(model), using) != "p":
+        raise PartitioningError(f"{shadow} does not exist, prepare it first")
+
+    copied, last = 0, None
+    while True:
+        after = "" if last is None else f"WHERE {pk} > %s "
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH batch AS (SELECT * FROM {table} {after}"
+                f"ORDER BY {pk} LIMIT %s FOR SHARE), "
+                f"copied AS (INSERT INTO {shadow} SELECT * FROM batch "
+                "ON CONFLICT DO NOTHING) "
+                f"SELECT count(*), (SELECT {pk} FROM batch ORDER BY {pk} DESC LIMIT 1) "
+                "FROM batch",
+                [batch_size] if last is None else [last, batch_size],
+            )
+            count, last = cursor.fetchone()
+        copied += count
+        if progress:
+            progress(count)
+        if count < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    # Autovacuum analyzes the partitions, never the partitioned table itself.
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {shadow}")
+    return copied
+
+
+def swap_partitioned(
+    model: type[models.Model],
+    key: str,
+    lock_timeout: str = SWAP_LOCK_TIMEOUT,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Replace the table with the copied partitioned one. Fails without changes
+    when the lock is not granted within "lock_timeout" or row counts differ.
+    """
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    meta = model._meta
+    table, shadow, sync = meta.db_table, shadow_table(model), sync_trigger(model)
+    backup = backup_table(model)
+    key_column = meta.get_field(key).column
+    if table_kind(shadow, using) != "p":
+        raise PartitioningError(f"{shadow} does not exist, prepare it first")
+
+    # Counted before the lock, in one snapshot: the sync trigger mirrors every
+    # write in the writer's transaction, so equal counts stay equal until the
+    # swap and the lock below is only held for the renames.
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT (SELECT count(*) FROM {qn(table)}), "
+            f"(SELECT count(*) FROM {qn(shadow)})"
+        )
+        rows, copied = cursor.fetchone()
+    if rows != copied:
+        raise PartitioningError(
+            f"{table} has {rows} rows, {shadow} {copied}, copy it first"
+        )
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(f"SET LOCAL lock_timeout = '{lock_timeout}'")
+        # Deferred foreign key checks pending in the transaction would block ALTER.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"LOCK TABLE {qn(table)} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"DROP TRIGGER {qn(sync)} ON {qn(table)}")
+        cursor.execute(f"DROP FUNCTION {qn(sync)}()")
+        triggers = table_triggers(cursor, qn(table))
+        for name, _ in triggers:
+            cursor.execute(f"DROP TRIGGER {qn(name)} ON {qn(table)}")
+        # The table rows stay in the backup, which no longer follows the others.
+        cursor.execute(
+            "SELECT conname, conrelid::regclass::text FROM pg_constraint "
+            "WHERE contype = 'f' AND to_regclass(%s) IN (confrelid, conrelid)",
+            [qn(table)],
+        )
+        for name, referencing in cursor.fetchall():
+            cursor.execute(f"ALTER TABLE {referencing} DROP CONSTRAINT {qn(name)}")
+
+        indexes = table_indexes(cursor, qn(table))
+        cursor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(backup)}")
+        for name, *_ in indexes:
+            cursor.execute(
+                f"ALTER INDEX {qn(name)} RENAME TO {qn(suffixed(name, '_u'))}"
+            )
+        cursor.execute(f"ALTER TABLE {qn(shadow)} RENAME TO {qn(table)}")
+        cursor.execute(
+            f"ALTER INDEX {qn(suffixed(table, '_pkey_p'))} "
+            f"RENAME TO {qn(suffixed(table, '_pkey'))}"
+        )
+        for name, _, primary, unique, columns, predicate in indexes:
+            if primary:
+                continue
+            cursor.execute(
+                f"ALTER INDEX {qn(suffixed(name, '_p'))} RENAME TO {qn(name)}"
+            )
+            if unique and key_column not in columns:
+                _create_unique_check(cursor, qn, table, name, columns, predicate)
+
+        # Definitions name the table, which is the partitioned one now.
+        for _, definition in triggers:
+            cursor.execute(definition)
+
+
+def _create_unique_check(cursor, qn, table, name, columns, predicate):
+    check = suffixed(name, "_check")
+    quoted = [qn(column) for column in columns]
+    conditions = [f"{column} = NEW.{column}" for column in quoted]
+    if predicate:
+        conditions.append(f"({predicate})")
+    cursor.execute(
+        f"""
+        CREATE FUNCTION {qn(check)}() RETURNS trigger AS $$
+        BEGIN
+            PERFORM {unique_lock_sql(name, [f'NEW.{column}' for column in quoted])};
+            IF (SELECT count(*) FROM {qn(table)} WHERE {' AND '.join(conditions)}) > 1
+            THEN
+                RAISE EXCEPTION 'duplicate key value violates unique constraint "{name}"'
+                    USING ERRCODE = 'unique_violation', CONSTRAINT = '{name}';
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    cursor.execute(
+        f"CREATE TRIGGER {qn(check)} AFTER INSERT OR UPDATE ON {qn(table)} "
+        f"FOR EACH ROW EXECUTE FUNCTION {qn(check)}()"
+    )
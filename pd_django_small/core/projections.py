@@ -0,0 +1,42 @@
+from functools import partial
+from itertools import starmap
+from typing import Iterator, Optional
+
+from django.db import models
+from django.db.models.query import ValuesListIterable
+
+
+class ProjectionIterable(ValuesListIterable):
+    """values_list() rows as instances of the queryset's projection type."""
+
+    def __iter__(self) -> Iterator:
+        projection = self.queryset._projection
+        rows = super().__iter__()
+        if issubclass(projection, tuple):
+            # NamedTuple.__new__ takes fields as arguments, tuple.__new__ the row itself.
+            return map(partial(tuple.__new__, projection), rows)
+        return starmap(projection, rows)
+
+
+class ProjectionMixin:
+    """
+    QuerySet mixin, project(RowType) reads only RowType._fields and yields RowType
+    instances built straight from the row tuples: a NamedTuple, or a __slots__
+    class whose __init__ takes the fields in order. No model instance, _state or
+    field defaults are created, rows are read-only snapshots.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._projection: Optional[type] = None
+
+    def project(self, projection: type) -> models.QuerySet:
+        clone = self.values_list(*projection._fields)
+        clone._iterable_class = ProjectionIterable
+        clone._projection = projection
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._projection = self._projection
+        return clone
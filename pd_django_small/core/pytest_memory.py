@@ -0,0 +1,43 @@
+"""
+pytest plugin, @pytest.mark.memory_budget(mib) fails a test whose Python
+allocations (traced with tracemalloc) peak above "mib" MiB during its call phase.
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from pd_django_small.core.benchmarks.memory import MIB
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "memory_budget(mib): fail when allocations of the test call peak above mib MiB",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("memory_budget")
+    if marker is None:
+        return (yield)
+
+    budget = marker.kwargs.get("mib", marker.args[0] if marker.args else None)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        result = yield
+    finally:
+        peak = (tracemalloc.get_traced_memory()[1] - baseline) / MIB
+        tracemalloc.stop()
+        item.user_properties.append(("memory_peak_mib", round(peak, 2)))
+
+    if peak > budget:
+        pytest.fail(
+            f"{item.nodeid} allocated {peak:.2f} MiB, budget is {budget} MiB",
+            pytrace=False,
+        )
+    return result
@@ -0,0 +1,261 @@
+import hashlib
+import math
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable, Iterator
+
+from django.db import connections, transaction
+
+from pd_django_small.organizations.models import Organization
+from pd_django_small.organizations.rollups import deferred_workspace_summary
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+from pd_django_small.subscriptions.rollups import refresh_domain_revenue
+from pd_django_small.users.models import AccountType, User
+from pd_django_small.workspaces.models import Membership, Workspace
+
+EMAIL_DOMAINS = ("abc.com", "example.com", "google.com", "pandadoc.com")
+PLANS = ("free", "team", "business", "enterprise")
+SEED_EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+SEED_PERIOD_SECONDS = 365 * 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    seed: int = 0
+    users: int = 1_000_000
+    organizations: int = 100_000
+    workspaces: int = 500_000
+    memberships_per_workspace: int = 2
+    subscription_ratio: float = 0.9
+    removed_ratio: float = 0.05
+    business_ratio: float = 0.5
+    corrupted_ratio: float = 0.001
+    owner_workspace_ratio: float = 0.5
+
+
+def seed_uuid(seed: int, kind: str, index: int) -> uuid.UUID:
+    """Stable uuid of the "index"-th row of "kind", rows reference each other by it."""
+
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=16)
+    return uuid.UUID(bytes=digest.digest(), version=4)
+
+
+def seed_pick(seed: int, kind: str, index: int, size: int) -> int:
+    """Stable pseudo-random index in range(size), no state is kept between calls."""
+
+    digest = hashlib.blake2b(f"{seed}:{kind}:{index}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big") % size
+
+
+def _created_at(rng: random.Random) -> datetime:
+    return SEED_EPOCH + timedelta(seconds=rng.randrange(SEED_PERIOD_SECONDS))
+
+
+def generate_users(config: SeedConfig) -> Iterator[tuple]:
+    rng = random.Random(f"{config.seed}:users")
+    for i in range(config.users):
+        email = f"user{i}@{EMAIL_DOMAINS[rng.randrange(len(EMAIL_DOMAINS))]}"
+        first_name, last_name = f"First{i}", f"Last{i}"
+        if rng.random() < config.corrupted_ratio:
+            first_name = email.capitalize()
+        created_at = _created_at(rng)
+        account_type = (
+            AccountType.BUSINESS.value
+            if rng.random() < config.business_ratio
+            else AccountType.PERSONAL.value
+        )
+        yield (
+            seed_uuid(config.seed, "user", i),
+            "!",
+            False,
+            f"user{i}",
+            False,
+            created_at,
+            email,
+            first_name,
+            last_name,
+            True,
+            rng.random() < config.removed_ratio,
+            account_type,
+            created_at,
+            created_at,
+        )
+
+
+def generate_organizations(config: SeedConfig) -> Iterator[tuple]:
+    for i in range(config.organizations):
+        yield (
+            seed_uuid(config.seed, "organization", i),
+            f"Organization {i}",
+            _organization_owner(config, i),
+        )
+
+
+def generate_subscriptions(config: SeedConfig) -> Iterator[tuple]:
+    rng = random.Random(f"{config.seed}:subscriptions")
+    states = [state.value for state in SubscriptionState]
+    for i in range(config.organizations):
+        if rng.random() >= config.subscription_ratio:
+            continue
+        yield (
+            seed_uuid(config.seed, "subscription", i),
+            states[rng.randrange(len(states))],
+            seed_uuid(config.seed, "organization", i),
+            PLANS[rng.randrange(len(PLANS))],
+            Decimal(rng.randrange(100_000)).scaleb(-2),
+            rng.randrange(50),
+        )
+
+
+def generate_workspaces(config: SeedConfig) -> Iterator[tuple]:
+    rng = random.Random(f"{config.seed}:workspaces")
+    for i in range(config.workspaces):
+        organization = seed_pick(
+            config.seed, "workspace-organization", i, config.organizations
+        )
+        if rng.random() < config.owner_workspace_ratio:
+            owner = _organization_owner(config, organization)
+        else:
+            owner = seed_uuid(config.seed, "user", rng.randrange(config.users))
+        created_at = _created_at(rng)
+        yield (
+            seed_uuid(config.seed, "workspace", i),
+            f"Workspace {i}",
+            owner,
+            seed_uuid(config.seed, "organization", organization),
+            rng.random() < config.removed_ratio,
+            created_at,
+            created_at,
+        )
+
+
+def generate_memberships(config: SeedConfig) -> Iterator[tuple]:
+    """
+    Membership j belongs to user (j * step) % users, "step" is coprime with
+    number of users, so the first "users" memberships visit every user once
+    and only those are active (one active membership per user).
+    """
+
+    rng = random.Random(f"{config.seed}:memberships")
+    step = _coprime_step(config.users)
+    total = config.workspaces * config.memberships_per_workspace
+    for j in range(total):
+        yield (
+            seed_uuid(config.seed, "membership", j),
+            seed_uuid(config.seed, "workspace", j // config.memberships_per_workspace),
+            seed_uuid(config.seed, "user", j * step % config.users),
+            j < config.users,
+            rng.random() < config.removed_ratio,
+            _created_at(rng),
+        )
+
+
+def _organization_owner(config: SeedConfig, organization: int) -> uuid.UUID:
+    owner = seed_pick(config.seed, "organization-owner", organization, config.users)
+    return seed_uuid(config.seed, "user", owner)
+
+
+def _coprime_step(size: int) -> int:
+    step = 1_000_003
+    while math.gcd(size, step) != 1:
+        step += 2
+    return step
+
+
+SEED_TABLES = (
+    (
+        User,
+        (
+            "uuid",
+            "password",
+            "is_superuser",
+            "username",
+            "is_staff",
+            "date_joined",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "is_removed",
+            "account_type",
+            "created_at",
+            "updated_at",
+        ),
+        generate_users,
+    ),
+    (Organization, ("uuid", "name", "owner"), generate_organizations),
+    (
+        Subscription,
+        ("uuid", "state", "organization_id", "plan", "price", "quantity"),
+        generate_subscriptions,
+    ),
+    (
+        Workspace,
+        (
+            "uuid",
+            "name",
+            "owner",
+            "organization",
+            "is_removed",
+            "created_at",
+            "updated_at",
+        ),
+        generate_workspaces,
+    ),
+    (
+        Membership,
+        ("uuid", "workspace_id", "user", "is_active", "is_removed", "updated_at"),
+        generate_memberships,
+    ),
+)
+
+
+def copy_rows(
+    model, columns: Iterable[str], rows: Iterable[tuple], using: str = "default"
+) -> int:
+    """Stream "rows" into the model table with COPY ... FROM STDIN."""
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    sql = "COPY {table} ({columns}) FROM STDIN".format(
+        table=qn(model._meta.db_table),
+        columns=", ".join(qn(column) for column in columns),
+    )
+
+    count = 0
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+    return count
+
+
+def seed(config: SeedConfig, using: str = "default", progress=None) -> dict:
+    """
+    Load generated users, organizations, subscriptions, workspaces and memberships,
+    returns number of rows per table. The same config always produces the same rows.
+    """
+
+    counts = {}
+    with transaction.atomic(using=using), deferred_workspace_summary(using=using):
+        for model, columns, generate in SEED_TABLES:
+            counts[model._meta.db_table] = copy_rows(
+                model, columns, generate(config), using=using
+            )
+            if progress:
+                progress(model._meta.db_table, counts[model._meta.db_table])
+        refresh_domain_revenue(using=using)
+
+        with connections[using].cursor() as cursor:
+            cursor.execute(
+                "ANALYZE "
+                + ", ".join(
+                    connections[using].ops.quote_name(model._meta.db_table)
+                    for model, _, _ in SEED_TABLES
+                )
+            )
+    return counts
@@ -0,0 +1,112 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.utils import timezone
+
+from pd_django_small.core.archive import archive_removed
+from pd_django_small.core.models import ArchivedRecord
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Membership, Workspace
+
+
+def _removed(model, instance, days: int):
+    model.objects.all_with_removed().filter(pk=instance.pk).update(
+        is_removed=True, updated_at=timezone.now() - timedelta(days=days)
+    )
+
+
+@pytest.mark.django_db
+def test_default_managers_exclude_removed(
+    user_factory, workspace_factory, membership_factory
+):
+    # Arrange
+    user, removed_user = user_factory.create_batch(2)
+    removed_user.is_removed = True
+    removed_user.save()
+    workspace = workspace_factory.create(owner=user.uuid, organization=uuid.uuid4())
+    removed_workspace = workspace_factory.create(
+        owner=user.uuid, organization=uuid.uuid4(), is_removed=True
+    )
+    membership = membership_factory.create(workspace=workspace, user=user.uuid)
+    removed_membership = membership_factory.create(
+        workspace=workspace, user=removed_user.uuid, is_active=False, is_removed=True
+    )
+
+    # Act & Assert
+    assert list(User.objects.all()) == [user]
+    assert set(User.objects.all_with_removed()) == {user, removed_user}
+    assert list(Workspace.objects.all()) == [workspace]
+    assert set(Workspace.objects.all_with_removed()) == {workspace, removed_workspace}
+    assert list(workspace.membership_set.all()) == [membership]
+    assert set(Membership.objects.all_with_removed()) == {
+        membership,
+        removed_membership,
+    }
+    assert Membership.objects.get(pk=membership.pk).workspace == workspace
+    assert Workspace.objects.resolve("owner")[0].resolved_owner == user
+
+
+@pytest.mark.django_db
+def test_archive_removed(user_factory, workspace_factory, membership_factory):
+    """Removed memberships go with their workspace, a live one keeps it."""
+
+    # Arrange
+    user = user_factory.create()
+    old, recent, live, joined = workspace_factory.create_batch(
+        4, owner=user.uuid, organization=uuid.uuid4()
+    )
+    old_memberships = membership_factory.create_batch(
+        2, workspace=old, user=uuid.uuid4(), is_active=False, is_removed=True
+    )
+    membership_factory.create(workspace=live, user=user.uuid)
+    membership_factory.create(workspace=joined, user=uuid.uuid4(), is_active=False)
+    _removed(Workspace, old, days=40)
+    _removed(Workspace, recent, days=10)
+    _removed(Workspace, joined, days=40)
+
+    # Act
+    archived = archive_removed(
+        Workspace, timezone.now() - timedelta(days=30), batch_size=1
+    )
+
+    # Assert
+    assert archived == 1
+    assert set(Workspace.objects.all_with_removed()) == {recent, live, joined}
+    assert Membership.objects.all_with_removed().count() == 2
+    records = {
+        (record.model, record.object_id): record
+        for record in ArchivedRecord.objects.all()
+    }
+    assert set(records) == {
+        ("workspaces.Workspace", str(old.uuid)),
+        *(("workspaces.Membership", str(m.uuid)) for m in old_memberships),
+    }
+    record = records["workspaces.Workspace", str(old.uuid)]
+    assert record.data["name"] == old.name
+    assert record.removed_at < timezone.now() - timedelta(days=39)
+
+
+@pytest.mark.django_db
+def test_archive_removed_command(user_factory, organization_factory):
+    # Arrange
+    user, removed, owner = user_factory.create_batch(3)
+    organization_factory.create(owner=owner.uuid)
+    _removed(User, owner, days=90)
+    removed.groups.add(Group.objects.create(name="editors"))
+    _removed(User, removed, days=90)
+    out = StringIO()
+
+    # Act
+    call_command("archive_removed", days=30, model=["users.User"], stdout=out)
+
+    # Assert
+    assert "Archived 1 users.User rows." in out.getvalue()
+    assert set(User.objects.all_with_removed()) == {user, owner}
+    assert sorted(ArchivedRecord.objects.values_list("model", flat=True)) == [
+        "users.User",
+        "users.User_groups",
+    ]
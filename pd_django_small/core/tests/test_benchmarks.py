@@ -0,0 +1,75 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from pd_django_small.core.benchmarks.queries import canonical_queries
+from pd_django_small.core.benchmarks.report import compare, run_suite
+from pd_django_small.core.seeding import SeedConfig, seed
+
+
+@pytest.mark.django_db
+def test_run_suite():
+    """Every canonical query is timed and reports its number of SQL queries."""
+
+    # Arrange
+    seed(SeedConfig(users=50, organizations=10, workspaces=30))
+
+    # Act
+    report = run_suite(canonical_queries(page_size=10), repeat=2)
+
+    # Assert
+    assert set(report["queries"]) >= {
+        "organizations_annotate",
+        "subscription_orders",
+        "user_corrupted_information",
+        "workspaces_next_prev_uuid",
+    }
+    for timing in report["queries"].values():
+        assert timing["p50"] <= timing["p95"] <= timing["p99"]
+        assert timing["queries"] >= 1
+
+
+@pytest.mark.django_db
+def test_benchmark_indexes():
+    """Access paths are timed against the nominated database with and without indexes."""
+
+    # Arrange
+    seed(SeedConfig(users=20, organizations=5, workspaces=10))
+    stdout = StringIO()
+
+    # Act
+    call_command(
+        "benchmark_indexes", "--repeat", "2", "--database", "default", stdout=stdout
+    )
+
+    # Assert
+    assert "workspaces_by_owner" in stdout.getvalue()
+
+
+def test_compare():
+    """Slower than threshold or extra SQL queries against baseline are regressions."""
+
+    # Arrange
+    baseline = {
+        "queries": {
+            "fast": {"p50": 1.0, "p95": 2.0, "p99": 3.0, "queries": 1},
+            "slow": {"p50": 1.0, "p95": 2.0, "p99": 3.0, "queries": 1},
+        }
+    }
+    report = {
+        "queries": {
+            "fast": {"p50": 1.1, "p95": 2.1, "p99": 3.1, "queries": 1},
+            "slow": {"p50": 1.1, "p95": 4.0, "p99": 3.1, "queries": 2},
+            "new": {"p50": 9.0, "p95": 9.0, "p99": 9.0, "queries": 9},
+        }
+    }
+
+    # Act
+    regressions = compare(report, baseline, threshold=0.2)
+
+    # Assert
+    assert [(r.query, r.metric) for r in regressions] == [
+        ("slow", "p95"),
+        ("slow", "queries"),
+    ]
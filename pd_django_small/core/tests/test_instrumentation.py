@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from pd_django_small.core.instrumentation import fingerprint
+from pd_django_small.core.middleware import SQLInstrumentationMiddleware
+from pd_django_small.users.models import User
+
+
+def test_fingerprint_ignores_parameters():
+    # Act
+    first = fingerprint('SELECT * FROM "t" WHERE "id" IN (%s, %s) AND "n" = 5')
+    second = fingerprint('SELECT  * FROM "t"\nWHERE "id" IN (%s) AND "n" = 42')
+
+    # Assert
+    assert first == second == 'SELECT * FROM "t" WHERE "id" IN (...) AND "n" = ?'
+
+
+@pytest.mark.django_db
+def test_sql_instrumentation_flags_n_plus_one(settings, caplog, user_factory):
+    """Same query executed in a loop is logged as probable N+1 queries."""
+
+    # Arrange
+    settings.SQL_INSTRUMENTATION = {"SAMPLE_RATE": 1, "N_PLUS_ONE_THRESHOLD": 3}
+    users = user_factory.create_batch(3)
+
+    def view(request):
+        for user in users:
+            User.objects.filter(pk=user.pk).exists()
+        return HttpResponse()
+
+    middleware = SQLInstrumentationMiddleware(view)
+
+    # Act
+    with caplog.at_level(logging.INFO, logger="pd_django_small.core.middleware"):
+        response = middleware(RequestFactory().get("/users/"))
+
+    # Assert
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert response["Server-Timing"].endswith('desc="3 queries"')
+    info, warning = caplog.records
+    assert info.queries == 3
+    assert warning.levelno == logging.WARNING
+    assert list(warning.repeated.values()) == [3]
+
+
+@pytest.mark.django_db
+def test_sql_instrumentation_async_view(client, organization_factory, user_factory):
+    # Arrange
+    organization = organization_factory.create(owner=user_factory.create().uuid)
+
+    # Act
+    response = client.get(reverse("organizations:detail", args=[organization.uuid]))
+
+    # Assert
+    assert response["Server-Timing"].endswith('desc="1 queries"')
+
+
+@pytest.mark.django_db
+def test_sql_instrumentation_not_sampled(settings, client):
+    # Arrange
+    settings.SQL_INSTRUMENTATION = {"SAMPLE_RATE": 0}
+
+    # Act
+    response = client.get(reverse("organizations:list"))
+
+    # Assert
+    assert "Server-Timing" not in response
@@ -0,0 +1,83 @@
+import uuid
+
+import pytest
+
+from pd_django_small.core.integrity import (
+    get_check,
+    resume_run,
+    run_check,
+    scan_checkpoint,
+    start_run,
+    uuid_ranges,
+)
+from pd_django_small.core.models import IntegrityFinding
+from pd_django_small.users.models import User
+
+
+@pytest.fixture
+def corrupted_users(user_factory):
+    user_factory.create_batch(20)
+    return [
+        user_factory.create(first_name="Admin@example.com", email="admin@example.com"),
+        user_factory.create(last_name="member@example.com", email="member@Example.com"),
+    ]
+
+
+def test_uuid_ranges():
+    # Act
+    ranges = uuid_ranges(4)
+
+    # Assert
+    assert ranges[0] == (uuid.UUID(int=0), uuid.UUID(int=1 << 126))
+    assert ranges[-1] == (uuid.UUID(int=3 << 126), None)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+
+@pytest.mark.django_db
+def test_scan_finds_and_fixes(corrupted_users):
+    # Act
+    run = run_check(
+        get_check("users.corrupted_name"), partitions=3, batch_size=5, fix=True
+    )
+
+    # Assert
+    assert run.finished_at is not None
+    findings = IntegrityFinding.objects.filter(run=run)
+    assert {f.object_id for f in findings} == {u.uuid for u in corrupted_users}
+    assert all(f.fixed for f in findings)
+    assert sum(c.scanned for c in run.checkpoints.all()) == User.objects.count()
+    admin, member = (User.objects.get(pk=u.pk) for u in corrupted_users)
+    assert (admin.first_name, member.last_name) == ("admin", "member")
+    assert member.first_name == corrupted_users[1].first_name
+
+
+@pytest.mark.django_db
+def test_scan_resumes_interrupted_run(corrupted_users):
+    """Resuming scans only unfinished ranges and does not duplicate findings."""
+
+    # Arrange
+    run = start_run(get_check("users.corrupted_name"), partitions=4)
+    first, *_ = run.checkpoints.order_by("pk")
+    scan_checkpoint(first.pk, batch_size=3)
+
+    # Act
+    resume_run(run, batch_size=3)
+
+    # Assert
+    first.refresh_from_db()
+    assert first.done
+    assert run.finished_at is not None
+    assert IntegrityFinding.objects.filter(run=run).count() == 2
+    assert User.objects.get(pk=corrupted_users[0].pk).first_name == "Admin@example.com"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_scan_in_worker_processes(corrupted_users):
+    # Act
+    run = run_check(get_check("users.corrupted_name"), workers=2, batch_size=5)
+
+    # Assert
+    assert run.finished_at is not None
+    assert {f.object_id for f in IntegrityFinding.objects.filter(run=run)} == {
+        u.uuid for u in corrupted_users
+    }
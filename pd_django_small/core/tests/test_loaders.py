@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+
+from pd_django_small.core.loaders import BatchLoader, loaders_scope
+from pd_django_small.organizations.models import Organization
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Workspace
+
+
+@pytest.mark.django_db
+def test_batch_loader_memoizes(django_assert_num_queries, user_factory):
+    """Deferred and requested keys are loaded in one query, then from memory."""
+
+    # Arrange
+    users = user_factory.create_batch(3)
+    missing = uuid.uuid4()
+    loader = BatchLoader(User)
+    loader.defer([users[0].uuid, users[1].uuid])
+
+    # Act
+    with django_assert_num_queries(1):
+        loaded = loader.load_many([users[2].uuid, missing])
+        user = loader.load(users[0].uuid)
+        loader.load(missing)
+
+    # Assert
+    assert loaded == {users[2].uuid: users[2], missing: None}
+    assert user == users[0]
+
+
+@pytest.mark.django_db
+def test_resolve_soft_references(
+    django_assert_num_queries, organization_factory, user_factory, workspace_factory
+):
+    """One query per referenced model, whatever the number of workspaces."""
+
+    # Arrange
+    owners = user_factory.create_batch(5)
+    organization = organization_factory.create(owner=owners[0].uuid)
+    for owner in owners:
+        workspace_factory.create_batch(
+            2, owner=owner.uuid, organization=organization.uuid
+        )
+    workspace_factory.create(owner=uuid.uuid4(), organization=organization.uuid)
+
+    # Act
+    with django_assert_num_queries(3):
+        workspaces = list(Workspace.objects.resolve("owner", "organization"))
+
+    # Assert
+    assert len(workspaces) == 11
+    for workspace in workspaces:
+        assert workspace.resolved_organization == organization
+        if workspace.resolved_owner is not None:
+            assert workspace.resolved_owner.uuid == workspace.owner
+    assert sum(w.resolved_owner is None for w in workspaces) == 1
+
+
+@pytest.mark.django_db
+def test_resolve_within_scope(
+    django_assert_num_queries, organization_factory, user_factory, workspace_factory
+):
+    """Within a loaders scope owners already resolved are not queried again."""
+
+    # Arrange
+    owner = user_factory.create()
+    organization = organization_factory.create(owner=owner.uuid)
+    workspace_factory.create(owner=owner.uuid, organization=organization.uuid)
+
+    # Act
+    with loaders_scope() as loaders:
+        list(Workspace.objects.resolve("owner"))
+        with django_assert_num_queries(1):
+            organizations = list(Organization.objects.resolve("owner"))
+
+    # Assert
+    assert organizations[0].resolved_owner == owner
+    assert loaders.queries == 1
+
+
+def test_resolve_unknown_field():
+    with pytest.raises(ValueError):
+        Workspace.objects.resolve("name")
@@ -0,0 +1,54 @@
+import pytest
+
+from pd_django_small.core.benchmarks.memory import (
+    format_memory_report,
+    materialization_paths,
+    profile_models,
+)
+from pd_django_small.core.seeding import SeedConfig, seed
+from pd_django_small.users.models import User
+
+CONFIG = SeedConfig(users=2000, organizations=10, workspaces=10)
+CHUNK_SIZE = 200
+
+
+@pytest.fixture
+def users(db):
+    seed(CONFIG)
+    return User.objects.all()
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param("list", marks=pytest.mark.memory_budget(mib=3)),
+        pytest.param("values_list", marks=pytest.mark.memory_budget(mib=2)),
+        pytest.param("iterator", marks=pytest.mark.memory_budget(mib=0.6)),
+        pytest.param("chunked", marks=pytest.mark.memory_budget(mib=0.8)),
+    ],
+)
+def test_users_memory_budget(users, path):
+    """Reading ~2000 users stays within the path's budget, enforced by the plugin."""
+
+    # Act
+    rows = materialization_paths(users, chunk_size=CHUNK_SIZE)[path]()
+
+    # Assert
+    assert rows == users.count()
+
+
+@pytest.mark.django_db
+def test_profile_models():
+    # Arrange
+    seed(SeedConfig(users=200, organizations=10, workspaces=10))
+
+    # Act
+    report = profile_models(["users.User"], chunk_size=50)
+
+    # Assert
+    usage = report["users.User"]
+    assert {path: u.rows for path, u in usage.items()} == dict.fromkeys(
+        ("list", "iterator", "values_list", "chunked"), User.objects.count()
+    )
+    assert usage["list"].traced_mib > usage["iterator"].traced_mib
+    assert format_memory_report(report)[1].startswith("users.User")
@@ -0,0 +1,137 @@
+import uuid
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+
+from pd_django_small.core.benchmarks.partitions import compare_pruning
+from pd_django_small.core.partitioning import (
+    PartitioningError,
+    backup_table,
+    is_partitioned,
+    partitioned_models,
+    prepare_partitioned,
+    swap_partitioned,
+    table_kind,
+)
+from pd_django_small.organizations.models import WorkspaceSummary
+from pd_django_small.workspaces.imports import import_memberships
+from pd_django_small.workspaces.models import Membership, Workspace
+
+
+@pytest.fixture
+def memberships(user_factory, workspace_factory, membership_factory):
+    users = user_factory.create_batch(4)
+    organizations = [uuid.uuid4() for _ in range(3)]
+    workspaces = [
+        workspace_factory.create(owner=users[0].uuid, organization=organization)
+        for organization in organizations * 2
+    ]
+    return [
+        membership_factory.create(
+            workspace=workspace, user=user.uuid, is_active=workspace == workspaces[0]
+        )
+        for workspace in workspaces
+        for user in users
+    ]
+
+
+@pytest.mark.django_db
+def test_partition_tables(memberships, workspace_factory):
+    """Writes between prepare and swap are mirrored, swapped tables behave the same."""
+
+    # Arrange
+    for model, key in partitioned_models():
+        prepare_partitioned(model, key, partitions=4)
+    workspace = memberships[0].workspace
+    Workspace.objects.filter(pk=workspace.pk).update(name="Renamed")
+    memberships[-1].delete()
+    added = workspace_factory.create(owner=uuid.uuid4(), organization=uuid.uuid4())
+
+    # Act
+    call_command("partition_tables", "copy", "swap", stdout=StringIO())
+
+    # Assert
+    assert is_partitioned(Workspace) and is_partitioned(Membership)
+    assert table_kind(backup_table(Workspace)) == "r"
+    assert Workspace.objects.get(pk=workspace.pk).name == "Renamed"
+    assert Workspace.objects.count() == 7
+    assert Membership.objects.count() == len(memberships) - 1
+    assert WorkspaceSummary.objects.get(organization_id=added.organization)
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Membership.objects.create(
+            workspace=added, user=memberships[0].user, is_active=True
+        )
+
+    user = uuid.uuid4()
+    result = import_memberships(
+        StringIO(f"workspace,user\n{workspace.uuid},{user}\n{added.uuid},{user}\n")
+    )
+    assert (result.inserted, result.conflicts) == (1, 1)
+
+    added.delete()
+    assert not WorkspaceSummary.objects.get(
+        organization_id=added.organization
+    ).workspaces
+
+
+@pytest.mark.django_db
+def test_partition_tables_default_steps(memberships):
+    """All steps run without arguments, upsert() then refuses the tables."""
+
+    # Arrange
+    workspace = memberships[0].workspace
+
+    # Act
+    call_command("partition_tables", stdout=StringIO())
+
+    # Assert
+    assert is_partitioned(Workspace) and is_partitioned(Membership)
+    with pytest.raises(ValueError, match="partitioned"):
+        Workspace.objects.upsert(uuid=workspace.uuid, defaults={"name": "Renamed"})
+    renamed, created = Workspace.objects.update_or_create(
+        uuid=workspace.uuid, defaults={"name": "Renamed"}
+    )
+    assert (renamed.name, created) == ("Renamed", False)
+    assert Workspace.objects.count() == 6
+
+
+def test_partition_tables_unknown_step():
+    # Act & Assert
+    with pytest.raises(CommandError, match="Unknown steps merge"):
+        call_command("partition_tables", "copy", "merge", stdout=StringIO())
+
+
+@pytest.mark.django_db
+def test_swap_requires_copy(memberships):
+    """Swap before the rows are copied fails and leaves the table as it was."""
+
+    # Arrange
+    prepare_partitioned(Workspace, "organization")
+
+    # Act
+    with pytest.raises(PartitioningError):
+        swap_partitioned(Workspace, "organization")
+
+    # Assert
+    assert table_kind(Workspace._meta.db_table) == "r"
+    assert Workspace.objects.count() == 6
+
+
+@pytest.mark.django_db
+def test_compare_pruning(memberships):
+    """Per-organization and per-workspace queries read one partition."""
+
+    # Arrange
+    call_command("partition_tables", "prepare", "copy", stdout=StringIO())
+
+    # Act
+    report = compare_pruning(samples=3, repeat=1)
+
+    # Assert
+    assert report["organization_workspaces"].scanned == 1
+    assert report["organization_workspaces"].partitions == 16
+    assert report["workspace_memberships"].scanned == 1
+    assert report["organization_memberships"].partitions == 32
@@ -0,0 +1,87 @@
+import pytest
+from django.db import connection
+
+from pd_django_small.core.db.backends.postgresql_pool.base import DatabaseWrapper
+
+
+@pytest.fixture
+def pooled_connection():
+    wrapper = DatabaseWrapper(
+        {
+            **connection.settings_dict,
+            "OPTIONS": {"pool": {"min_size": 1, "max_size": 1}},
+        },
+        alias="pool_test",
+    )
+    yield wrapper
+    wrapper.close()
+    wrapper.close_pool()
+
+
+def backend_pid(wrapper) -> int:
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT pg_backend_pid()")
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_pooled_connection_is_reused(pooled_connection):
+    """Closing a connection returns it to the pool, the next connect reuses it."""
+
+    # Arrange
+    pid = backend_pid(pooled_connection)
+    pooled_connection.close()
+
+    # Act
+    reused_pid = backend_pid(pooled_connection)
+
+    # Assert
+    assert reused_pid == pid
+    stats = pooled_connection.pool_stats()
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 1
+    assert stats["connections"] == 1
+
+
+@pytest.mark.django_db
+def test_pooled_connection_open_transaction_rolled_back(pooled_connection):
+    """Connection closed inside a transaction goes back to the pool rolled back."""
+
+    # Arrange
+    pooled_connection.set_autocommit(False)
+    with pooled_connection.cursor() as cursor:
+        cursor.execute("CREATE TEMPORARY TABLE pool_test (id int)")
+    pooled_connection.close()
+
+    # Act
+    with pooled_connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('pg_temp.pool_test')")
+        table = cursor.fetchone()[0]
+
+    # Assert
+    assert table is None
+    assert pooled_connection.get_autocommit()
+
+
+@pytest.mark.django_db
+def test_pooled_connection_session_reset(pooled_connection):
+    """Session settings and temporary tables do not leak to the next checkout."""
+
+    # Arrange
+    with pooled_connection.cursor() as cursor:
+        cursor.execute("SET statement_timeout = 1234")
+        cursor.execute("CREATE TEMPORARY TABLE pool_test (id int)")
+    pid = backend_pid(pooled_connection)
+    pooled_connection.close()
+
+    # Act
+    with pooled_connection.cursor() as cursor:
+        cursor.execute("SHOW statement_timeout")
+        statement_timeout = cursor.fetchone()[0]
+        cursor.execute("SELECT to_regclass('pg_temp.pool_test')")
+        table = cursor.fetchone()[0]
+
+    # Assert
+    assert backend_pid(pooled_connection) == pid
+    assert statement_timeout == "0"
+    assert table is None
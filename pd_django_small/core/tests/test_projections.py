@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from pd_django_small.core.benchmarks.projections import compare_projections
+from pd_django_small.organizations.models import Organization
+from pd_django_small.organizations.projections import OrganizationRow
+from pd_django_small.workspaces.models import Workspace
+from pd_django_small.workspaces.pagination import KeysetPaginator
+from pd_django_small.workspaces.projections import WorkspaceRow
+
+
+class OwnerSlots:
+    __slots__ = ("uuid", "owner")
+    _fields = __slots__
+
+    def __init__(self, uuid, owner):
+        self.uuid = uuid
+        self.owner = owner
+
+
+@pytest.fixture
+def workspaces(workspace_factory):
+    return workspace_factory.create_batch(
+        5, owner=uuid.uuid4(), organization=uuid.uuid4()
+    )
+
+
+@pytest.mark.django_db
+def test_project(workspaces):
+    # Act
+    rows = list(Workspace.objects.project(WorkspaceRow).order_by("created_at", "uuid"))
+    slots = list(
+        Workspace.objects.order_by("created_at", "uuid")
+        .project(OwnerSlots)
+        .filter(uuid__in=[w.uuid for w in workspaces[:2]])
+    )
+
+    # Assert
+    assert [type(row) for row in rows] == [WorkspaceRow] * 5
+    assert rows == [
+        tuple(getattr(workspace, field) for field in WorkspaceRow._fields)
+        for workspace in workspaces
+    ]
+    assert [(row.uuid, row.owner) for row in slots] == [
+        (workspace.uuid, workspace.owner) for workspace in workspaces[:2]
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_project_async_paginator(workspaces):
+    # Arrange
+    paginator = KeysetPaginator(
+        per_page=3, organization=workspaces[0].organization, projection=WorkspaceRow
+    )
+
+    # Act
+    page1 = async_to_sync(paginator.apage)()
+    page2 = paginator.page(page1.next_cursor)
+
+    # Assert
+    assert [row.uuid for row in page1.items + page2.items] == [
+        workspace.uuid for workspace in workspaces
+    ]
+    assert isinstance(page2.items[0], WorkspaceRow)
+
+
+@pytest.mark.django_db
+def test_compare_projections(organization_factory):
+    # Arrange
+    organization_factory.create_batch(20, owner=uuid.uuid4())
+
+    # Act
+    report = compare_projections(
+        Organization.objects.order_by("uuid"), OrganizationRow, rows=10, repeat=1
+    )
+
+    # Assert
+    assert {name: timing.rows for name, timing in report.items()} == {
+        "instances": 10,
+        "values_list": 10,
+        "projection": 10,
+    }
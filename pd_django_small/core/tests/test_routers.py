@@ -0,0 +1,242 @@
+import math
+import os
+import time
+
+import pytest
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from pd_django_small.core.db.backends.postgresql_pool.base import DatabaseWrapper
+from pd_django_small.core.db.routers import (
+    ReplicaRouter,
+    current_routing_state,
+    pin_to_primary,
+    replication_lag,
+    routing_scope,
+)
+from pd_django_small.core.middleware import ReplicaPinningMiddleware
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Membership
+
+# "host:port" of a streaming replica of the test database server, the
+# replication tests are skipped without one.
+TEST_REPLICA = os.getenv("TEST_REPLICA_HOST")
+
+
+def replica_router(lags: dict, **config) -> ReplicaRouter:
+    router = ReplicaRouter({"REPLICAS": list(lags), **config})
+    router.monitor.measure = lags.get
+    return router
+
+
+def test_reads_go_to_healthy_replicas():
+    """Replicas lagging more than MAX_LAG_SECONDS are skipped, writes go to default."""
+
+    # Arrange
+    router = replica_router(
+        {"replica1": 0.1, "replica2": 10.0, "replica3": math.inf}, MAX_LAG_SECONDS=1
+    )
+
+    # Act
+    with routing_scope():
+        read_dbs = {router.db_for_read(User) for _ in range(20)}
+
+    # Assert
+    assert read_dbs == {"replica1"}
+    assert router.db_for_write(User) == "default"
+
+
+def test_lagging_replicas_fall_back_to_primary():
+    """Lag is measured once per interval, reads go to default while every replica lags."""
+
+    # Arrange
+    measured = []
+    router = replica_router({"replica1": 5.0}, MAX_LAG_SECONDS=1)
+    router.monitor.measure = lambda alias: measured.append(alias) or 5.0
+
+    # Act
+    with routing_scope():
+        read_dbs = {router.db_for_read(User) for _ in range(10)}
+
+    # Assert
+    assert read_dbs == {"default"}
+    assert measured == ["replica1"]
+
+
+def test_write_pins_reads_to_primary():
+    """Reads after a write stay on default for PIN_SECONDS, then go back to replicas."""
+
+    # Arrange
+    router = replica_router({"replica1": 0.0}, PIN_SECONDS=5)
+
+    with routing_scope() as state:
+        before = router.db_for_read(User)
+
+        # Act
+        router.db_for_write(User)
+        after_write = router.db_for_read(User)
+        state.last_write -= 5
+        after_window = router.db_for_read(User)
+
+    # Assert
+    assert (before, after_write, after_window) == ("replica1", "default", "replica1")
+
+
+def test_pin_to_primary():
+    """Reads in pin_to_primary() go to default, writes count for the outer scope."""
+
+    # Arrange
+    router = replica_router({"replica1": 0.0})
+
+    with routing_scope() as state:
+        # Act
+        with pin_to_primary():
+            pinned = router.db_for_read(User)
+        unpinned = router.db_for_read(User)
+
+    # Assert
+    assert (pinned, unpinned) == ("default", "replica1")
+    assert not state.wrote
+
+
+@pytest.mark.django_db
+def test_transaction_reads_primary():
+    """Reads inside a transaction on default see its uncommitted writes."""
+
+    # Arrange
+    router = replica_router({"replica1": 0.0})
+
+    # Act
+    with routing_scope():
+        read_db = router.db_for_read(User)
+
+    # Assert
+    assert connection.in_atomic_block
+    assert read_db == "default"
+
+
+def test_replicas_are_not_migrated():
+    # Arrange
+    router = replica_router({"replica1": 0.0})
+
+    # Act / Assert
+    assert router.allow_migrate("replica1", "users") is False
+    assert router.allow_migrate("default", "users") is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_manager_writes_go_to_primary(user_factory, workspace_factory):
+    """Raw SQL writes of managers and querysets use the write database."""
+
+    # Arrange
+    user = user_factory.create()
+    workspace = workspace_factory.create(owner=user.uuid, organization=user.uuid)
+    # "replica1" is not a configured database, a write routed there fails.
+    router = replica_router({"replica1": 0.0})
+
+    with override_settings(DATABASE_ROUTERS=[router]):
+        with routing_scope():
+            read_dbs = (User.objects.db, Membership.objects.db)
+
+        # Act
+        with routing_scope():
+            upserted = User.objects.bulk_upsert(["new@example.com", user.email])
+            _, created = User.objects.upsert(
+                email="upsert@example.com",
+                create_defaults={"username": "upsert", "first_name": "New"},
+            )
+            switched = Membership.objects.switch_active({user.uuid: workspace.uuid})
+
+    # Assert
+    assert read_dbs == ("replica1", "replica1")
+    assert upserted == (1, 1)
+    assert created is True
+    assert switched.created == 1
+
+
+@pytest.mark.django_db
+def test_pinning_middleware(user_factory):
+    """A write sets the pin cookie, requests carrying a fresh one are pinned."""
+
+    # Arrange
+    states = []
+
+    def view(request):
+        states.append(current_routing_state())
+        if request.method == "POST":
+            user_factory.create()
+        return HttpResponse()
+
+    middleware = ReplicaPinningMiddleware(view)
+    factory = RequestFactory()
+
+    # Act
+    written = middleware(factory.post("/"))
+    cookie = written.cookies["primary_pin"]
+    factory.cookies["primary_pin"] = cookie.value
+    pinned = middleware(factory.get("/"))
+    factory.cookies["primary_pin"] = f"{time.time() - 1:.3f}"
+    expired = middleware(factory.get("/"))
+
+    # Assert
+    assert cookie["max-age"] == 5
+    assert [state.pinned for state in states] == [True, True, False]
+    assert "primary_pin" not in pinned.cookies
+    assert "primary_pin" not in expired.cookies
+
+
+@pytest.fixture
+def real_replica():
+    host, _, port = TEST_REPLICA.partition(":")
+    wrapper = DatabaseWrapper(
+        {**connection.settings_dict, "HOST": host, "PORT": port or 5432},
+        alias="real_replica",
+    )
+    connections["real_replica"] = wrapper
+    yield wrapper
+    del connections["real_replica"]
+    wrapper.close()
+    wrapper.close_pool()
+
+
+def wait_for(condition, timeout: float = 10) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+@pytest.mark.skipif(TEST_REPLICA is None, reason="TEST_REPLICA_HOST is not set")
+@pytest.mark.django_db(transaction=True)
+def test_replica_lag_fallback(real_replica, user_factory):
+    """Paused replay makes the replica lag, reads go to default until it catches up."""
+
+    # Arrange
+    router = ReplicaRouter(
+        {"REPLICAS": ["real_replica"], "MAX_LAG_SECONDS": 0.5, "LAG_CHECK_INTERVAL": 0}
+    )
+    with real_replica.cursor() as cursor:
+        cursor.execute("SELECT pg_wal_replay_pause()")
+
+    try:
+        # Act
+        user = user_factory.create()
+        time.sleep(0.6)
+        with routing_scope():
+            lagging_db = router.db_for_read(User)
+            lag = router.monitor.lag("real_replica")
+    finally:
+        with real_replica.cursor() as cursor:
+            cursor.execute("SELECT pg_wal_replay_resume()")
+
+    # Assert
+    assert replication_lag(connection) == 0
+    assert lag > 0.5
+    assert lagging_db == "default"
+    assert wait_for(lambda: router.monitor.lag("real_replica") <= 0.5)
+    with routing_scope():
+        assert router.db_for_read(User) == "real_replica"
+        assert User.objects.using("real_replica").filter(pk=user.pk).exists()
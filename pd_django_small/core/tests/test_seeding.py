@@ -0,0 +1,80 @@
+import math
+
+import pytest
+from django.db.models import Count
+
+from pd_django_small.core.seeding import (
+    SeedConfig,
+    _coprime_step,
+    generate_memberships,
+    generate_users,
+    seed,
+)
+from pd_django_small.organizations.models import Organization, WorkspaceSummary
+from pd_django_small.subscriptions.models import Subscription
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Membership, Workspace
+
+CONFIG = SeedConfig(users=60, organizations=10, workspaces=40)
+
+
+@pytest.mark.parametrize("size", [60, 1_000_003, 3_000_009, 15_000_045])
+def test_coprime_step(size):
+    """Membership users step walks every user before it repeats one."""
+
+    # Act
+    step = _coprime_step(size)
+
+    # Assert
+    assert math.gcd(size, step) == 1
+
+
+def test_generators_are_deterministic():
+    """Same seed produces the same rows, different seed different ones."""
+
+    # Act
+    users = list(generate_users(CONFIG))
+
+    # Assert
+    assert users == list(generate_users(CONFIG))
+    assert users != list(generate_users(SeedConfig(seed=1, users=60)))
+
+
+def test_generate_memberships_one_active_per_user():
+    """Every user gets at most one active membership."""
+
+    # Act
+    active_users = [
+        user for _, _, user, is_active, *_ in generate_memberships(CONFIG) if is_active
+    ]
+
+    # Assert
+    assert len(active_users) == len(set(active_users)) == CONFIG.users
+
+
+@pytest.mark.django_db
+def test_seed():
+    """Rows are loaded with COPY and workspaces summary is rebuilt."""
+
+    # Act
+    counts = seed(CONFIG)
+
+    # Assert
+    assert counts[User._meta.db_table] == User.objects.all_with_removed().count() == 60
+    assert Organization.objects.count() == 10
+    assert Subscription.objects.count() == counts[Subscription._meta.db_table]
+    assert Workspace.objects.all_with_removed().count() == 40
+    assert Membership.objects.all_with_removed().count() == 80
+    assert (
+        not Workspace.objects.all_with_removed()
+        .exclude(organization__in=Organization.objects.values("uuid"))
+        .exists()
+    )
+    assert sorted(
+        WorkspaceSummary.objects.values_list("workspaces_count", flat=True)
+    ) == sorted(
+        Workspace.objects.all_with_removed()
+        .values("organization")
+        .annotate(count=Count("*"))
+        .values_list("count", flat=True)
+    )
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+from django.urls import resolve
+
+from pd_django_small.core.benchmarks.startup import (
+    ENTRYPOINTS,
+    parse_importtime,
+    profile_startup,
+    startup_budget,
+)
+
+API_EXCLUDED_PACKAGES = (
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+)
+# Wall time and RSS depend on the machine, the budget is only checked on request.
+CHECK_STARTUP_BUDGET = os.getenv("CHECK_STARTUP_BUDGET") == "1"
+
+
+def test_parse_importtime():
+    # Arrange
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     django.utils.version",
+            "import time:      1500 |       1620 |   django",
+            "unrelated warning",
+        ]
+    )
+
+    # Act
+    modules = parse_importtime(output)
+
+    # Assert
+    assert [(m.module, m.self_ms, m.cumulative_ms, m.depth) for m in modules] == [
+        ("django.utils.version", 0.12, 0.12, 2),
+        ("django", 1.5, 1.62, 1),
+    ]
+
+
+@pytest.mark.skipif(not CHECK_STARTUP_BUDGET, reason="CHECK_STARTUP_BUDGET is not set")
+@pytest.mark.parametrize("entrypoint", ENTRYPOINTS)
+def test_startup_budget(entrypoint):
+    """API workers start within the configured import time and peak RSS budget."""
+
+    # Arrange
+    budget = startup_budget()
+
+    # Act
+    profile = profile_startup(entrypoint, budget["SETTINGS_MODULE"])
+
+    # Assert
+    slowest = ", ".join(f"{m.module} {m.self_ms:.1f}ms" for m in profile.slowest(10))
+    assert profile.seconds <= budget["IMPORT_SECONDS"], slowest
+    assert profile.max_rss_mib <= budget["MAX_RSS_MIB"], slowest
+    assert not [
+        m.module for m in profile.modules if m.module.startswith(API_EXCLUDED_PACKAGES)
+    ]
+
+
+def test_api_urls():
+    # Act
+    match = resolve("/workspaces/", urlconf="pd_django_small.urls_api")
+
+    # Assert
+    assert match.view_name == "workspaces:list"
@@ -0,0 +1,113 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pd_django_small.organizations.models import Organization
+from pd_django_small.subscriptions.cache import get_active_subscription
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+from pd_django_small.users.models import User
+from pd_django_small.workspaces.models import Workspace
+
+
+@pytest.mark.django_db
+def test_user_upsert(user_factory):
+    """Removed user is reactivated in one statement, first call creates."""
+
+    # Arrange
+    email = "admin@example.com"
+    existing = user_factory.create(
+        email=email, first_name="John", is_active=False, is_removed=True
+    )
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        user, created = User.objects.upsert(
+            email=email,
+            defaults={"is_active": True, "is_removed": False},
+            create_defaults={"username": email, "first_name": "New"},
+        )
+    new_user, new_created = User.objects.upsert(
+        email="new@Example.com",
+        defaults={"is_active": True},
+        create_defaults={"username": "new", "first_name": "New"},
+    )
+
+    # Assert
+    assert len(context.captured_queries) == 1
+    assert created is False
+    assert (user.pk, user.first_name, user.is_active, user.is_removed) == (
+        existing.pk,
+        "John",
+        True,
+        False,
+    )
+    assert user.updated_at > existing.updated_at
+    assert new_created is True
+    assert (new_user.first_name, new_user.email_domain) == ("New", "example.com")
+    assert User.objects.get(pk=new_user.pk).username == "new"
+
+
+@pytest.mark.django_db
+def test_organization_and_workspace_upsert(user_factory):
+    # Arrange
+    owner = user_factory.create()
+    organization_uuid = uuid.uuid4()
+
+    # Act
+    organization, created = Organization.objects.upsert(
+        uuid=organization_uuid, defaults={"name": "Acme", "owner": owner.uuid}
+    )
+    renamed, renamed_created = Organization.objects.upsert(
+        uuid=organization_uuid,
+        defaults={"name": "Acme Inc"},
+        create_defaults={"name": "Acme Inc", "owner": uuid.uuid4()},
+    )
+    workspace, workspace_created = Workspace.objects.upsert(
+        uuid=uuid.uuid4(),
+        defaults={
+            "name": "Docs",
+            "owner": owner.uuid,
+            "organization": organization.uuid,
+        },
+    )
+
+    # Assert
+    assert (created, renamed_created, workspace_created) == (True, False, True)
+    assert (renamed.name, renamed.owner) == ("Acme Inc", owner.uuid)
+    assert Workspace.objects.get().name == "Docs"
+
+
+@pytest.mark.django_db
+def test_subscription_upsert_sends_post_save(user_factory, organization_factory):
+    """Subscription cache is invalidated through post_save, state_rank is returned."""
+
+    # Arrange
+    organization = organization_factory.create(owner=user_factory.create().uuid)
+    defaults = {
+        "state": SubscriptionState.ACTIVE.value,
+        "plan": "team",
+        "price": Decimal("10.00"),
+        "quantity": 1,
+    }
+    Subscription.objects.upsert(organization=organization, defaults=defaults)
+    assert get_active_subscription(organization.uuid).price == Decimal("10.00")
+
+    # Act
+    subscription, created = Subscription.objects.upsert(
+        organization=organization,
+        defaults={**defaults, "state": SubscriptionState.EXPIRED.value},
+    )
+
+    # Assert
+    assert created is False
+    assert subscription.state_rank == SubscriptionState.EXPIRED.rank
+    assert get_active_subscription(organization.uuid) is None
+
+
+def test_upsert_requires_unique_lookup():
+    # Act & Assert
+    with pytest.raises(ValueError, match="unique"):
+        User.objects.upsert(first_name="John")
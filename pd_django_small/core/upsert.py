@@ -0,0 +1,127 @@
+from typing import Any, Mapping, Optional
+
+from django.db import connections, models
+from django.db.models.signals import post_save
+
+from pd_django_small.core.partitioning import PARTITIONED_MODELS, is_partitioned
+
+
+class UpsertMixin:
+    """QuerySet mixin, update_or_create() in a single INSERT ... ON CONFLICT statement."""
+
+    def upsert(
+        self,
+        defaults: Optional[Mapping[str, Any]] = None,
+        create_defaults: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> tuple[models.Model, bool]:
+        """
+        Same as update_or_create(), kwargs are exact values of a unique field or
+        constraint (the ON CONFLICT target), "defaults" are set on insert and update,
+        "create_defaults" (defaults if not given) only on insert. The insert
+        values must make a valid row even when the row exists, NOT NULL is
+        checked before the conflict.
+
+        The statement locks the row, auto_now fields are refreshed on update and
+        post_save is sent, like save() does. The conflicting row is updated even
+        when a default manager filter (e.g. removed rows) would have hidden it.
+        """
+
+        defaults = dict(defaults or {})
+        insert_values = {
+            **kwargs,
+            **(defaults if create_defaults is None else create_defaults),
+        }
+
+        meta = self.model._meta
+        target = [meta.get_field(name) for name in kwargs]
+        # Route to the write database, as update_or_create() does.
+        self._for_write = True
+        self._check_conflict_target(target)
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+
+        instance = self.model(**insert_values)
+        update_instance = self.model(**defaults)
+        fields = meta.concrete_fields
+        assignments, update_params = [], []
+        for name in defaults:
+            field = meta.get_field(name)
+            if name not in kwargs:
+                assignments.append(f"{qn(field.column)} = %s")
+                update_params.append(
+                    field.get_db_prep_save(
+                        getattr(update_instance, field.attname), connection
+                    )
+                )
+        assignments += [
+            f"{qn(f.column)} = EXCLUDED.{qn(f.column)}"
+            for f in fields
+            if getattr(f, "auto_now", False)
+        ]
+        # An empty update still returns (and locks) the conflicting row.
+        if not assignments:
+            assignments.append(
+                f"{qn(target[0].column)} = EXCLUDED.{qn(target[0].column)}"
+            )
+
+        sql = (
+            f"INSERT INTO {qn(meta.db_table)} "
+            f"({', '.join(qn(f.column) for f in fields)}) "
+            f"VALUES ({', '.join(['%s'] * len(fields))}) "
+            f"ON CONFLICT ({', '.join(qn(f.column) for f in target)}) "
+            f"DO UPDATE SET {', '.join(assignments)} "
+            f"RETURNING {', '.join(qn(f.column) for f in fields)}, (xmax = 0)"
+        )
+        params = [
+            f.get_db_prep_save(f.pre_save(instance, add=True), connection)
+            for f in fields
+        ] + update_params
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            *values, created = cursor.fetchone()
+
+        values = [
+            f.from_db_value(value, None, connection)
+            if hasattr(f, "from_db_value")
+            else value
+            for f, value in zip(fields, values)
+        ]
+        instance = self.model.from_db(self.db, [f.attname for f in fields], values)
+        post_save.send(
+            sender=self.model,
+            instance=instance,
+            created=created,
+            update_fields=None,
+            raw=False,
+            using=self.db,
+        )
+        return instance, created
+
+    def _check_conflict_target(self, target: list) -> None:
+        meta = self.model._meta
+        columns = {f.column for f in target}
+        unique_sets = [{f.column} for f in meta.concrete_fields if f.unique]
+        unique_sets += [
+            {meta.get_field(name).column for name in fields}
+            for fields in meta.unique_together
+        ]
+        unique_sets += [
+            {meta.get_field(name).column for name in constraint.fields}
+            for constraint in meta.total_unique_constraints
+        ]
+
+        # A hash partitioned table (core.partitioning) has no unique index
+        # without the partition key and RETURNING can not read its xmax, the
+        # models which may be partitioned pay a catalog lookup for the check.
+        if meta.label in PARTITIONED_MODELS and is_partitioned(self.model, self.db):
+            raise ValueError(
+                f"upsert() does not support the partitioned {meta.db_table} table, "
+                "use update_or_create()"
+            )
+
+        if columns not in unique_sets:
+            raise ValueError(
+                f"upsert() lookups {', '.join(sorted(columns))} must match a unique "
+                f"field or constraint of {meta.label}"
+            )
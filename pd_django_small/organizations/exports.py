@@ -0,0 +1,115 @@
+import csv
+import json
+from typing import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from pd_django_small.core.iterators import batched
+from pd_django_small.organizations.models import Organization
+from pd_django_small.workspaces.models import Workspace
+
+EXPORT_CHUNK_SIZE = 2000
+CSV_HEADER = (
+    "uuid",
+    "name",
+    "owner",
+    "subscription_state",
+    "subscription_plan",
+    "subscription_price",
+    "subscription_quantity",
+    "workspaces_count",
+    "workspaces",
+)
+
+
+def iter_organizations(chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Organizations with their subscription and workspaces, read through a
+    server-side cursor; workspaces are fetched with one query per chunk.
+    """
+
+    organizations = (
+        Organization.objects.select_related("subscription")
+        .order_by("uuid")
+        .iterator(chunk_size=chunk_size)
+    )
+    for chunk in batched(organizations, chunk_size):
+        workspaces = {organization.uuid: [] for organization in chunk}
+        for workspace in (
+            Workspace.objects.all_with_removed()
+            .filter(organization__in=workspaces)
+            .order_by("organization", "created_at", "uuid")
+            .values("uuid", "organization", "name", "is_removed", "created_at")
+            .iterator(chunk_size=chunk_size)
+        ):
+            workspaces[workspace.pop("organization")].append(workspace)
+
+        for organization in chunk:
+            yield _organization_record(organization, workspaces[organization.uuid])
+
+
+def _organization_record(organization: Organization, workspaces: list) -> dict:
+    try:
+        subscription = organization.subscription
+    except Organization.subscription.RelatedObjectDoesNotExist:
+        subscription = None
+
+    return {
+        "uuid": organization.uuid,
+        "name": organization.name,
+        "owner": organization.owner,
+        "subscription": subscription
+        and {
+            "uuid": subscription.uuid,
+            "state": subscription.state,
+            "plan": subscription.plan,
+            "price": subscription.price,
+            "quantity": subscription.quantity,
+        },
+        "workspaces": workspaces,
+    }
+
+
+def to_ndjson(records: Iterable[dict]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder()
+    for record in records:
+        yield encoder.encode(record) + "\n"
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def to_csv(records: Iterable[dict]) -> Iterator[str]:
+    """One line per organization, workspaces are a json list of uuids."""
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_HEADER)
+    for record in records:
+        subscription = record["subscription"] or {}
+        yield writer.writerow(
+            (
+                record["uuid"],
+                record["name"],
+                record["owner"],
+                subscription.get("state"),
+                subscription.get("plan"),
+                subscription.get("price"),
+                subscription.get("quantity"),
+                len(record["workspaces"]),
+                json.dumps(
+                    [str(workspace["uuid"]) for workspace in record["workspaces"]]
+                ),
+            )
+        )
+
+
+SERIALIZERS = {
+    "ndjson": to_ndjson,
+    "csv": to_csv,
+}
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.organizations.rollups import rebuild_workspace_summary
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-organization workspaces summary from workspaces table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to rebuild. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        rows = rebuild_workspace_summary(using=options["database"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt workspaces summary for {rows} organizations.")
+        )
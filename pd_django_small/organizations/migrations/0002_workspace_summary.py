@@ -0,0 +1,124 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:40
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+SYNC_WORKSPACE_SUMMARY_SQL = """
+CREATE FUNCTION organizations_workspace_summary_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE organizations_workspacesummary
+        SET workspaces_count = workspaces_count - 1,
+            workspaces = array_remove(workspaces, OLD.uuid)
+        WHERE organization_id = OLD.organization;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO organizations_workspacesummary AS summary
+            (organization_id, workspaces_count, workspaces)
+        VALUES (NEW.organization, 1, '{}')
+        ON CONFLICT (organization_id) DO UPDATE
+        SET workspaces_count = summary.workspaces_count + 1;
+
+        -- The summary row is locked from here on, so the statements below see
+        -- every committed workspace of the organization. workspaces is kept
+        -- in (created_at, uuid) order like the full rebuild: appended to when
+        -- NEW is the latest live workspace, rebuilt otherwise (e.g. restored).
+        IF NOT NEW.is_removed THEN
+            IF EXISTS (
+                SELECT FROM workspaces_workspace
+                WHERE organization = NEW.organization
+                    AND NOT is_removed
+                    AND (created_at, uuid) > (NEW.created_at, NEW.uuid)
+            ) THEN
+                UPDATE organizations_workspacesummary
+                SET workspaces = ARRAY(
+                    SELECT uuid FROM workspaces_workspace
+                    WHERE organization = NEW.organization AND NOT is_removed
+                    ORDER BY created_at, uuid
+                )
+                WHERE organization_id = NEW.organization;
+            ELSE
+                UPDATE organizations_workspacesummary
+                SET workspaces = array_append(workspaces, NEW.uuid)
+                WHERE organization_id = NEW.organization;
+            END IF;
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER organizations_workspace_summary_sync
+AFTER INSERT OR DELETE ON workspaces_workspace
+FOR EACH ROW EXECUTE FUNCTION organizations_workspace_summary_sync();
+
+CREATE TRIGGER organizations_workspace_summary_sync_update
+AFTER UPDATE OF uuid, organization, is_removed ON workspaces_workspace
+FOR EACH ROW
+WHEN (
+    OLD.uuid IS DISTINCT FROM NEW.uuid
+    OR OLD.organization IS DISTINCT FROM NEW.organization
+    OR OLD.is_removed IS DISTINCT FROM NEW.is_removed
+)
+EXECUTE FUNCTION organizations_workspace_summary_sync();
+
+INSERT INTO organizations_workspacesummary (organization_id, workspaces_count, workspaces)
+SELECT
+    organization,
+    count(*),
+    coalesce(
+        array_agg(uuid ORDER BY created_at, uuid) FILTER (WHERE NOT is_removed),
+        '{}'
+    )
+FROM workspaces_workspace
+GROUP BY organization;
+"""
+
+DROP_WORKSPACE_SUMMARY_SYNC_SQL = """
+DROP TRIGGER organizations_workspace_summary_sync_update ON workspaces_workspace;
+DROP TRIGGER organizations_workspace_summary_sync ON workspaces_workspace;
+DROP FUNCTION organizations_workspace_summary_sync();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0001_initial"),
+        ("workspaces", "0002_remove_workspace_id_workspace_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkspaceSummary",
+            fields=[
+                (
+                    "organization",
+                    models.OneToOneField(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="workspace_summary",
+                        serialize=False,
+                        to="organizations.organization",
+                    ),
+                ),
+                ("workspaces_count", models.IntegerField(default=0)),
+                (
+                    "workspaces",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.UUIDField(),
+                        default=list,
+                        size=None,
+                        verbose_name="not removed workspaces uuid",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunSQL(
+            SYNC_WORKSPACE_SUMMARY_SQL,
+            DROP_WORKSPACE_SUMMARY_SYNC_SQL,
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("organizations", "0002_workspace_summary"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="organization",
+            index=models.Index(fields=["owner"], name="organization_owner_idx"),
+        ),
+    ]
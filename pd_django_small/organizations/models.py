@@ -1,6 +1,9 @@
 import uuid
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
+from pd_django_small.organizations.querysets import OrganizationQuerySet
+
 
 class Organization(models.Model):
     uuid = models.UUIDField(
@@ -13,3 +16,31 @@ class Organization(models.Model):
     owner = models.UUIDField(
         verbose_name="user uuid"
     )
+
+    objects = OrganizationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner"], name="organization_owner_idx"),
+        ]
+
+
+class WorkspaceSummary(models.Model):
+    """
+    Per-organization workspaces rollup, kept up to date by the
+    "organizations_workspace_summary_sync" trigger on workspaces_workspace.
+    """
+
+    organization = models.OneToOneField(
+        Organization,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_constraint=False,
+        related_name="workspace_summary",
+    )
+    workspaces_count = models.IntegerField(default=0)
+    workspaces = ArrayField(
+        models.UUIDField(),
+        default=list,
+        verbose_name="not removed workspaces uuid",
+    )
@@ -0,0 +1,10 @@
+import uuid
+from typing import NamedTuple
+
+
+class OrganizationRow(NamedTuple):
+    """Read-only Organization row, see ProjectionMixin.project()."""
+
+    uuid: uuid.UUID
+    name: str
+    owner: uuid.UUID
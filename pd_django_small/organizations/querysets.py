@@ -0,0 +1,26 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce
+
+from pd_django_small.core.loaders import SoftReferenceQuerySet
+from pd_django_small.core.projections import ProjectionMixin
+from pd_django_small.core.upsert import UpsertMixin
+
+
+class OrganizationQuerySet(ProjectionMixin, UpsertMixin, SoftReferenceQuerySet):
+    soft_references = {"owner": "users.User"}
+
+    def with_workspace_summary(self):
+        """
+        Annotate total number of workspaces and not removed workspaces uuid
+        from the WorkspaceSummary rollup (one primary key lookup per organization).
+        """
+
+        return self.annotate(
+            workspaces_count=Coalesce(F("workspace_summary__workspaces_count"), 0),
+            workspaces=Coalesce(
+                F("workspace_summary__workspaces"),
+                Value([], output_field=ArrayField(models.UUIDField())),
+            ),
+        )
@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+
+from django.db import connections, transaction
+
+from pd_django_small.organizations.models import WorkspaceSummary
+from pd_django_small.workspaces.models import Workspace
+
+WORKSPACE_SUMMARY_TRIGGER = "organizations_workspace_summary_sync"
+
+
+def rebuild_workspace_summary(using: str = "default") -> int:
+    """
+    Rebuild WorkspaceSummary from scratch, returns number of summary rows.
+
+    Workspaces are locked against writes for the duration of the rebuild,
+    so the incremental trigger can not interleave with it.
+    """
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    summary_table = qn(WorkspaceSummary._meta.db_table)
+    workspace_table = qn(Workspace._meta.db_table)
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {workspace_table} IN SHARE MODE")
+        cursor.execute(f"DELETE FROM {summary_table}")
+        cursor.execute(
+            f"""
+            INSERT INTO {summary_table} (organization_id, workspaces_count, workspaces)
+            SELECT
+                organization,
+                count(*),
+                coalesce(
+                    array_agg(uuid ORDER BY created_at, uuid) FILTER (WHERE NOT is_removed),
+                    '{{}}'
+                )
+            FROM {workspace_table}
+            GROUP BY organization
+            """
+        )
+        return cursor.rowcount
+
+
+@contextmanager
+def deferred_workspace_summary(using: str = "default"):
+    """
+    Skip incremental summary maintenance for workspaces inserted or deleted
+    inside the block and rebuild the summary once on exit, for bulk loads.
+    """
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    workspace_table = qn(Workspace._meta.db_table)
+    trigger = qn(WORKSPACE_SUMMARY_TRIGGER)
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {workspace_table} DISABLE TRIGGER {trigger}")
+        yield
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {workspace_table} ENABLE TRIGGER {trigger}")
+        rebuild_workspace_summary(using=using)
@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+
+import pytest
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from django.urls import reverse
+
+from pd_django_small.organizations.exports import iter_organizations
+from pd_django_small.subscriptions.models import SubscriptionState
+
+
+@pytest.fixture
+def organizations(
+    organization_factory, workspace_factory, user_factory, subscription_factory
+):
+    owner1, owner2 = user_factory.create_batch(2)
+    organization1 = organization_factory.create(owner=owner1.uuid)
+    subscription_factory.create(
+        organization=organization1, state=SubscriptionState.ACTIVE.value, price=99
+    )
+    workspace1, workspace2 = workspace_factory.create_batch(
+        2, owner=owner1.uuid, organization=organization1.uuid
+    )
+    organization2 = organization_factory.create(owner=owner2.uuid)
+    return (organization1, [workspace1, workspace2]), (organization2, [])
+
+
+@pytest.mark.django_db
+def test_iter_organizations(organizations):
+    """Each organization comes with its subscription and workspaces in chunks."""
+
+    # Act
+    records = list(iter_organizations(chunk_size=1))
+
+    # Assert
+    expected = sorted(organizations, key=lambda item: item[0].uuid)
+    assert [record["uuid"] for record in records] == [o.uuid for o, _ in expected]
+    for record, (organization, workspaces) in zip(records, expected):
+        assert [w["uuid"] for w in record["workspaces"]] == [w.uuid for w in workspaces]
+        if workspaces:
+            assert record["subscription"]["price"] == 99
+        else:
+            assert record["subscription"] is None
+
+
+@pytest.fixture
+def staff_client(client, user_factory):
+    user = user_factory.create(is_staff=True)
+    user.user_permissions.add(Permission.objects.get(codename="view_organization"))
+    client.force_login(user)
+    return client
+
+
+@pytest.mark.django_db
+def test_export_organizations_view(staff_client, organizations):
+    """Export is streamed as NDJSON or CSV."""
+
+    # Act
+    ndjson = staff_client.get(reverse("organizations-export"), {"format": "ndjson"})
+    csv_response = staff_client.get(reverse("organizations-export"), {"format": "csv"})
+
+    # Assert
+    assert ndjson.streaming
+    assert ndjson["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(ndjson.streaming_content).decode().splitlines()
+    assert {json.loads(line)["uuid"] for line in lines} == {
+        str(organization.uuid) for organization, _ in organizations
+    }
+
+    rows = list(
+        csv.DictReader(io.StringIO(b"".join(csv_response.streaming_content).decode()))
+    )
+    assert sorted(int(row["workspaces_count"]) for row in rows) == [0, 2]
+
+
+@pytest.mark.django_db
+def test_export_organizations_view_unknown_format(staff_client):
+    # Act
+    response = staff_client.get(reverse("organizations-export"), {"format": "xml"})
+
+    # Assert
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_export_organizations_view_permission(client, user_factory, organizations):
+    """Anonymous users and users without view_organization are refused."""
+
+    # Act
+    anonymous = client.get(reverse("organizations-export"))
+    client.force_login(user_factory.create())
+    authenticated = client.get(reverse("organizations-export"))
+
+    # Assert
+    assert anonymous.status_code == authenticated.status_code == 403
+
+
+@pytest.mark.django_db
+def test_export_organizations_command(organizations):
+    """NDJSON on stdout, the stats on stderr."""
+
+    # Arrange
+    out, err = io.StringIO(), io.StringIO()
+
+    # Act
+    call_command("export_organizations", stdout=out, stderr=err)
+
+    # Assert
+    assert len(out.getvalue().splitlines()) == 2
+    assert err.getvalue().startswith("Exported 2 organizations in ")
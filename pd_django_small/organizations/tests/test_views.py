@@ -0,0 +1,46 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_organization_list(client, organization_factory, user_factory):
+    """Organizations are listed by uuid, page by page."""
+
+    # Arrange
+    owner = user_factory.create()
+    organizations = sorted(
+        organization_factory.create_batch(3, owner=owner.uuid),
+        key=lambda organization: organization.uuid,
+    )
+
+    # Act
+    page1 = client.get(reverse("organizations:list"), {"limit": 2, "count": 1}).json()
+    page2 = client.get(
+        reverse("organizations:list"), {"limit": 2, "after": page1["next"]}
+    ).json()
+
+    # Assert
+    assert page1["count"] == 3
+    assert "count" not in page2
+    assert [o["uuid"] for o in page1["results"] + page2["results"]] == [
+        str(organization.uuid) for organization in organizations
+    ]
+    assert page2["next"] is None
+
+
+@pytest.mark.django_db
+def test_organization_detail(client, organization_factory, user_factory):
+    # Arrange
+    organization = organization_factory.create(owner=user_factory.create().uuid)
+
+    # Act
+    response = client.get(reverse("organizations:detail", args=[organization.uuid]))
+    missing = client.get(reverse("organizations:detail", args=[organization.owner]))
+
+    # Assert
+    assert response.json() == {
+        "uuid": str(organization.uuid),
+        "name": organization.name,
+        "owner": str(organization.owner),
+    }
+    assert missing.status_code == 404
@@ -0,0 +1,114 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from pd_django_small.organizations.models import Organization, WorkspaceSummary
+from pd_django_small.workspaces.models import Workspace
+
+
+@pytest.mark.django_db
+def test_workspace_summary_incremental(
+    organization_factory, workspace_factory, user_factory
+):
+    """
+    Summary follows workspace create, delete, is_removed toggle and organization change.
+    """
+
+    # Arrange
+    owner1, owner2 = user_factory.create_batch(2)
+    organization1 = organization_factory.create(owner=owner1.uuid)
+    organization2 = organization_factory.create(owner=owner2.uuid)
+    organization3 = organization_factory.create(owner=owner2.uuid)
+
+    workspace1 = workspace_factory.create(
+        owner=owner1.uuid, organization=organization1.uuid
+    )
+    workspace2, workspace3, workspace4 = workspace_factory.create_batch(
+        3, owner=owner2.uuid, organization=organization2.uuid
+    )
+    workspace_factory.create(
+        owner=owner2.uuid, organization=organization2.uuid, is_removed=True
+    )
+
+    # Act
+    workspace3.is_removed = True
+    workspace3.save()
+    workspace4.organization = organization1.uuid
+    workspace4.save()
+    workspace1.delete()
+    Workspace.objects.all_with_removed().filter(uuid=workspace3.uuid).update(
+        is_removed=False
+    )
+
+    qs = Organization.objects.with_workspace_summary().order_by("name")
+
+    # Assert
+    summaries = {
+        organization.uuid: (organization.workspaces_count, organization.workspaces)
+        for organization in qs
+    }
+    assert summaries == {
+        organization1.uuid: (1, [workspace4.uuid]),
+        organization2.uuid: (3, [workspace2.uuid, workspace3.uuid]),
+        organization3.uuid: (0, []),
+    }
+
+
+@pytest.mark.django_db
+def test_rebuild_workspace_summary(
+    organization_factory, workspace_factory, user_factory
+):
+    """
+    Full rebuild produces the same summary as incremental maintenance.
+    """
+
+    # Arrange
+    owner = user_factory.create()
+    organization = organization_factory.create(owner=owner.uuid)
+    workspace1, workspace2 = workspace_factory.create_batch(
+        2, owner=owner.uuid, organization=organization.uuid
+    )
+    workspace_factory.create(
+        owner=owner.uuid, organization=organization.uuid, is_removed=True
+    )
+    WorkspaceSummary.objects.all().delete()
+
+    # Act
+    call_command("rebuild_workspace_summary", stdout=StringIO())
+
+    # Assert
+    summary = WorkspaceSummary.objects.get(organization=organization)
+    assert summary.workspaces_count == 3
+    assert summary.workspaces == [workspace1.uuid, workspace2.uuid]
+
+
+@pytest.mark.django_db
+def test_workspace_summary_restore_order(
+    organization_factory, workspace_factory, user_factory
+):
+    """
+    Restored workspace takes its created_at position, as in a full rebuild.
+    """
+
+    # Arrange
+    owner = user_factory.create()
+    organization = organization_factory.create(owner=owner.uuid)
+    workspace1, workspace2, workspace3 = workspace_factory.create_batch(
+        3, owner=owner.uuid, organization=organization.uuid
+    )
+    Workspace.objects.filter(uuid=workspace1.uuid).update(is_removed=True)
+
+    # Act
+    Workspace.objects.all_with_removed().filter(uuid=workspace1.uuid).update(
+        is_removed=False
+    )
+    incremental = WorkspaceSummary.objects.get(organization=organization).workspaces
+    call_command("rebuild_workspace_summary", stdout=StringIO())
+
+    # Assert
+    expected = [workspace1.uuid, workspace2.uuid, workspace3.uuid]
+    assert incremental == expected
+    assert (
+        WorkspaceSummary.objects.get(organization=organization).workspaces == expected
+    )
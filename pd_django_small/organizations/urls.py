@@ -0,0 +1,10 @@
+from django.urls import path
+
+from pd_django_small.organizations import views
+
+app_name = "organizations"
+
+urlpatterns = [
+    path("", views.organization_list, name="list"),
+    path("<uuid:organization>/", views.organization_detail, name="detail"),
+]
@@ -1,3 +1,78 @@
-from django.shortcuts import render
+from django.contrib.auth.decorators import permission_required
+from django.http import (
+    Http404,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.views.decorators.http import require_GET
 
-# Create your views here.
+from pd_django_small.core.http import flag_param, page_size, uuid_param
+from pd_django_small.core.iterators import Throughput
+from pd_django_small.organizations.exports import (
+    CONTENT_TYPES,
+    SERIALIZERS,
+    iter_organizations,
+)
+from pd_django_small.organizations.models import Organization
+
+ORGANIZATION_FIELDS = ("uuid", "name", "owner")
+
+
+async def organization_list(request):
+    """
+    Organizations ordered by uuid, next page starts after the "after" uuid.
+    The total count is a COUNT(*) of every match, only returned with count=1.
+    """
+
+    limit = page_size(request)
+    queryset = Organization.objects.order_by("uuid")
+    if owner := uuid_param(request, "owner"):
+        queryset = queryset.filter(owner=owner)
+    page = queryset
+    if after := uuid_param(request, "after"):
+        page = page.filter(uuid__gt=after)
+
+    results = [
+        organization
+        async for organization in page.values(*ORGANIZATION_FIELDS)[:limit].aiterator()
+    ]
+    data = {
+        "results": results,
+        "next": results[-1]["uuid"] if len(results) == limit else None,
+    }
+    if flag_param(request, "count"):
+        data["count"] = await queryset.acount()
+    return JsonResponse(data)
+
+
+async def organization_detail(request, organization):
+    try:
+        organization = await Organization.objects.values(*ORGANIZATION_FIELDS).aget(
+            uuid=organization
+        )
+    except Organization.DoesNotExist:
+        raise Http404("Organization does not exist")
+    return JsonResponse(organization)
+
+
+@require_GET
+@permission_required("organizations.view_organization", raise_exception=True)
+def export_organizations(request):
+    """
+    Every organization with its owner, subscription and workspaces, routed by
+    the full profile only, it needs the authentication middleware.
+    """
+
+    export_format = request.GET.get("format", "ndjson")
+    if export_format not in SERIALIZERS:
+        return HttpResponseBadRequest(f"Unknown export format {export_format!r}")
+
+    records = Throughput(iter_organizations(), name="organizations export")
+    response = StreamingHttpResponse(
+        SERIALIZERS[export_format](records), content_type=CONTENT_TYPES[export_format]
+    )
+    response[
+        "Content-Disposition"
+    ] = f'attachment; filename="organizations.{export_format}"'
+    return response
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "pd_django_small.core",
     "pd_django_small.workspaces",
     "pd_django_small.users",
     "pd_django_small.organizations",
@@ -46,6 +47,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "pd_django_small.core.middleware.SQLInstrumentationMiddleware",
+    "pd_django_small.core.middleware.LoadersMiddleware",
+    "pd_django_small.core.middleware.ReplicaPinningMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -81,15 +85,98 @@ WSGI_APPLICATION = "pd_django_small.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "pd_django_small.core.db.backends.postgresql_pool",
         "NAME": os.getenv("DATABASE_NAME", "postgres"),
         "USER": os.getenv("DATABASE_USER", "postgres"),
         "PASSWORD": os.getenv("DATABASE_PASSWORD", "postgres"),
         "HOST": os.getenv("DATABASE_HOST", "127.0.0.1"),
         "PORT": os.getenv("DATABASE_PORT", 5432),
+        # Connections are returned to the pool at the end of each request.
+        "CONN_MAX_AGE": 0,
+        "OPTIONS": {
+            "pool": {
+                "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", 1)),
+                "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", 10)),
+                "max_idle": float(os.getenv("DATABASE_POOL_MAX_IDLE", 600)),
+                "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", 30)),
+                "check": os.getenv("DATABASE_POOL_CHECK", "1") == "1",
+            },
+        },
     },
 }
 
+# Streaming replicas of the default database, "host:port" separated by commas,
+# become "replica1", "replica2", ... Tests use the default (test) database instead.
+for index, replica in enumerate(
+    filter(None, os.getenv("DATABASE_REPLICAS", "").split(",")), 1
+):
+    host, _, port = replica.strip().partition(":")
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or 5432,
+        "OPTIONS": {
+            "pool": {
+                **DATABASES["default"]["OPTIONS"]["pool"],
+                # An unreachable replica is skipped instead of waiting for a connection.
+                "timeout": float(os.getenv("DATABASE_REPLICA_POOL_TIMEOUT", 2)),
+            },
+        },
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["pd_django_small.core.db.routers.ReplicaRouter"]
+
+
+# Read replica routing, reads stay on the primary for PIN_SECONDS after a write
+# and while every replica lags more than MAX_LAG_SECONDS
+
+REPLICA_ROUTING = {
+    "REPLICAS": [alias for alias in DATABASES if alias != "default"],
+    "PIN_SECONDS": float(os.getenv("REPLICA_PIN_SECONDS", 5)),
+    "MAX_LAG_SECONDS": float(os.getenv("REPLICA_MAX_LAG_SECONDS", 2)),
+    "LAG_CHECK_INTERVAL": 1,
+    "PIN_COOKIE": "primary_pin",
+}
+
+
+# Active subscription lookup cache (in-process LRU in front of the default cache)
+
+ACTIVE_SUBSCRIPTION_CACHE = {
+    "MAX_ENTRIES": 10_000,
+    "LOCAL_TTL": 5,
+    "TIMEOUT": 300,
+    "CACHE_ALIAS": "default",
+}
+
+
+# Active membership lookup cache (in-process LRU in front of the default cache)
+
+ACTIVE_MEMBERSHIP_CACHE = {
+    "MAX_ENTRIES": 10_000,
+    "LOCAL_TTL": 5,
+    "TIMEOUT": 300,
+    "CACHE_ALIAS": "default",
+}
+
+
+# Per-request SQL instrumentation, SAMPLE_RATE is the share of requests recorded
+
+SQL_INSTRUMENTATION = {
+    "SAMPLE_RATE": float(os.getenv("SQL_INSTRUMENTATION_SAMPLE_RATE", 1.0)),
+    "N_PLUS_ONE_THRESHOLD": 5,
+    "SERVER_TIMING": True,
+}
+
+
+# Cold start budget of the WSGI / ASGI entry points, checked by core/tests/test_startup.py
+
+STARTUP_BUDGET = {
+    "SETTINGS_MODULE": "pd_django_small.settings_api",
+    "IMPORT_SECONDS": float(os.getenv("STARTUP_BUDGET_IMPORT_SECONDS", 1.0)),
+    "MAX_RSS_MIB": float(os.getenv("STARTUP_BUDGET_MAX_RSS_MIB", 80)),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -0,0 +1,33 @@
+"""
+API-only settings profile for JSON API workers.
+
+Same as settings.py without the admin, sessions, messages, static files and
+templates, and the middleware depending on them (authentication, CSRF),
+nothing a JSON API request goes through, fewer modules to import on a cold start.
+
+    DJANGO_SETTINGS_MODULE=pd_django_small.settings_api
+"""
+
+from pd_django_small.settings import *  # noqa: F401,F403
+from pd_django_small.settings import INSTALLED_APPS, MIDDLEWARE
+
+API_EXCLUDED_APPS = (
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+)
+API_EXCLUDED_MIDDLEWARE = (
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+)
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_EXCLUDED_APPS]
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE if middleware not in API_EXCLUDED_MIDDLEWARE
+]
+TEMPLATES = []
+ROOT_URLCONF = "pd_django_small.urls_api"
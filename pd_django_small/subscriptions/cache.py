@@ -0,0 +1,56 @@
+import uuid
+from decimal import Decimal
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+from pd_django_small.core.cache import TwoTierCache
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+
+
+class ActiveSubscription(NamedTuple):
+    uuid: uuid.UUID
+    plan: Optional[str]
+    price: Decimal
+    quantity: int
+
+
+def _build_cache() -> TwoTierCache:
+    config = getattr(settings, "ACTIVE_SUBSCRIPTION_CACHE", {})
+    return TwoTierCache(
+        "subscriptions:active",
+        max_entries=config.get("MAX_ENTRIES", 10_000),
+        local_ttl=config.get("LOCAL_TTL", 5),
+        timeout=config.get("TIMEOUT", 300),
+        cache_alias=config.get("CACHE_ALIAS", "default"),
+    )
+
+
+active_subscription_cache = _build_cache()
+
+
+def _load_active_subscriptions(organizations: list) -> dict:
+    return {
+        organization: ActiveSubscription(uuid, plan, price, quantity)
+        for organization, uuid, plan, price, quantity in Subscription.objects.filter(
+            organization__in=organizations, state=SubscriptionState.ACTIVE.value
+        ).values_list("organization", "uuid", "plan", "price", "quantity")
+    }
+
+
+def get_active_subscription(organization: uuid.UUID) -> Optional[ActiveSubscription]:
+    """ACTIVE subscription of the organization or None, cached in both tiers."""
+
+    return active_subscription_cache.get_many_or_load(
+        [organization], _load_active_subscriptions
+    )[organization]
+
+
+def get_active_subscriptions(organizations: list) -> dict:
+    return active_subscription_cache.get_many_or_load(
+        organizations, _load_active_subscriptions
+    )
+
+
+def invalidate_active_subscription(organization: uuid.UUID) -> None:
+    active_subscription_cache.invalidate(organization)
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.subscriptions.rollups import (
+    refresh_domain_revenue,
+    refresh_stale_domain_revenue,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh per-domain active subscriptions revenue, only domains queued "
+        "as stale unless --full or --domain is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full", action="store_true", help="Recompute every domain."
+        )
+        parser.add_argument(
+            "--domain",
+            action="append",
+            dest="domains",
+            help="Recompute the given domain, may be repeated.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to refresh. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if options["full"]:
+            rows = refresh_domain_revenue(using=using)
+        elif options["domains"]:
+            rows = refresh_domain_revenue(options["domains"], using=using)
+        else:
+            rows = refresh_stale_domain_revenue(using=using)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed revenue of {rows} domains."))
@@ -0,0 +1,81 @@
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pd_django_small.subscriptions.pricing import (
+    DEFAULT_RULE,
+    DiscountRule,
+    load_price_arrays,
+    simulate,
+    summarize,
+)
+
+
+def parse_rule(value: str) -> DiscountRule:
+    """name:per_unit:cap[:floor], e.g. "cheaper_units:2.5:75"."""
+
+    try:
+        name, per_unit, cap, *floor = value.split(":")
+        return DiscountRule(
+            name=name,
+            per_unit=Decimal(per_unit),
+            cap=Decimal(cap),
+            floor=Decimal(floor[0]) if floor else None,
+        )
+    except (ArithmeticError, ValueError) as exc:
+        raise CommandError(f"Invalid rule {value!r}: {exc}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Summarize active subscriptions discounts of the default and given rules, "
+        "in memory with NumPy (and in the database with --compare)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rule",
+            action="append",
+            dest="rules",
+            default=[],
+            type=parse_rule,
+            help="Additional rule name:per_unit:cap[:floor], may be repeated.",
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Also aggregate each rule in the database and time both paths.",
+        )
+
+    def handle(self, *args, **options):
+        rules = [DEFAULT_RULE, *options["rules"]]
+
+        started = time.perf_counter()
+        prices = load_price_arrays()
+        loaded = time.perf_counter()
+        summaries = simulate(rules, prices)
+        evaluated = time.perf_counter()
+        self.stdout.write(
+            f"numpy: loaded {len(prices)} subscriptions in {loaded - started:.2f}s, "
+            f"{len(rules)} rules evaluated in {evaluated - loaded:.3f}s"
+        )
+
+        for rule in rules:
+            summary = summaries[rule.name]
+            self.stdout.write(
+                f"{rule.name:<20} count={summary.count} total={summary.total} "
+                f"min={summary.minimum} max={summary.maximum}"
+            )
+
+        if options["compare"]:
+            started = time.perf_counter()
+            mismatched = [
+                rule.name for rule in rules if summarize(rule) != summaries[rule.name]
+            ]
+            self.stdout.write(
+                f"database: {len(rules)} rules aggregated in "
+                f"{time.perf_counter() - started:.2f}s"
+            )
+            if mismatched:
+                raise CommandError(f"Paths disagree for: {', '.join(mismatched)}")
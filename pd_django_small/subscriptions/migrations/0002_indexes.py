@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("subscriptions", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="subscription",
+            index=models.Index(
+                fields=["state", "price"], name="subscription_state_price_idx"
+            ),
+        ),
+    ]
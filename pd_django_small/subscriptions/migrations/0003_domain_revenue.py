@@ -0,0 +1,132 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:04
+
+from django.db import migrations, models
+
+STALE_DOMAIN_REVENUE_SQL = """
+CREATE FUNCTION subscriptions_stale_domain_revenue_subscription() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO subscriptions_staledomainrevenue (domain)
+    SELECT users_user.email_domain
+    FROM organizations_organization
+    JOIN users_user ON users_user.uuid = organizations_organization.owner
+    WHERE organizations_organization.uuid IN (
+        CASE WHEN TG_OP <> 'INSERT' THEN OLD.organization_id END,
+        CASE WHEN TG_OP <> 'DELETE' THEN NEW.organization_id END
+    )
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER subscriptions_stale_domain_revenue
+AFTER INSERT OR DELETE ON subscriptions_subscription
+FOR EACH ROW EXECUTE FUNCTION subscriptions_stale_domain_revenue_subscription();
+
+CREATE TRIGGER subscriptions_stale_domain_revenue_update
+AFTER UPDATE OF state, price, organization_id ON subscriptions_subscription
+FOR EACH ROW
+WHEN (
+    OLD.state IS DISTINCT FROM NEW.state
+    OR OLD.price IS DISTINCT FROM NEW.price
+    OR OLD.organization_id IS DISTINCT FROM NEW.organization_id
+)
+EXECUTE FUNCTION subscriptions_stale_domain_revenue_subscription();
+
+CREATE FUNCTION subscriptions_stale_domain_revenue_organization() RETURNS trigger AS $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM subscriptions_subscription WHERE organization_id = NEW.uuid
+    ) THEN
+        INSERT INTO subscriptions_staledomainrevenue (domain)
+        SELECT email_domain FROM users_user WHERE uuid IN (OLD.owner, NEW.owner)
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER subscriptions_stale_domain_revenue
+AFTER UPDATE OF owner ON organizations_organization
+FOR EACH ROW
+WHEN (OLD.owner IS DISTINCT FROM NEW.owner)
+EXECUTE FUNCTION subscriptions_stale_domain_revenue_organization();
+
+CREATE FUNCTION subscriptions_stale_domain_revenue_user() RETURNS trigger AS $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM organizations_organization WHERE owner = OLD.uuid) THEN
+        INSERT INTO subscriptions_staledomainrevenue (domain)
+        VALUES (OLD.email_domain)
+        ON CONFLICT DO NOTHING;
+        IF TG_OP = 'UPDATE' THEN
+            INSERT INTO subscriptions_staledomainrevenue (domain)
+            VALUES (NEW.email_domain)
+            ON CONFLICT DO NOTHING;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER subscriptions_stale_domain_revenue
+AFTER DELETE ON users_user
+FOR EACH ROW EXECUTE FUNCTION subscriptions_stale_domain_revenue_user();
+
+CREATE TRIGGER subscriptions_stale_domain_revenue_update
+AFTER UPDATE OF email, email_domain ON users_user
+FOR EACH ROW
+WHEN (OLD.email_domain IS DISTINCT FROM NEW.email_domain)
+EXECUTE FUNCTION subscriptions_stale_domain_revenue_user();
+
+INSERT INTO subscriptions_domainrevenue (domain, total, subscriptions, refreshed_at)
+SELECT users_user.email_domain, sum(subscriptions_subscription.price), count(*), now()
+FROM subscriptions_subscription
+JOIN organizations_organization
+    ON organizations_organization.uuid = subscriptions_subscription.organization_id
+JOIN users_user ON users_user.uuid = organizations_organization.owner
+WHERE subscriptions_subscription.state = 'ACTIVE'
+GROUP BY users_user.email_domain;
+"""
+
+DROP_STALE_DOMAIN_REVENUE_SQL = """
+DROP TRIGGER subscriptions_stale_domain_revenue_update ON users_user;
+DROP TRIGGER subscriptions_stale_domain_revenue ON users_user;
+DROP FUNCTION subscriptions_stale_domain_revenue_user();
+DROP TRIGGER subscriptions_stale_domain_revenue ON organizations_organization;
+DROP FUNCTION subscriptions_stale_domain_revenue_organization();
+DROP TRIGGER subscriptions_stale_domain_revenue_update ON subscriptions_subscription;
+DROP TRIGGER subscriptions_stale_domain_revenue ON subscriptions_subscription;
+DROP FUNCTION subscriptions_stale_domain_revenue_subscription();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0003_indexes"),
+        ("subscriptions", "0002_indexes"),
+        ("users", "0003_user_email_domain"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DomainRevenue",
+            fields=[
+                (
+                    "domain",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("total", models.DecimalField(decimal_places=2, max_digits=14)),
+                ("subscriptions", models.IntegerField()),
+                ("refreshed_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="StaleDomainRevenue",
+            fields=[
+                (
+                    "domain",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+        migrations.RunSQL(STALE_DOMAIN_REVENUE_SQL, DROP_STALE_DOMAIN_REVENUE_SQL),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:11
+
+from django.db import migrations, models
+
+STATE_RANK_SQL = """
+CREATE FUNCTION subscriptions_subscription_state_rank() RETURNS trigger AS $$
+BEGIN
+    NEW.state_rank := CASE NEW.state
+        WHEN 'CANCELLED' THEN 0
+        WHEN 'EXPIRED' THEN 1
+        WHEN 'ACTIVE' THEN 2
+    END;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER subscriptions_subscription_state_rank
+BEFORE INSERT OR UPDATE OF state, state_rank ON subscriptions_subscription
+FOR EACH ROW EXECUTE FUNCTION subscriptions_subscription_state_rank();
+"""
+
+DROP_STATE_RANK_SQL = """
+DROP TRIGGER subscriptions_subscription_state_rank ON subscriptions_subscription;
+DROP FUNCTION subscriptions_subscription_state_rank();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("subscriptions", "0003_domain_revenue"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="subscription",
+            name="state_rank",
+            field=models.SmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(STATE_RANK_SQL, DROP_STATE_RANK_SQL),
+    ]
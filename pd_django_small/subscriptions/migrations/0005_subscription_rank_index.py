@@ -0,0 +1,64 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:11
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+
+BACKFILL_BATCH_SIZE = 1000
+
+# The trigger from 0004 sets state_rank, rows it already covers are skipped.
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT uuid FROM subscriptions_subscription {after}ORDER BY uuid LIMIT %s
+),
+ranked AS (
+    SELECT uuid, CASE state
+        WHEN 'CANCELLED' THEN 0
+        WHEN 'EXPIRED' THEN 1
+        WHEN 'ACTIVE' THEN 2
+    END AS state_rank
+    FROM subscriptions_subscription WHERE uuid IN (SELECT uuid FROM batch)
+),
+updated AS (
+    UPDATE subscriptions_subscription SET state_rank = ranked.state_rank
+    FROM ranked
+    WHERE subscriptions_subscription.uuid = ranked.uuid
+    AND subscriptions_subscription.state_rank IS DISTINCT FROM ranked.state_rank
+)
+SELECT count(*), (SELECT uuid FROM batch ORDER BY uuid DESC LIMIT 1) FROM batch
+"""
+
+
+def backfill_state_rank(apps, schema_editor):
+    """Primary key batches, each in its own transaction."""
+
+    connection = schema_editor.connection
+    last = None
+    while True:
+        after = "" if last is None else "WHERE uuid > %s "
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                BACKFILL_SQL.format(after=after),
+                [BACKFILL_BATCH_SIZE] if last is None else [last, BACKFILL_BATCH_SIZE],
+            )
+            count, last = cursor.fetchone()
+        if count < BACKFILL_BATCH_SIZE:
+            return
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("subscriptions", "0004_subscription_state_rank"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_state_rank, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="subscription",
+            index=models.Index(
+                fields=["state_rank", "-price", "uuid"],
+                name="subscription_rank_price_idx",
+            ),
+        ),
+    ]
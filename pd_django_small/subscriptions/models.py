@@ -1,9 +1,14 @@
 import uuid
-from django.db import models
-from django.core.validators import MinValueValidator
 from enum import Enum
 
+from django.core.validators import MinValueValidator
+from django.db import models
+
 from pd_django_small.organizations.models import Organization
+from pd_django_small.subscriptions.querysets import (
+    DomainRevenueQuerySet,
+    SubscriptionQuerySet,
+)
 
 
 class SubscriptionState(Enum):
@@ -15,6 +20,19 @@ class SubscriptionState(Enum):
     def choices(cls):
         return tuple((i.name, i.value) for i in cls)
 
+    @property
+    def rank(self) -> int:
+        """Billing console order, same as the subscriptions_subscription_state_rank trigger."""
+
+        return STATE_RANKS[self]
+
+
+STATE_RANKS = {
+    SubscriptionState.CANCELLED: 0,
+    SubscriptionState.EXPIRED: 1,
+    SubscriptionState.ACTIVE: 2,
+}
+
 
 class Subscription(models.Model):
     uuid = models.UUIDField(
@@ -39,3 +57,45 @@ class Subscription(models.Model):
         validators=[MinValueValidator(0)],
     )
     quantity = models.IntegerField(validators=[MinValueValidator(0)])
+    # Maintained by the "subscriptions_subscription_state_rank" trigger.
+    state_rank = models.SmallIntegerField(default=0, editable=False)
+
+    objects = SubscriptionQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["state", "price"], name="subscription_state_price_idx"
+            ),
+            models.Index(
+                fields=["state_rank", "-price", "uuid"],
+                name="subscription_rank_price_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.state_rank = SubscriptionState(self.state).rank
+        super().save(*args, **kwargs)
+
+
+class DomainRevenue(models.Model):
+    """
+    Sum of ACTIVE subscriptions price per organization owner email domain,
+    rebuilt by pd_django_small.subscriptions.rollups.refresh_domain_revenue().
+    """
+
+    domain = models.CharField(max_length=255, primary_key=True)
+    total = models.DecimalField(max_digits=14, decimal_places=2)
+    subscriptions = models.IntegerField()
+    refreshed_at = models.DateTimeField()
+
+    objects = DomainRevenueQuerySet.as_manager()
+
+
+class StaleDomainRevenue(models.Model):
+    """
+    Domains whose DomainRevenue is out of date, queued by triggers on
+    subscriptions, organizations and users.
+    """
+
+    domain = models.CharField(max_length=255, primary_key=True)
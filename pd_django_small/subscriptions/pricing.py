@@ -0,0 +1,229 @@
+"""
+Subscription discount rules, evaluated either in the database (annotation,
+aggregate) or in memory on NumPy arrays loaded with COPY for what-if simulations.
+
+Both paths compute in exact cents: the database in numeric, NumPy in int64,
+so they return identical results.
+"""
+
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+from django.db import connections
+from django.db.models import Count, DecimalField, F, Max, Min, QuerySet, Sum, Value
+from django.db.models.functions import Greatest, Least
+
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+
+CENTS = Decimal("0.01")
+DISCOUNT_CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class DiscountRule:
+    """discount = min(price - quantity * per_unit, cap), at least "floor" when set."""
+
+    name: str = "default"
+    per_unit: Decimal = Decimal("10")
+    cap: Decimal = Decimal("50")
+    floor: Optional[Decimal] = None
+
+    def __post_init__(self):
+        for amount in (self.per_unit, self.cap, self.floor):
+            if amount is not None and Decimal(amount) != Decimal(amount).quantize(
+                CENTS
+            ):
+                raise ValueError(
+                    f"{self.name}: {amount} is not a whole number of cents"
+                )
+
+    def expression(self):
+        output_field = DecimalField(max_digits=14, decimal_places=2)
+        discount = Least(
+            F("price") - F("quantity") * Value(Decimal(self.per_unit)),
+            Value(Decimal(self.cap)),
+            output_field=output_field,
+        )
+        if self.floor is not None:
+            discount = Greatest(
+                discount, Value(Decimal(self.floor)), output_field=output_field
+            )
+        return discount
+
+    def evaluate(self, prices: "PriceArrays") -> np.ndarray:
+        """Discount of each row of "prices" in cents."""
+
+        discount = np.minimum(
+            prices.price - prices.quantity * _cents(self.per_unit), _cents(self.cap)
+        )
+        if self.floor is not None:
+            discount = np.maximum(discount, _cents(self.floor))
+        return discount
+
+
+DEFAULT_RULE = DiscountRule()
+
+
+@dataclass(frozen=True)
+class DiscountSummary:
+    count: int
+    total: Decimal
+    minimum: Optional[Decimal]
+    maximum: Optional[Decimal]
+
+
+def active_subscriptions() -> QuerySet:
+    return Subscription.objects.filter(state=SubscriptionState.ACTIVE.value)
+
+
+# Database path
+
+
+def annotate_discount(
+    queryset: Optional[QuerySet] = None, rule: DiscountRule = DEFAULT_RULE
+) -> QuerySet:
+    if queryset is None:
+        queryset = active_subscriptions()
+    return queryset.annotate(discount=rule.expression())
+
+
+def iter_discounts(
+    rule: DiscountRule = DEFAULT_RULE,
+    queryset: Optional[QuerySet] = None,
+    chunk_size: int = DISCOUNT_CHUNK_SIZE,
+) -> Iterator[tuple[uuid.UUID, Decimal]]:
+    """(uuid, discount) by uuid, one keyset query per "chunk_size" subscriptions."""
+
+    queryset = annotate_discount(queryset, rule).order_by("uuid")
+    last = None
+    while True:
+        chunk = queryset if last is None else queryset.filter(uuid__gt=last)
+        rows = list(chunk.values_list("uuid", "discount")[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last = rows[-1][0]
+
+
+def summarize(
+    rule: DiscountRule = DEFAULT_RULE, queryset: Optional[QuerySet] = None
+) -> DiscountSummary:
+    """Count, total, min and max discount in one aggregate query."""
+
+    result = annotate_discount(queryset, rule).aggregate(
+        count=Count("uuid"),
+        total=Sum("discount"),
+        minimum=Min("discount"),
+        maximum=Max("discount"),
+    )
+    return DiscountSummary(
+        count=result["count"],
+        total=result["total"] or Decimal("0.00"),
+        minimum=result["minimum"],
+        maximum=result["maximum"],
+    )
+
+
+# NumPy path
+
+_COPY_HEADER_SIZE = 19
+_COPY_TRAILER_SIZE = 2
+# Binary COPY row of (uuid, bigint, integer), all not null so every row has the same size.
+_COPY_ROW = np.dtype(
+    [
+        ("fields", ">i2"),
+        ("uuid_size", ">i4"),
+        ("uuid", "V16"),
+        ("price_size", ">i4"),
+        ("price", ">i8"),
+        ("quantity_size", ">i4"),
+        ("quantity", ">i4"),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class PriceArrays:
+    """Subscriptions ordered by uuid, price in cents."""
+
+    uuids: np.ndarray
+    price: np.ndarray
+    quantity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def uuid(self, index: int) -> uuid.UUID:
+        return uuid.UUID(bytes=self.uuids[index].tobytes())
+
+
+def load_price_arrays(
+    queryset: Optional[QuerySet] = None, using: str = "default"
+) -> PriceArrays:
+    """Load uuid, price and quantity with one binary COPY, ~42 bytes per subscription."""
+
+    if queryset is None:
+        queryset = active_subscriptions()
+    sql, params = (
+        queryset.order_by().values("uuid", "price", "quantity").query.sql_with_params()
+    )
+
+    data = bytearray()
+    with connections[using].cursor() as cursor:
+        with cursor.cursor.copy(
+            "COPY (SELECT uuid, (price * 100)::bigint, quantity "
+            f"FROM ({sql}) subscriptions ORDER BY uuid) TO STDOUT (FORMAT BINARY)",
+            params,
+        ) as copy:
+            for block in copy:
+                data += block
+
+    start, stop = _COPY_HEADER_SIZE, len(data) - _COPY_TRAILER_SIZE
+    rows = np.frombuffer(memoryview(data)[start:stop], dtype=_COPY_ROW)
+    if len(rows) and (rows["fields"] != 3).any():
+        raise ValueError("Unexpected COPY row layout")
+    return PriceArrays(
+        uuids=rows["uuid"].copy(),
+        price=rows["price"].astype(np.int64),
+        quantity=rows["quantity"].astype(np.int64),
+    )
+
+
+def summarize_arrays(
+    rule: DiscountRule = DEFAULT_RULE, prices: Optional[PriceArrays] = None
+) -> DiscountSummary:
+    if prices is None:
+        prices = load_price_arrays()
+    if not len(prices):
+        return DiscountSummary(
+            count=0, total=Decimal("0.00"), minimum=None, maximum=None
+        )
+
+    discount = rule.evaluate(prices)
+    return DiscountSummary(
+        count=len(discount),
+        total=_decimal(discount.sum()),
+        minimum=_decimal(discount.min()),
+        maximum=_decimal(discount.max()),
+    )
+
+
+def simulate(
+    rules: Iterable[DiscountRule], prices: Optional[PriceArrays] = None
+) -> dict[str, DiscountSummary]:
+    """Summaries of each rule over the same arrays, loaded once."""
+
+    if prices is None:
+        prices = load_price_arrays()
+    return {rule.name: summarize_arrays(rule, prices) for rule in rules}
+
+
+def _cents(amount: Decimal) -> int:
+    return int(Decimal(amount) * 100)
+
+
+def _decimal(cents) -> Decimal:
+    return (Decimal(int(cents)) / 100).quantize(CENTS)
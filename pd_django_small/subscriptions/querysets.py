@@ -0,0 +1,25 @@
+from decimal import Decimal
+
+from django.db import models
+
+from pd_django_small.core.upsert import UpsertMixin
+
+
+class SubscriptionQuerySet(UpsertMixin, models.QuerySet):
+    def order_by_state(self):
+        """
+        CANCELLED, EXPIRED, ACTIVE, then price descending, read in order from
+        the subscription_rank_price_idx index without sorting.
+        """
+
+        return self.order_by("state_rank", "-price", "uuid")
+
+
+class DomainRevenueQuerySet(models.QuerySet):
+    def total_for(self, domain: str) -> Decimal:
+        """Active subscriptions total of "domain", one primary key lookup."""
+
+        total = (
+            self.filter(domain=domain.lower()).values_list("total", flat=True).first()
+        )
+        return total if total is not None else Decimal("0.00")
@@ -0,0 +1,87 @@
+from typing import Iterable, Optional
+
+from django.db import connections, transaction
+
+from pd_django_small.organizations.models import Organization
+from pd_django_small.subscriptions.models import (
+    DomainRevenue,
+    StaleDomainRevenue,
+    Subscription,
+    SubscriptionState,
+)
+from pd_django_small.users.models import User
+
+
+def refresh_domain_revenue(
+    domains: Optional[Iterable[str]] = None, using: str = "default"
+) -> int:
+    """
+    Recompute DomainRevenue of "domains" (every domain when None), returns number
+    of rows written.
+
+    Rows are upserted in place, readers keep seeing the previous totals until
+    the refresh commits and writers are never blocked. A domain's recompute
+    is an index lookup chain: users by email_domain, organizations by owner,
+    subscription by organization.
+    """
+
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    revenue_table = qn(DomainRevenue._meta.db_table)
+    stale_table = qn(StaleDomainRevenue._meta.db_table)
+
+    scope, scope_params = "true", []
+    if domains is not None:
+        domains = sorted({domain.lower() for domain in domains})
+        if not domains:
+            return 0
+        scope, scope_params = "domain = ANY(%s)", [domains]
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # Queued domains are dropped first, changes committed after that are
+        # queued again and picked up by the next refresh.
+        cursor.execute(f"DELETE FROM {stale_table} WHERE {scope}", scope_params)
+        cursor.execute(
+            f"""
+            WITH fresh AS (
+                SELECT domain, sum(price) AS total, count(*) AS subscriptions
+                FROM (
+                    SELECT u.email_domain AS domain, s.price
+                    FROM {qn(Subscription._meta.db_table)} s
+                    JOIN {qn(Organization._meta.db_table)} o
+                        ON o.uuid = s.organization_id
+                    JOIN {qn(User._meta.db_table)} u ON u.uuid = o.owner
+                    WHERE s.state = %s
+                ) active
+                WHERE {scope}
+                GROUP BY domain
+            ),
+            upserted AS (
+                INSERT INTO {revenue_table} (domain, total, subscriptions, refreshed_at)
+                SELECT domain, total, subscriptions, now() FROM fresh
+                ON CONFLICT (domain) DO UPDATE
+                SET total = EXCLUDED.total,
+                    subscriptions = EXCLUDED.subscriptions,
+                    refreshed_at = EXCLUDED.refreshed_at
+                RETURNING 1
+            ),
+            removed AS (
+                DELETE FROM {revenue_table} revenue
+                WHERE {scope}
+                AND NOT EXISTS (SELECT 1 FROM fresh WHERE fresh.domain = revenue.domain)
+            )
+            SELECT count(*) FROM upserted
+            """,
+            [SubscriptionState.ACTIVE.value, *scope_params, *scope_params],
+        )
+        (written,) = cursor.fetchone()
+    return written
+
+
+def refresh_stale_domain_revenue(using: str = "default") -> int:
+    """Recompute DomainRevenue of the domains queued in StaleDomainRevenue."""
+
+    domains = list(
+        StaleDomainRevenue.objects.using(using).values_list("domain", flat=True)
+    )
+    return refresh_domain_revenue(domains, using=using)
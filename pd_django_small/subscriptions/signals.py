@@ -0,0 +1,20 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from pd_django_small.subscriptions.cache import invalidate_active_subscription
+from pd_django_small.subscriptions.models import Subscription
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+def invalidate_subscription_cache(sender, instance, using, **kwargs):
+    """Invalidate now and once more on commit, readers may repopulate in between."""
+
+    invalidate_active_subscription(instance.organization_id)
+    transaction.on_commit(
+        partial(invalidate_active_subscription, instance.organization_id),
+        using=using,
+    )
@@ -0,0 +1,122 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pd_django_small.subscriptions.cache import (
+    ActiveSubscription,
+    active_subscription_cache,
+    get_active_subscription,
+)
+from pd_django_small.subscriptions.models import SubscriptionState
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    active_subscription_cache.clear_local()
+    active_subscription_cache.reset_stats()
+
+
+@pytest.mark.django_db
+def test_get_active_subscription(
+    organization_factory, user_factory, subscription_factory
+):
+    """Lookups hit the database once, "no active subscription" is cached too."""
+
+    # Arrange
+    owner = user_factory.create()
+    organization1 = organization_factory.create(owner=owner.uuid)
+    organization2 = organization_factory.create(owner=owner.uuid)
+    subscription = subscription_factory.create(
+        organization=organization1,
+        state=SubscriptionState.ACTIVE.value,
+        plan="team",
+        price=99,
+        quantity=3,
+    )
+    subscription_factory.create(
+        organization=organization2, state=SubscriptionState.EXPIRED.value, price=10
+    )
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(3):
+            active = get_active_subscription(organization1.uuid)
+            expired = get_active_subscription(organization2.uuid)
+
+    # Assert
+    assert active == ActiveSubscription(subscription.uuid, "team", 99, 3)
+    assert expired is None
+    assert len(context.captured_queries) == 2
+    assert active_subscription_cache.stats.as_dict() == {
+        "local_hits": 4,
+        "shared_hits": 0,
+        "misses": 2,
+        "evictions": 0,
+        "hits": 4,
+    }
+
+
+@pytest.mark.django_db
+def test_get_active_subscription_shared_tier(
+    organization_factory, user_factory, subscription_factory
+):
+    """Local tier misses fall back to the Django cache before the database."""
+
+    # Arrange
+    organization = organization_factory.create(owner=user_factory.create().uuid)
+    subscription_factory.create(
+        organization=organization, state=SubscriptionState.ACTIVE.value, price=5
+    )
+    get_active_subscription(organization.uuid)
+    active_subscription_cache.clear_local()
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        active = get_active_subscription(organization.uuid)
+
+    # Assert
+    assert active.price == 5
+    assert len(context.captured_queries) == 0
+    assert active_subscription_cache.stats.shared_hits == 1
+
+
+@pytest.mark.django_db
+def test_active_subscription_invalidated_on_save_and_delete(
+    organization_factory, user_factory, subscription_factory
+):
+    # Arrange
+    organization = organization_factory.create(owner=user_factory.create().uuid)
+    subscription = subscription_factory.create(
+        organization=organization, state=SubscriptionState.ACTIVE.value, price=5
+    )
+    assert get_active_subscription(organization.uuid).price == 5
+
+    # Act & Assert
+    subscription.price = 7
+    subscription.save()
+    assert get_active_subscription(organization.uuid).price == 7
+
+    subscription.delete()
+    assert get_active_subscription(organization.uuid) is None
+
+
+@pytest.mark.django_db
+def test_local_tier_evictions(organization_factory, user_factory):
+    # Arrange
+    owner = user_factory.create()
+    organizations = organization_factory.create_batch(3, owner=owner.uuid)
+    max_entries = active_subscription_cache.max_entries
+    active_subscription_cache.max_entries = 2
+
+    # Act
+    try:
+        for organization in organizations:
+            get_active_subscription(organization.uuid)
+    finally:
+        active_subscription_cache.max_entries = max_entries
+
+    # Assert
+    assert active_subscription_cache.stats.evictions == 1
+    assert active_subscription_cache.stats.misses == 3
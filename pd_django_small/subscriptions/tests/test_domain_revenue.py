@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+import pytest
+
+from pd_django_small.subscriptions.models import (
+    DomainRevenue,
+    StaleDomainRevenue,
+    SubscriptionState,
+)
+from pd_django_small.subscriptions.rollups import (
+    refresh_domain_revenue,
+    refresh_stale_domain_revenue,
+)
+from pd_django_small.users.models import User
+
+
+@pytest.fixture
+def active_subscription(organization_factory, user_factory, subscription_factory):
+    def create(email, price, state=SubscriptionState.ACTIVE.value):
+        return subscription_factory.create(
+            organization=organization_factory.create(
+                owner=user_factory.create(email=email).uuid
+            ),
+            state=state,
+            price=price,
+        )
+
+    return create
+
+
+@pytest.mark.django_db
+def test_email_domain_maintained(user_factory):
+    """Email domain is set on save and by the trigger on queryset updates."""
+
+    # Arrange
+    user = user_factory.create(email="user1@ABC.com")
+
+    # Act
+    User.objects.filter(pk=user.pk).update(email="user1@example.com")
+
+    # Assert
+    assert user.email_domain == "abc.com"
+    user.refresh_from_db()
+    assert user.email_domain == "example.com"
+
+
+@pytest.mark.django_db
+def test_refresh_domain_revenue(active_subscription):
+    # Arrange
+    active_subscription("user1@abc.com", 100)
+    active_subscription("user2@abc.com", 20)
+    active_subscription("user3@example.com", 200)
+    active_subscription("user4@abc.com", 300, state=SubscriptionState.EXPIRED.value)
+
+    # Act
+    rows = refresh_domain_revenue()
+
+    # Assert
+    assert rows == 2
+    assert DomainRevenue.objects.total_for("abc.com") == Decimal("120.00")
+    assert DomainRevenue.objects.total_for("ABC.com") == Decimal("120.00")
+    assert DomainRevenue.objects.total_for("missing.com") == Decimal("0.00")
+    assert not StaleDomainRevenue.objects.exists()
+
+
+@pytest.mark.django_db
+def test_refresh_stale_domain_revenue(active_subscription):
+    """Changes queue affected domains, only those are recomputed."""
+
+    # Arrange
+    abc = active_subscription("user1@abc.com", 100)
+    example = active_subscription("user2@example.com", 200)
+    refresh_domain_revenue()
+    abc.state = SubscriptionState.CANCELLED.value
+    abc.save()
+    owner = User.objects.get(uuid=example.organization.owner)
+    owner.email = "user2@abc.com"
+    owner.save()
+
+    # Act
+    stale = set(StaleDomainRevenue.objects.values_list("domain", flat=True))
+    refresh_stale_domain_revenue()
+
+    # Assert
+    assert stale == {"abc.com", "example.com"}
+    assert DomainRevenue.objects.total_for("abc.com") == Decimal("200.00")
+    assert not DomainRevenue.objects.filter(domain="example.com").exists()
+    assert not StaleDomainRevenue.objects.exists()
+
+
+@pytest.mark.django_db
+def test_total_for_single_index_lookup(django_assert_num_queries):
+    # Arrange
+    DomainRevenue.objects.create(
+        domain="abc.com", total=10, subscriptions=1, refreshed_at="2024-01-01T00:00Z"
+    )
+
+    # Act
+    with django_assert_num_queries(1) as context:
+        total = DomainRevenue.objects.total_for("abc.com")
+
+    # Assert
+    assert total == Decimal("10.00")
+    assert '"domain" = ' in context.captured_queries[0]["sql"]
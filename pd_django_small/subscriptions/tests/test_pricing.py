@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+import pytest
+
+from pd_django_small.subscriptions.models import SubscriptionState
+from pd_django_small.subscriptions.pricing import (
+    DEFAULT_RULE,
+    DiscountRule,
+    DiscountSummary,
+    iter_discounts,
+    load_price_arrays,
+    simulate,
+    summarize,
+)
+
+RULES = (
+    DEFAULT_RULE,
+    DiscountRule(name="cheaper_units", per_unit=Decimal("2.50"), cap=Decimal("75")),
+    DiscountRule(name="non_negative", floor=Decimal("0")),
+)
+
+
+@pytest.fixture
+def subscriptions(organization_factory, user_factory, subscription_factory):
+    rows = ((100, 2), (20, 1), (200, 10), (32, 2), ("10.55", 3), (5, 0))
+    created = [
+        subscription_factory.create(
+            organization=organization_factory.create(owner=user_factory.create().uuid),
+            state=SubscriptionState.ACTIVE.value,
+            price=price,
+            quantity=quantity,
+        )
+        for price, quantity in rows
+    ]
+    subscription_factory.create(
+        organization=organization_factory.create(owner=user_factory.create().uuid),
+        state=SubscriptionState.EXPIRED.value,
+        price=310,
+    )
+    return created
+
+
+@pytest.mark.django_db
+def test_default_rule_discounts(subscriptions):
+    # Act
+    discounts = dict(iter_discounts(chunk_size=4))
+
+    # Assert
+    assert [discounts[s.uuid] for s in subscriptions] == [
+        Decimal("50.00"),
+        Decimal("10.00"),
+        Decimal("50.00"),
+        Decimal("12.00"),
+        Decimal("-19.45"),
+        Decimal("5.00"),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("rule", RULES, ids=lambda rule: rule.name)
+def test_database_and_numpy_paths_match(subscriptions, rule):
+    """Same discount per subscription and same summary from both paths."""
+
+    # Arrange
+    prices = load_price_arrays()
+
+    # Act
+    database = list(iter_discounts(rule, chunk_size=4))
+    vectorized = rule.evaluate(prices)
+    summaries = simulate([rule], prices)
+
+    # Assert
+    assert [prices.uuid(i) for i in range(len(prices))] == [u for u, _ in database]
+    assert [Decimal(int(cents)) / 100 for cents in vectorized] == [
+        discount for _, discount in database
+    ]
+    assert summaries[rule.name] == summarize(rule)
+
+
+@pytest.mark.django_db
+def test_simulate_without_subscriptions():
+    # Act
+    summaries = simulate(RULES)
+
+    # Assert
+    assert summaries["default"] == DiscountSummary(
+        count=0, total=Decimal("0.00"), minimum=None, maximum=None
+    )
+    assert summarize() == summaries["default"]
+
+
+def test_rule_amounts_in_cents():
+    with pytest.raises(ValueError):
+        DiscountRule(per_unit=Decimal("0.001"))
@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+
+
+@pytest.fixture
+def subscriptions(organization_factory, user_factory, subscription_factory):
+    rows = (
+        (SubscriptionState.ACTIVE, 100),
+        (SubscriptionState.CANCELLED, 20),
+        (SubscriptionState.EXPIRED, 200),
+        (SubscriptionState.ACTIVE, 300),
+        (SubscriptionState.CANCELLED, 30),
+    )
+    return [
+        subscription_factory.create(
+            organization=organization_factory.create(owner=user_factory.create().uuid),
+            state=state.value,
+            price=price,
+        )
+        for state, price in rows
+    ]
+
+
+@pytest.mark.django_db
+def test_order_by_state(subscriptions):
+    """CANCELLED, EXPIRED, ACTIVE, then price descending."""
+
+    # Arrange
+    Subscription.objects.filter(pk=subscriptions[2].pk).update(
+        state=SubscriptionState.ACTIVE.value
+    )
+
+    # Act
+    ordered = list(
+        Subscription.objects.order_by_state().values_list(
+            "state", "state_rank", "price"
+        )
+    )
+
+    # Assert
+    assert [(state, rank, int(price)) for state, rank, price in ordered] == [
+        ("CANCELLED", 0, 30),
+        ("CANCELLED", 0, 20),
+        ("ACTIVE", 2, 300),
+        ("ACTIVE", 2, 200),
+        ("ACTIVE", 2, 100),
+    ]
+
+
+@pytest.mark.django_db
+def test_order_by_state_reads_index(subscriptions):
+    """Paginated listing is an index scan, with no sort node."""
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        list(Subscription.objects.order_by_state()[2:4])
+
+    # Assert
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("EXPLAIN " + context.captured_queries[0]["sql"])
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+    assert "Index Scan using subscription_rank_price_idx" in plan
+    assert "Sort" not in plan
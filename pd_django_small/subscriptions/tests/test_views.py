@@ -0,0 +1,55 @@
+import pytest
+from django.urls import reverse
+
+from pd_django_small.subscriptions.models import SubscriptionState
+
+
+@pytest.mark.django_db
+def test_subscription_list(
+    client, organization_factory, user_factory, subscription_factory
+):
+    """Subscriptions can be filtered by state."""
+
+    # Arrange
+    owner = user_factory.create()
+    active = subscription_factory.create(
+        organization=organization_factory.create(owner=owner.uuid),
+        state=SubscriptionState.ACTIVE.value,
+        price=10,
+    )
+    subscription_factory.create(
+        organization=organization_factory.create(owner=owner.uuid),
+        state=SubscriptionState.EXPIRED.value,
+        price=20,
+    )
+
+    # Act
+    response = client.get(
+        reverse("subscriptions:list"), {"state": "ACTIVE", "count": "true"}
+    )
+    invalid = client.get(reverse("subscriptions:list"), {"state": "UNKNOWN"})
+
+    # Assert
+    assert response.json()["count"] == 1
+    assert response.json()["results"][0]["uuid"] == str(active.uuid)
+    assert invalid.status_code == 400
+
+
+@pytest.mark.django_db
+def test_subscription_detail(
+    client, organization_factory, user_factory, subscription_factory
+):
+    # Arrange
+    subscription = subscription_factory.create(
+        organization=organization_factory.create(owner=user_factory.create().uuid),
+        state=SubscriptionState.ACTIVE.value,
+        price=10,
+        quantity=2,
+    )
+
+    # Act
+    response = client.get(reverse("subscriptions:detail", args=[subscription.uuid]))
+
+    # Assert
+    assert response.json()["price"] == "10.00"
+    assert response.json()["quantity"] == 2
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from pd_django_small.subscriptions import views
+
+app_name = "subscriptions"
+
+urlpatterns = [
+    path("", views.subscription_list, name="list"),
+    path("<uuid:subscription>/", views.subscription_detail, name="detail"),
+]
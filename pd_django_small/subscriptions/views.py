@@ -1,3 +1,46 @@
-from django.shortcuts import render
+from django.core.exceptions import BadRequest
+from django.http import Http404, JsonResponse
 
-# Create your views here.
+from pd_django_small.core.http import flag_param, page_size, uuid_param
+from pd_django_small.subscriptions.models import Subscription, SubscriptionState
+
+SUBSCRIPTION_FIELDS = ("uuid", "organization", "state", "plan", "price", "quantity")
+
+
+async def subscription_list(request):
+    """
+    Subscriptions ordered by uuid, optionally filtered by state, the total
+    count is only returned with count=1.
+    """
+
+    limit = page_size(request)
+    queryset = Subscription.objects.order_by("uuid")
+    if state := request.GET.get("state"):
+        if state not in SubscriptionState.__members__:
+            raise BadRequest(f"Unknown state {state!r}")
+        queryset = queryset.filter(state=state)
+    page = queryset
+    if after := uuid_param(request, "after"):
+        page = page.filter(uuid__gt=after)
+
+    results = [
+        subscription
+        async for subscription in page.values(*SUBSCRIPTION_FIELDS)[:limit].aiterator()
+    ]
+    data = {
+        "results": results,
+        "next": results[-1]["uuid"] if len(results) == limit else None,
+    }
+    if flag_param(request, "count"):
+        data["count"] = await queryset.acount()
+    return JsonResponse(data)
+
+
+async def subscription_detail(request, subscription):
+    try:
+        subscription = await Subscription.objects.values(*SUBSCRIPTION_FIELDS).aget(
+            uuid=subscription
+        )
+    except Subscription.DoesNotExist:
+        raise Http404("Subscription does not exist")
+    return JsonResponse(subscription)
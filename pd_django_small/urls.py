@@ -17,6 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from pd_django_small.organizations.views import export_organizations
+from pd_django_small.urls_api import urlpatterns as api_urlpatterns
+
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("organizations/export/", export_organizations, name="organizations-export"),
+    *api_urlpatterns,
 ]
@@ -0,0 +1,11 @@
+"""
+URL configuration of the JSON API, without the admin site, for the API-only
+settings profile (settings_api).
+"""
+from django.urls import include, path
+
+urlpatterns = [
+    path("organizations/", include("pd_django_small.organizations.urls")),
+    path("subscriptions/", include("pd_django_small.subscriptions.urls")),
+    path("workspaces/", include("pd_django_small.workspaces.urls")),
+]
@@ -0,0 +1,44 @@
+from django.db.models import Case, F, Func, Q, Value, When
+from django.db.models.functions import Left
+
+from pd_django_small.core.integrity import IntegrityCheck, register
+from pd_django_small.users.models import User
+
+
+def email_local_part(max_length: int):
+    """Part of the email before the "@", a non-blank name, cut to "max_length"."""
+
+    return Left(
+        Func(F("email"), Value("@"), Value(1), function="split_part"), max_length
+    )
+
+
+@register
+class CorruptedNameCheck(IntegrityCheck):
+    """
+    First or last name equal to the email (case-insensitive), fixed by replacing
+    the name with the part of the email before the "@" (names can not be blank).
+    """
+
+    name = "users.corrupted_name"
+    model = User
+    detail_fields = ("email", "first_name", "last_name", "account_type")
+
+    def violations(self, queryset):
+        return queryset.filter(
+            Q(first_name__iexact=F("email")) | Q(last_name__iexact=F("email"))
+        )
+
+    def fix(self, queryset):
+        return queryset.update(
+            **{
+                field: Case(
+                    When(
+                        **{f"{field}__iexact": F("email")},
+                        then=email_local_part(User._meta.get_field(field).max_length),
+                    ),
+                    default=F(field),
+                )
+                for field in ("first_name", "last_name")
+            }
+        )
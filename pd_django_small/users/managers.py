@@ -0,0 +1,93 @@
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, NamedTuple, Union
+
+from django.contrib.auth.models import UserManager as BaseUserManager
+from django.db import connections, models, router, transaction
+
+from pd_django_small.core.managers import SoftDeleteManager
+from pd_django_small.core.upsert import UpsertMixin
+
+BULK_UPSERT_CHUNK_SIZE = 1000
+
+
+class BulkUpsertResult(NamedTuple):
+    created: int
+    updated: int
+
+
+class UserQuerySet(UpsertMixin, models.QuerySet):
+    pass
+
+
+class UserManager(SoftDeleteManager, BaseUserManager.from_queryset(UserQuerySet)):
+    def bulk_upsert(
+        self,
+        rows: Iterable[Union[str, Mapping]],
+        chunk_size: int = BULK_UPSERT_CHUNK_SIZE,
+    ) -> BulkUpsertResult:
+        """
+        Create a user for each email (or dict of user attributes) from "rows",
+        if user with this email already exists then set is_active=True, is_removed=False.
+
+        "rows" is consumed lazily, only one chunk is kept in memory at a time.
+        """
+
+        using = self._db or router.db_for_write(self.model, **self._hints)
+        connection = connections[using]
+        fields = self.model._meta.concrete_fields
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+        row_placeholder = "(%s)" % ", ".join(["%s"] * len(fields))
+        sql_template = (
+            f"INSERT INTO {connection.ops.quote_name(self.model._meta.db_table)} "
+            f"({columns}) VALUES {{values}} "
+            "ON CONFLICT (email) DO UPDATE SET "
+            "is_active = true, is_removed = false, updated_at = EXCLUDED.updated_at "
+            "RETURNING (xmax = 0)"
+        )
+
+        created = updated = 0
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            for chunk in self._chunks(rows, chunk_size):
+                params = []
+                for user in chunk:
+                    params.extend(
+                        f.get_db_prep_save(f.pre_save(user, add=True), connection)
+                        for f in fields
+                    )
+
+                cursor.execute(
+                    sql_template.format(
+                        values=", ".join([row_placeholder] * len(chunk))
+                    ),
+                    params,
+                )
+                for (is_created,) in cursor.fetchall():
+                    if is_created:
+                        created += 1
+                    else:
+                        updated += 1
+
+        return BulkUpsertResult(created=created, updated=updated)
+
+    def _chunks(
+        self, rows: Iterable[Union[str, Mapping]], chunk_size: int
+    ) -> Iterator[list]:
+        """Build unsaved users per chunk, in a chunk the last row of an email wins."""
+
+        iterator = iter(rows)
+        while batch := list(islice(iterator, chunk_size)):
+            users = {}
+            for row in batch:
+                user = self._build_user(row)
+                users[user.email] = user
+            yield list(users.values())
+
+    def _build_user(self, row: Union[str, Mapping]):
+        attrs = {"email": row} if isinstance(row, str) else dict(row)
+        attrs["email"] = self.normalize_email(attrs["email"])
+        attrs.setdefault("username", attrs["email"])
+
+        user = self.model(**attrs)
+        if not user.password:
+            user.set_unusable_password()
+        return user
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:39
+
+from django.db import migrations
+
+import pd_django_small.users.managers
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", pd_django_small.users.managers.UserManager()),
+            ],
+        ),
+    ]
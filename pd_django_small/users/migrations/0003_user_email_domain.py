@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:04
+
+from django.db import migrations, models
+
+EMAIL_DOMAIN_SQL = """
+CREATE FUNCTION users_user_email_domain() RETURNS trigger AS $$
+BEGIN
+    NEW.email_domain := lower(regexp_replace(NEW.email, '^.*@', ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER users_user_email_domain
+BEFORE INSERT OR UPDATE OF email, email_domain ON users_user
+FOR EACH ROW EXECUTE FUNCTION users_user_email_domain();
+"""
+
+DROP_EMAIL_DOMAIN_SQL = """
+DROP TRIGGER users_user_email_domain ON users_user;
+DROP FUNCTION users_user_email_domain();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_alter_user_managers"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="email_domain",
+            field=models.CharField(default="", editable=False, max_length=255),
+        ),
+        migrations.RunSQL(EMAIL_DOMAIN_SQL, DROP_EMAIL_DOMAIN_SQL),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-18 16:04
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+
+BACKFILL_BATCH_SIZE = 1000
+
+# The trigger from 0003 sets email_domain, rows it already covers are skipped.
+BACKFILL_SQL = """
+WITH batch AS (
+    SELECT uuid FROM users_user {after}ORDER BY uuid LIMIT %s
+),
+updated AS (
+    UPDATE users_user SET email_domain = lower(regexp_replace(email, '^.*@', ''))
+    WHERE uuid IN (SELECT uuid FROM batch)
+    AND email_domain IS DISTINCT FROM lower(regexp_replace(email, '^.*@', ''))
+)
+SELECT count(*), (SELECT uuid FROM batch ORDER BY uuid DESC LIMIT 1) FROM batch
+"""
+
+
+def backfill_email_domain(apps, schema_editor):
+    """Primary key batches, each in its own transaction."""
+
+    connection = schema_editor.connection
+    last = None
+    while True:
+        after = "" if last is None else "WHERE uuid > %s "
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                BACKFILL_SQL.format(after=after),
+                [BACKFILL_BATCH_SIZE] if last is None else [last, BACKFILL_BATCH_SIZE],
+            )
+            count, last = cursor.fetchone()
+        if count < BACKFILL_BATCH_SIZE:
+            return
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("users", "0003_user_email_domain"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_email_domain, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(fields=["email_domain"], name="user_email_domain_idx"),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("users", "0004_email_domain_index"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["account_type", "created_at"],
+                name="user_live_account_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_removed", True)),
+                fields=["updated_at"],
+                name="user_removed_idx",
+            ),
+        ),
+    ]
@@ -4,6 +4,8 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from enum import Enum
 
+from pd_django_small.users.managers import UserManager
+
 
 class AccountType(Enum):
     PERSONAL = "PERSONAL"
@@ -14,6 +16,12 @@ class AccountType(Enum):
         return tuple((i.name, i.value) for i in cls)
 
 
+def email_domain(email: str) -> str:
+    """Lowercased part after the last "@", same as the users_user_email_domain trigger."""
+
+    return email.rpartition("@")[2].lower()
+
+
 class User(AbstractUser):
     uuid = models.UUIDField(
         unique=True,
@@ -23,6 +31,8 @@ class User(AbstractUser):
     )
 
     email = models.EmailField(max_length=255, unique=True, db_index=True)
+    # Maintained by the "users_user_email_domain" trigger.
+    email_domain = models.CharField(max_length=255, default="", editable=False)
     first_name = models.CharField(max_length=82, blank=False)
     last_name = models.CharField(max_length=82, blank=False)
     is_active = models.BooleanField(default=True)
@@ -33,3 +43,24 @@ class User(AbstractUser):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True)
+
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["email_domain"], name="user_email_domain_idx"),
+            models.Index(
+                fields=["account_type", "created_at"],
+                condition=models.Q(is_removed=False),
+                name="user_live_account_created_idx",
+            ),
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_removed=True),
+                name="user_removed_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.email_domain = email_domain(self.email)
+        super().save(*args, **kwargs)
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from pd_django_small.users.models import User
+
+
+@pytest.mark.django_db
+def test_users_bulk_upsert(faker, user_factory):
+    """
+    Create user for each email, existing users are re-activated and restored.
+    """
+
+    # Arrange
+    emails = list({faker.unique.email() for _ in range(250)})
+    existing_emails = random.sample(emails, 25)
+    for email in existing_emails:
+        user_factory.create(email=email, is_active=False, is_removed=True)
+
+    # Act
+    result = User.objects.bulk_upsert(iter(emails), chunk_size=40)
+
+    # Assert
+    assert result.created == len(emails) - 25
+    assert result.updated == 25
+    assert User.objects.count() == len(emails)
+    assert not User.objects.filter(is_active=False).exists()
+    assert not User.objects.all_with_removed().filter(is_removed=True).exists()
+    new_email = next(email for email in emails if email not in existing_emails)
+    assert User.objects.get(email=new_email).username == new_email
+
+
+@pytest.mark.django_db
+def test_users_bulk_upsert_attributes(user_factory):
+    """
+    Rows may be dicts of user attributes, of duplicated emails the last row wins.
+    """
+
+    # Arrange
+    user_factory.create(email="admin@example.com", first_name="John", is_active=False)
+
+    # Act
+    result = User.objects.bulk_upsert(
+        [
+            {"email": "admin@example.com", "first_name": "Jane"},
+            {"email": "member@example.com", "first_name": "Jack", "username": "jack"},
+            "member@example.com",
+        ]
+    )
+
+    # Assert
+    assert result == (1, 1)
+    admin = User.objects.get(email="admin@example.com")
+    assert admin.first_name == "John"
+    assert admin.is_active is True
+    assert User.objects.get(email="member@example.com").username == "member@example.com"
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkspacesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "pd_django_small.workspaces"
+
+    def ready(self):
+        from pd_django_small.workspaces import signals  # noqa: F401
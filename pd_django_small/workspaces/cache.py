@@ -0,0 +1,63 @@
+import uuid
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+from pd_django_small.core.cache import TwoTierCache
+from pd_django_small.workspaces.models import Membership
+
+
+class ActiveMembership(NamedTuple):
+    uuid: uuid.UUID
+    workspace: uuid.UUID
+    workspace_name: str
+    organization: uuid.UUID
+
+
+def _build_cache() -> TwoTierCache:
+    config = getattr(settings, "ACTIVE_MEMBERSHIP_CACHE", {})
+    return TwoTierCache(
+        "workspaces:active-membership",
+        max_entries=config.get("MAX_ENTRIES", 10_000),
+        local_ttl=config.get("LOCAL_TTL", 5),
+        timeout=config.get("TIMEOUT", 300),
+        cache_alias=config.get("CACHE_ALIAS", "default"),
+    )
+
+
+active_membership_cache = _build_cache()
+
+
+def _load_active_memberships(users: list) -> dict:
+    """One query over the unique_user_active_membership index."""
+
+    return {
+        user: ActiveMembership(uuid, workspace, workspace_name, organization)
+        for user, uuid, workspace, workspace_name, organization in (
+            Membership.objects.filter(
+                user__in=users, is_active=True, workspace__is_removed=False
+            ).values_list(
+                "user",
+                "uuid",
+                "workspace",
+                "workspace__name",
+                "workspace__organization",
+            )
+        )
+    }
+
+
+def get_active_membership(user: uuid.UUID) -> Optional[ActiveMembership]:
+    """Active membership of the user and its workspace or None, cached in both tiers."""
+
+    return active_membership_cache.get_many_or_load([user], _load_active_memberships)[
+        user
+    ]
+
+
+def get_active_memberships(users: list) -> dict:
+    return active_membership_cache.get_many_or_load(users, _load_active_memberships)
+
+
+def invalidate_active_memberships(users) -> None:
+    active_membership_cache.invalidate_many(users)
@@ -0,0 +1,233 @@
+"""
+Bulk membership import from CSV.
+
+The file is streamed with COPY into a temporary staging table, every row is
+classified with one set-based statement and the accepted rows are inserted
+with a single INSERT ... SELECT, all in one transaction:
+
+- invalid: malformed uuid or is_active, unknown or removed workspace,
+- skipped: the user is already a live member of the workspace, or the row
+  repeats an earlier one,
+- conflict: an active row for a user who already has an active membership
+  (unique_user_active_membership), or a later active row for the same user,
+- inserted: everything else.
+"""
+
+import csv
+import time
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from pd_django_small.core.partitioning import is_partitioned, unique_lock_sql
+from pd_django_small.workspaces.cache import invalidate_active_memberships
+from pd_django_small.workspaces.models import Membership, Workspace
+
+IMPORT_COLUMNS = ("workspace", "user", "is_active")
+REQUIRED_COLUMNS = ("workspace", "user")
+COPY_BLOCK_SIZE = 1 << 16
+MAX_REJECTED = 20
+ACTIVE_CONSTRAINT = "unique_user_active_membership"
+
+UUID_PATTERN = (
+    r"^\s*[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}\s*$"
+)
+TRUE_VALUES = ("1", "t", "true", "y", "yes")
+FALSE_VALUES = ("0", "f", "false", "n", "no")
+
+
+class InvalidImportFile(ValueError):
+    pass
+
+
+@dataclass
+class ImportResult:
+    processed: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    invalid: int = 0
+    conflicts: int = 0
+    elapsed: float = 0.0
+    # (file line, outcome) of the first invalid and conflicting rows.
+    rejected: list = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+def read_header(file: TextIO) -> list[str]:
+    header = [column.strip().lower() for column in next(csv.reader([file.readline()]))]
+    unknown = set(header) - set(IMPORT_COLUMNS)
+    missing = set(REQUIRED_COLUMNS) - set(header)
+    if unknown or missing or len(set(header)) != len(header):
+        raise InvalidImportFile(
+            f"CSV header must name {', '.join(REQUIRED_COLUMNS)} "
+            f"and optionally is_active once each, got {', '.join(header)}"
+        )
+    return header
+
+
+def import_memberships(file: TextIO, using: str = DEFAULT_DB_ALIAS) -> ImportResult:
+    """
+    Import (workspace, user[, is_active]) rows of a CSV file with a header,
+    is_active defaults to true. Rows are never merged into existing memberships.
+    """
+
+    started = time.perf_counter()
+    header = read_header(file)
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    membership_table = qn(Membership._meta.db_table)
+    workspace_table = qn(Workspace._meta.db_table)
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE membership_import ("
+            "line bigint GENERATED ALWAYS AS IDENTITY, "
+            'workspace text, "user" text, is_active text'
+            ") ON COMMIT DROP"
+        )
+        with cursor.cursor.copy(
+            f"COPY membership_import ({', '.join(qn(c) for c in header)}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        ) as copy:
+            while block := file.read(COPY_BLOCK_SIZE):
+                copy.write(block)
+
+        # Activations are ranked after skipping, a skipped row never takes one.
+        cursor.execute(
+            f"""
+            CREATE TEMPORARY TABLE membership_import_outcome ON COMMIT DROP AS
+            WITH parsed AS (
+                SELECT
+                    line,
+                    CASE WHEN workspace ~* %(uuid)s THEN trim(workspace)::uuid END
+                        AS workspace,
+                    CASE WHEN "user" ~* %(uuid)s THEN trim("user")::uuid END
+                        AS user_uuid,
+                    CASE
+                        WHEN coalesce(trim(is_active), '') = '' THEN true
+                        WHEN lower(trim(is_active)) = ANY(%(true)s) THEN true
+                        WHEN lower(trim(is_active)) = ANY(%(false)s) THEN false
+                    END AS is_active
+                FROM membership_import
+            ),
+            checked AS (
+                SELECT
+                    parsed.*,
+                    parsed.user_uuid IS NOT NULL
+                        AND parsed.is_active IS NOT NULL
+                        AND w.uuid IS NOT NULL AS valid
+                FROM parsed
+                LEFT JOIN {workspace_table} AS w
+                    ON w.uuid = parsed.workspace AND NOT w.is_removed
+            ),
+            ranked AS (
+                SELECT
+                    checked.*,
+                    row_number() OVER (
+                        PARTITION BY valid, workspace, user_uuid ORDER BY line
+                    ) AS occurrence
+                FROM checked
+            ),
+            kept AS (
+                SELECT
+                    ranked.*,
+                    valid AND occurrence = 1 AND NOT EXISTS (
+                        SELECT 1 FROM {membership_table} AS m
+                        WHERE m."user" = ranked.user_uuid
+                            AND m.workspace_id = ranked.workspace
+                            AND NOT m.is_removed
+                    ) AS kept
+                FROM ranked
+            ),
+            activations AS (
+                SELECT
+                    kept.*,
+                    row_number() OVER (
+                        PARTITION BY kept.kept, user_uuid, is_active ORDER BY line
+                    ) AS active_rank
+                FROM kept
+            )
+            SELECT
+                line,
+                workspace,
+                user_uuid,
+                is_active,
+                CASE
+                    WHEN NOT valid THEN 'invalid'
+                    WHEN NOT kept THEN 'skipped'
+                    WHEN is_active AND (active_rank > 1 OR EXISTS (
+                        SELECT 1 FROM {membership_table} AS m
+                        WHERE m."user" = activations.user_uuid AND m.is_active
+                    )) THEN 'conflict'
+                    ELSE 'insert'
+                END AS outcome
+            FROM activations
+            """,
+            {
+                "uuid": UUID_PATTERN,
+                "true": list(TRUE_VALUES),
+                "false": list(FALSE_VALUES),
+            },
+        )
+
+        # Memberships activated concurrently since classification are conflicts too.
+        if is_partitioned(Membership, using):
+            # No arbiter index, hold the locks of the uniqueness trigger instead.
+            cursor.execute(
+                f"""
+                SELECT {unique_lock_sql(ACTIVE_CONSTRAINT, ["user_uuid"])}
+                FROM (
+                    SELECT DISTINCT user_uuid FROM membership_import_outcome
+                    WHERE outcome = 'insert' AND is_active ORDER BY user_uuid
+                ) AS activated
+                """
+            )
+            conflict = (
+                f"AND NOT (is_active AND EXISTS (SELECT 1 FROM {membership_table} "
+                'AS m WHERE m."user" = user_uuid AND m.is_active))'
+            )
+        else:
+            conflict = 'ON CONFLICT ("user") WHERE is_active DO NOTHING'
+        cursor.execute(
+            f"""
+            INSERT INTO {membership_table}
+                (uuid, workspace_id, "user", is_active, is_removed, updated_at)
+            SELECT gen_random_uuid(), workspace, user_uuid, is_active, false, now()
+            FROM membership_import_outcome WHERE outcome = 'insert'
+            {conflict}
+            RETURNING "user", is_active
+            """
+        )
+        inserted = cursor.fetchall()
+        activated = [user for user, is_active in inserted if is_active]
+
+        cursor.execute(
+            "SELECT outcome, count(*) FROM membership_import_outcome GROUP BY outcome"
+        )
+        counts = dict(cursor.fetchall())
+        cursor.execute(
+            "SELECT line + 1, outcome FROM membership_import_outcome "
+            "WHERE outcome IN ('invalid', 'conflict') ORDER BY line LIMIT %s",
+            [MAX_REJECTED],
+        )
+        rejected = cursor.fetchall()
+
+        if activated:
+            invalidate_active_memberships(activated)
+            transaction.on_commit(
+                lambda: invalidate_active_memberships(activated), using=using
+            )
+
+    return ImportResult(
+        processed=sum(counts.values()),
+        inserted=len(inserted),
+        skipped=counts.get("skipped", 0),
+        invalid=counts.get("invalid", 0),
+        conflicts=counts.get("conflict", 0) + counts.get("insert", 0) - len(inserted),
+        elapsed=time.perf_counter() - started,
+        rejected=rejected,
+    )
@@ -0,0 +1,42 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from pd_django_small.workspaces.imports import InvalidImportFile, import_memberships
+
+
+class Command(BaseCommand):
+    help = (
+        "Import memberships from a CSV file with a workspace,user[,is_active] "
+        "header through a COPY staging table, in one transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='CSV file, "-" reads standard input.')
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to import into. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            if options["path"] == "-":
+                result = import_memberships(sys.stdin, using=options["database"])
+            else:
+                with open(options["path"], newline="") as file:
+                    result = import_memberships(file, using=options["database"])
+        except InvalidImportFile as exc:
+            raise CommandError(str(exc))
+
+        for line, outcome in result.rejected:
+            self.stderr.write(f"line {line}: {outcome}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Processed {result.processed} rows in {result.elapsed:.2f}s "
+                f"({result.rate:.0f} rows/s): {result.inserted} inserted, "
+                f"{result.skipped} skipped, {result.conflicts} conflicts, "
+                f"{result.invalid} invalid."
+            )
+        )
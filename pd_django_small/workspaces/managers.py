@@ -0,0 +1,88 @@
+import uuid
+from typing import Mapping, NamedTuple
+
+from django.db import connections, router, transaction
+
+from pd_django_small.core.managers import SoftDeleteManager
+from pd_django_small.workspaces.querysets import MembershipQuerySet
+
+
+class SwitchResult(NamedTuple):
+    deactivated: int
+    activated: int
+    created: int
+
+
+class MembershipManager(SoftDeleteManager.from_queryset(MembershipQuerySet)):
+    def switch_active(self, assignments: Mapping[uuid.UUID, uuid.UUID]) -> SwitchResult:
+        """
+        Make workspace assignments[user] the active workspace of every user,
+        with three set-based statements in one transaction.
+
+        Memberships are deactivated before any is activated, so
+        unique_user_active_membership holds after every statement. The user's
+        live membership of the workspace is activated, or created when there is none.
+        """
+
+        from pd_django_small.workspaces.cache import invalidate_active_memberships
+
+        using = self._db or router.db_for_write(self.model, **self._hints)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        table = qn(self.model._meta.db_table)
+        users = list(assignments)
+        targets = "unnest(%s::uuid[], %s::uuid[]) AS target (user_uuid, workspace_uuid)"
+        params = [users, [assignments[user] for user in users]]
+
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} AS m SET is_active = false, updated_at = now()
+                FROM {targets}
+                WHERE m."user" = target.user_uuid AND m.is_active
+                    AND (m.workspace_id <> target.workspace_uuid OR m.is_removed)
+                """,
+                params,
+            )
+            deactivated = cursor.rowcount
+            cursor.execute(
+                f"""
+                WITH chosen AS (
+                    SELECT DISTINCT ON (m."user") m.uuid, m.is_active
+                    FROM {table} AS m JOIN {targets}
+                        ON m."user" = target.user_uuid
+                        AND m.workspace_id = target.workspace_uuid
+                    WHERE NOT m.is_removed
+                    ORDER BY m."user", m.is_active DESC, m.updated_at DESC NULLS LAST
+                )
+                UPDATE {table} AS m SET is_active = true, updated_at = now()
+                FROM chosen WHERE m.uuid = chosen.uuid AND NOT chosen.is_active
+                """,
+                params,
+            )
+            activated = cursor.rowcount
+            cursor.execute(
+                f"""
+                INSERT INTO {table}
+                    (uuid, workspace_id, "user", is_active, is_removed, updated_at)
+                SELECT gen_random_uuid(), target.workspace_uuid, target.user_uuid,
+                    true, false, now()
+                FROM {targets}
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table} AS m
+                    WHERE m."user" = target.user_uuid
+                        AND m.workspace_id = target.workspace_uuid
+                        AND NOT m.is_removed
+                )
+                """,
+                params,
+            )
+            created = cursor.rowcount
+
+            # Now and once more on commit, readers may repopulate in between.
+            invalidate_active_memberships(users)
+            transaction.on_commit(
+                lambda: invalidate_active_memberships(users), using=using
+            )
+
+        return SwitchResult(deactivated, activated, created)
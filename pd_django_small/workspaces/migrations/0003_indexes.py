@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:41
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("workspaces", "0002_remove_workspace_id_workspace_created_at_and_more"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                fields=["organization", "owner"], name="workspace_org_owner_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(fields=["owner"], name="workspace_owner_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["organization", "created_at", "uuid"],
+                name="workspace_live_org_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                fields=["created_at", "uuid"], name="workspace_created_at_uuid_idx"
+            ),
+        ),
+    ]
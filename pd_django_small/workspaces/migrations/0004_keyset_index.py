@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-18 15:49
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("workspaces", "0003_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                fields=["organization", "created_at", "uuid"],
+                name="workspace_org_created_at_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("workspaces", "0004_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="membership",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now, null=True
+            ),
+            preserve_default=False,
+        ),
+    ]
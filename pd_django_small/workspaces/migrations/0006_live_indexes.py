@@ -0,0 +1,86 @@
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    RemoveIndexConcurrently,
+)
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Live rows only indexes replace the full ones, removed rows get their own small index."""
+
+    atomic = False
+
+    dependencies = [
+        ("workspaces", "0005_membership_updated_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["owner"],
+                name="workspace_live_owner_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["created_at", "uuid"],
+                name="workspace_live_created_at_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=models.Index(
+                condition=models.Q(("is_removed", True)),
+                fields=["updated_at"],
+                name="workspace_removed_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="membership",
+            index=models.Index(
+                condition=models.Q(("is_removed", False)),
+                fields=["user"],
+                name="membership_live_user_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="membership",
+            index=models.Index(
+                condition=models.Q(("is_removed", True)),
+                fields=["updated_at"],
+                name="membership_removed_idx",
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="workspace",
+            name="workspace_owner_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="workspace",
+            name="workspace_created_at_uuid_idx",
+        ),
+        RemoveIndexConcurrently(
+            model_name="workspace",
+            name="workspace_org_created_at_idx",
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="membership",
+                    name="user",
+                    field=models.UUIDField(verbose_name="user uuid"),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'DROP INDEX CONCURRENTLY IF EXISTS "workspaces_membership_user_a2a0084c"',
+                    'CREATE INDEX CONCURRENTLY "workspaces_membership_user_a2a0084c" '
+                    'ON "workspaces_membership" ("user")',
+                ),
+            ],
+        ),
+    ]
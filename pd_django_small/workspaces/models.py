@@ -1,6 +1,10 @@
 import uuid
 from django.db import models
 
+from pd_django_small.core.managers import SoftDeleteManager
+from pd_django_small.workspaces.managers import MembershipManager
+from pd_django_small.workspaces.querysets import WorkspaceQuerySet
+
 
 class Workspace(models.Model):
     uuid = models.UUIDField(
@@ -20,6 +24,36 @@ class Workspace(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True)
 
+    objects = SoftDeleteManager.from_queryset(WorkspaceQuerySet)()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["organization", "owner"], name="workspace_org_owner_idx"
+            ),
+            models.Index(
+                fields=["owner"],
+                condition=models.Q(is_removed=False),
+                name="workspace_live_owner_idx",
+            ),
+            models.Index(
+                fields=["organization", "created_at", "uuid"],
+                condition=models.Q(is_removed=False),
+                name="workspace_live_org_idx",
+            ),
+            models.Index(
+                fields=["created_at", "uuid"],
+                condition=models.Q(is_removed=False),
+                name="workspace_live_created_at_idx",
+            ),
+            # Removed rows waiting for the archive_removed command.
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_removed=True),
+                name="workspace_removed_idx",
+            ),
+        ]
+
 
 class Membership(models.Model):
     uuid = models.UUIDField(
@@ -33,12 +67,15 @@ class Membership(models.Model):
         on_delete=models.CASCADE,
     )
     user = models.UUIDField(
-        db_index=True,
         verbose_name="user uuid",
     )
     is_active = models.BooleanField(default=True)
     is_removed = models.BooleanField(default=False)
 
+    updated_at = models.DateTimeField(auto_now=True, null=True)
+
+    objects = MembershipManager()
+
     class Meta:
         verbose_name = "membership"
         verbose_name_plural = "memberships"
@@ -50,3 +87,15 @@ class Membership(models.Model):
                 name="unique_user_active_membership"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["user"],
+                condition=models.Q(is_removed=False),
+                name="membership_live_user_idx",
+            ),
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(is_removed=True),
+                name="membership_removed_idx",
+            ),
+        ]
@@ -0,0 +1,127 @@
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Union
+
+from django.db.models import BooleanField, QuerySet
+from django.db.models.expressions import RawSQL
+
+from pd_django_small.workspaces.models import Workspace
+from pd_django_small.workspaces.projections import WorkspaceRow
+
+FORWARD = "n"
+BACKWARD = "p"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclass
+class Page:
+    items: list = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+
+
+def encode_cursor(direction: str, workspace: Union[Workspace, WorkspaceRow]) -> str:
+    payload = json.dumps(
+        [direction, workspace.created_at.isoformat(), str(workspace.uuid)]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, datetime, uuid.UUID]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        direction, created_at, workspace_uuid = json.loads(payload)
+        if direction not in (FORWARD, BACKWARD):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(created_at), uuid.UUID(workspace_uuid)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise InvalidCursor(cursor) from exc
+
+
+class KeysetPaginator:
+    """
+    Live workspaces paginated by (created_at, uuid), each page is one range scan of
+    the live (created_at, uuid) or (organization, created_at, uuid) index, whatever the page number.
+    Items are Workspace instances, or rows of "projection" (see ProjectionMixin.project()).
+    """
+
+    def __init__(
+        self,
+        per_page: int = 50,
+        organization: Optional[uuid.UUID] = None,
+        projection: Optional[type] = None,
+    ):
+        self.per_page = per_page
+        self.organization = organization
+        self.projection = projection
+
+    def get_queryset(self) -> QuerySet:
+        queryset = Workspace.objects.all()
+        if self.organization is not None:
+            queryset = queryset.filter(organization=self.organization)
+        if self.projection is not None:
+            queryset = queryset.project(self.projection)
+        return queryset
+
+    def page(self, cursor: Optional[str] = None) -> Page:
+        queryset, direction, has_cursor = self._page_queryset(cursor)
+        return self._build_page(list(queryset), direction, has_cursor)
+
+    async def apage(self, cursor: Optional[str] = None) -> Page:
+        queryset, direction, has_cursor = self._page_queryset(cursor)
+        return self._build_page(
+            [item async for item in queryset], direction, has_cursor
+        )
+
+    def _page_queryset(self, cursor: Optional[str]) -> tuple[QuerySet, str, bool]:
+        """Page query fetches one extra row to tell whether there are more rows."""
+
+        queryset = self.get_queryset()
+        if cursor is None:
+            direction = FORWARD
+        else:
+            direction, created_at, workspace_uuid = decode_cursor(cursor)
+            operator = ">" if direction == FORWARD else "<"
+            table = Workspace._meta.db_table
+            queryset = queryset.filter(
+                RawSQL(
+                    f'("{table}"."created_at", "{table}"."uuid") {operator} (%s, %s)',
+                    (created_at, workspace_uuid),
+                    output_field=BooleanField(),
+                )
+            )
+
+        ordering = (
+            ("created_at", "uuid") if direction == FORWARD else ("-created_at", "-uuid")
+        )
+        return (
+            queryset.order_by(*ordering)[: self.per_page + 1],
+            direction,
+            cursor is not None,
+        )
+
+    def _build_page(self, items: list, direction: str, has_cursor: bool) -> Page:
+        has_more = len(items) > self.per_page
+        items = items[: self.per_page]
+        if direction == FORWARD:
+            has_next, has_previous = has_more, has_cursor
+        else:
+            items.reverse()
+            has_next, has_previous = True, has_more
+
+        return Page(
+            items=items,
+            next_cursor=encode_cursor(FORWARD, items[-1])
+            if has_next and items
+            else None,
+            previous_cursor=(
+                encode_cursor(BACKWARD, items[0]) if has_previous and items else None
+            ),
+        )
@@ -0,0 +1,15 @@
+import uuid
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class WorkspaceRow(NamedTuple):
+    """Read-only Workspace row, see ProjectionMixin.project()."""
+
+    uuid: uuid.UUID
+    name: str
+    owner: uuid.UUID
+    organization: uuid.UUID
+    is_removed: bool
+    created_at: datetime
+    updated_at: Optional[datetime]
@@ -0,0 +1,40 @@
+from django.db.models import Window
+from django.db.models.functions import Lag, Lead
+
+from pd_django_small.core.loaders import SoftReferenceQuerySet
+from pd_django_small.core.projections import ProjectionMixin
+from pd_django_small.core.upsert import UpsertMixin
+
+WINDOW_NEIGHBOURS_MAX_ROWS = 1000
+
+
+class WorkspaceQuerySet(ProjectionMixin, UpsertMixin, SoftReferenceQuerySet):
+    soft_references = {
+        "owner": "users.User",
+        "organization": "organizations.Organization",
+    }
+
+    def with_neighbours(self, max_rows: int = WINDOW_NEIGHBOURS_MAX_ROWS):
+        """
+        Annotate prev_workspace_uuid and next_workspace_uuid ordered by (created_at, uuid).
+
+        Window functions scan the whole result, only small results are allowed,
+        use pd_django_small.workspaces.pagination.KeysetPaginator for listings.
+        """
+
+        # Reads at most max_rows + 1 keys instead of counting the whole result.
+        if len(self.values("pk")[: max_rows + 1]) > max_rows:
+            raise ValueError(
+                f"with_neighbours() is limited to {max_rows} rows, "
+                "use KeysetPaginator instead."
+            )
+
+        ordering = ("created_at", "uuid")
+        return self.annotate(
+            prev_workspace_uuid=Window(Lag("uuid"), order_by=ordering),
+            next_workspace_uuid=Window(Lead("uuid"), order_by=ordering),
+        ).order_by(*ordering)
+
+
+class MembershipQuerySet(SoftReferenceQuerySet):
+    soft_references = {"user": "users.User"}
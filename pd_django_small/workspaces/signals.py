@@ -0,0 +1,37 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from pd_django_small.workspaces.cache import invalidate_active_memberships
+from pd_django_small.workspaces.models import Membership, Workspace
+
+
+def _invalidate(users: list, using: str):
+    """Invalidate now and once more on commit, readers may repopulate in between."""
+
+    invalidate_active_memberships(users)
+    transaction.on_commit(partial(invalidate_active_memberships, users), using=using)
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership_cache(sender, instance, using, **kwargs):
+    _invalidate([instance.user], using)
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_workspace_members_cache(sender, instance, created, using, **kwargs):
+    """Cached memberships carry the workspace name and organization."""
+
+    if created:
+        return
+    users = list(
+        Membership.objects.all_with_removed()
+        .using(using)
+        .filter(workspace=instance, is_active=True)
+        .values_list("user", flat=True)
+    )
+    if users:
+        _invalidate(users, using)
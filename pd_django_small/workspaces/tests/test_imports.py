@@ -0,0 +1,126 @@
+import io
+import uuid
+
+import pytest
+from django.core.management import call_command
+
+from pd_django_small.workspaces.imports import (
+    ImportResult,
+    InvalidImportFile,
+    import_memberships,
+)
+from pd_django_small.workspaces.models import Membership
+
+
+@pytest.mark.django_db
+def test_import_memberships(workspace_factory, membership_factory):
+    # Arrange
+    workspace, other = workspace_factory.create_batch(
+        2, owner=uuid.uuid4(), organization=uuid.uuid4()
+    )
+    removed = workspace_factory.create(
+        owner=uuid.uuid4(), organization=uuid.uuid4(), is_removed=True
+    )
+    new, member, active_elsewhere, twice_active = (uuid.uuid4() for _ in range(4))
+    membership_factory.create(workspace=workspace, user=member, is_active=False)
+    membership_factory.create(workspace=other, user=active_elsewhere)
+    csv = "\n".join(
+        [
+            "User,Workspace,is_active",
+            f"{new},{workspace.uuid},",
+            f"{new},{workspace.uuid},yes",
+            f"{member},{workspace.uuid},true",
+            f"{active_elsewhere},{workspace.uuid},1",
+            f"{active_elsewhere},{workspace.uuid.hex.upper()},0",
+            f"{twice_active},{workspace.uuid},t",
+            f"{twice_active},{other.uuid},t",
+            f"{new},{removed.uuid},1",
+            f"{new},{uuid.uuid4()},1",
+            f"not-a-uuid,{workspace.uuid},1",
+            f"{new},{other.uuid},maybe",
+        ]
+    )
+
+    # Act
+    result = import_memberships(io.StringIO(csv))
+
+    # Assert
+    assert (
+        result.processed,
+        result.inserted,
+        result.skipped,
+        result.conflicts,
+        result.invalid,
+    ) == (11, 2, 3, 2, 4)
+    assert result.rejected == [
+        (5, "conflict"),
+        (8, "conflict"),
+        (9, "invalid"),
+        (10, "invalid"),
+        (11, "invalid"),
+        (12, "invalid"),
+    ]
+    assert set(
+        Membership.objects.filter(workspace=workspace).values_list("user", "is_active")
+    ) == {(new, True), (member, False), (twice_active, True)}
+    assert Membership.objects.filter(user=active_elsewhere).count() == 1
+
+
+@pytest.mark.django_db
+def test_import_memberships_skipped_rows_do_not_conflict(
+    workspace_factory, membership_factory
+):
+    """An activation on a skipped row does not turn a later one into a conflict."""
+
+    # Arrange
+    workspace, other = workspace_factory.create_batch(
+        2, owner=uuid.uuid4(), organization=uuid.uuid4()
+    )
+    member, repeated = uuid.uuid4(), uuid.uuid4()
+    membership_factory.create(workspace=workspace, user=member, is_active=False)
+    csv = "\n".join(
+        [
+            "user,workspace,is_active",
+            f"{member},{workspace.uuid},1",
+            f"{member},{other.uuid},1",
+            f"{repeated},{workspace.uuid},0",
+            f"{repeated},{workspace.uuid},1",
+            f"{repeated},{other.uuid},1",
+        ]
+    )
+
+    # Act
+    result = import_memberships(io.StringIO(csv))
+
+    # Assert
+    assert (result.inserted, result.skipped, result.conflicts) == (3, 2, 0)
+    assert set(
+        Membership.objects.filter(is_active=True).values_list("user", "workspace")
+    ) == {(member, other.uuid), (repeated, other.uuid)}
+
+
+@pytest.mark.django_db
+def test_import_memberships_command(tmp_path, workspace_factory):
+    # Arrange
+    workspace = workspace_factory.create(owner=uuid.uuid4(), organization=uuid.uuid4())
+    path = tmp_path / "members.csv"
+    path.write_text(
+        "workspace,user\n"
+        + "".join(f"{workspace.uuid},{uuid.uuid4()}\n" for _ in range(100))
+    )
+    out = io.StringIO()
+
+    # Act
+    call_command("import_memberships", str(path), stdout=out)
+
+    # Assert
+    assert "Processed 100 rows" in out.getvalue()
+    assert "100 inserted, 0 skipped, 0 conflicts, 0 invalid" in out.getvalue()
+    assert Membership.objects.filter(workspace=workspace, is_active=True).count() == 100
+
+
+def test_import_memberships_header():
+    # Act & Assert
+    with pytest.raises(InvalidImportFile):
+        import_memberships(io.StringIO("workspace,email\n"))
+    assert ImportResult(processed=10, elapsed=2).rate == 5
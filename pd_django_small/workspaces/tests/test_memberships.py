@@ -0,0 +1,130 @@
+import uuid
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pd_django_small.workspaces.cache import (
+    ActiveMembership,
+    active_membership_cache,
+    get_active_membership,
+    get_active_memberships,
+)
+from pd_django_small.workspaces.managers import SwitchResult
+from pd_django_small.workspaces.models import Membership
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    active_membership_cache.clear_local()
+    active_membership_cache.reset_stats()
+
+
+@pytest.fixture
+def workspaces(workspace_factory):
+    return workspace_factory.create_batch(
+        2, owner=uuid.uuid4(), organization=uuid.uuid4()
+    )
+
+
+@pytest.mark.django_db
+def test_get_active_membership(workspaces, membership_factory):
+    """Lookups hit the database once, "no active membership" is cached too."""
+
+    # Arrange
+    workspace, other = workspaces
+    user, inactive_user = uuid.uuid4(), uuid.uuid4()
+    membership = membership_factory.create(workspace=workspace, user=user)
+    membership_factory.create(workspace=other, user=user, is_active=False)
+    membership_factory.create(workspace=other, user=inactive_user, is_active=False)
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(3):
+            active = get_active_membership(user)
+            inactive = get_active_membership(inactive_user)
+
+    # Assert
+    assert active == ActiveMembership(
+        membership.uuid, workspace.uuid, workspace.name, workspace.organization
+    )
+    assert inactive is None
+    assert len(context.captured_queries) == 2
+    assert active_membership_cache.stats.local_hits == 4
+
+
+@pytest.mark.django_db
+def test_get_active_memberships_batch(workspaces, membership_factory):
+    # Arrange
+    workspace, _ = workspaces
+    users = [uuid.uuid4() for _ in range(3)]
+    for user in users[:2]:
+        membership_factory.create(workspace=workspace, user=user)
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        memberships = get_active_memberships(users)
+
+    # Assert
+    assert len(context.captured_queries) == 1
+    assert [m and m.workspace for m in memberships.values()] == [
+        workspace.uuid,
+        workspace.uuid,
+        None,
+    ]
+
+
+@pytest.mark.django_db
+def test_active_membership_invalidated(workspaces, membership_factory):
+    # Arrange
+    workspace, other = workspaces
+    user = uuid.uuid4()
+    membership = membership_factory.create(workspace=workspace, user=user)
+    assert get_active_membership(user).workspace_name == workspace.name
+
+    # Act & Assert
+    workspace.name = "Renamed"
+    workspace.save()
+    assert get_active_membership(user).workspace_name == "Renamed"
+
+    membership.is_active = False
+    membership.save()
+    assert get_active_membership(user) is None
+
+
+@pytest.mark.django_db
+def test_switch_active(workspaces, membership_factory):
+    # Arrange
+    source, target = workspaces
+    inactive_in_target, not_member, already_active, removed = (
+        uuid.uuid4() for _ in range(4)
+    )
+    for user in (inactive_in_target, not_member):
+        membership_factory.create(workspace=source, user=user)
+    membership_factory.create(
+        workspace=target, user=inactive_in_target, is_active=False
+    )
+    membership_factory.create(workspace=target, user=already_active)
+    membership_factory.create(workspace=target, user=removed, is_removed=True)
+    users = [inactive_in_target, not_member, already_active, removed]
+    assert get_active_membership(not_member).workspace == source.uuid
+
+    # Act
+    result = Membership.objects.switch_active(dict.fromkeys(users, target.uuid))
+
+    # Assert
+    assert result == SwitchResult(deactivated=3, activated=1, created=2)
+    assert {m.workspace for m in get_active_memberships(users).values()} == {
+        target.uuid
+    }
+    assert Membership.objects.filter(user__in=users, is_active=True).count() == 4
+    assert (
+        not Membership.objects.all_with_removed()
+        .filter(is_removed=True, is_active=True)
+        .exists()
+    )
+    assert Membership.objects.switch_active(
+        dict.fromkeys(users, target.uuid)
+    ) == SwitchResult(0, 0, 0)
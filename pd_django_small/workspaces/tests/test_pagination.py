@@ -0,0 +1,105 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from pd_django_small.workspaces.models import Workspace
+from pd_django_small.workspaces.pagination import InvalidCursor, KeysetPaginator
+
+
+@pytest.fixture
+def workspaces(organization_factory, workspace_factory, user_factory):
+    owner = user_factory.create()
+    organization = organization_factory.create(owner=owner.uuid)
+    workspace_factory.create_batch(3, owner=owner.uuid, organization=owner.uuid)
+    return workspace_factory.create_batch(
+        7, owner=owner.uuid, organization=organization.uuid
+    )
+
+
+@pytest.mark.django_db
+def test_keyset_paginator(workspaces):
+    """Walk pages forward and back with the next/prev cursors."""
+
+    # Arrange
+    paginator = KeysetPaginator(per_page=3, organization=workspaces[0].organization)
+
+    # Act
+    page1 = paginator.page()
+    page2 = paginator.page(page1.next_cursor)
+    page3 = paginator.page(page2.next_cursor)
+    back = paginator.page(page3.previous_cursor)
+
+    # Assert
+    assert page1.items == workspaces[:3]
+    assert page1.previous_cursor is None
+    assert page2.items == workspaces[3:6]
+    assert page3.items == workspaces[6:]
+    assert page3.next_cursor is None
+    assert back.items == workspaces[3:6]
+    assert paginator.page(back.previous_cursor).items == workspaces[:3]
+    assert paginator.page(back.previous_cursor).previous_cursor is None
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_single_range_scan(workspaces):
+    """Page is fetched with a single query, an index range scan without sort."""
+
+    # Arrange
+    paginator = KeysetPaginator(per_page=3, organization=workspaces[0].organization)
+    cursor = paginator.page().next_cursor
+
+    # Act
+    with CaptureQueriesContext(connection) as context:
+        paginator.page(cursor)
+
+    # Assert
+    assert len(context.captured_queries) == 1
+    with connection.cursor() as db_cursor:
+        for setting in ("enable_seqscan", "enable_bitmapscan", "enable_sort"):
+            db_cursor.execute(f"SET LOCAL {setting} = off")
+        db_cursor.execute("EXPLAIN " + context.captured_queries[0]["sql"])
+        plan = "\n".join(row[0] for row in db_cursor.fetchall())
+    assert "Index Cond: ((organization = " in plan
+    assert "AND (ROW(created_at, uuid) > ROW(" in plan
+    assert "Sort" not in plan
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_invalid_cursor():
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator().page("not-a-cursor")
+
+
+@pytest.mark.django_db
+def test_with_neighbours(workspaces):
+    """Window functions annotation is only allowed on small results."""
+
+    # Act
+    qs = Workspace.objects.filter(organization=workspaces[0].organization)
+
+    # Assert
+    neighbours = list(qs.with_neighbours())
+    assert neighbours[0].prev_workspace_uuid is None
+    assert neighbours[0].next_workspace_uuid == workspaces[1].uuid
+    assert neighbours[-1].next_workspace_uuid is None
+    with pytest.raises(ValueError):
+        qs.with_neighbours(max_rows=5)
+
+
+@pytest.mark.django_db
+def test_with_neighbours_guard_is_bounded(workspaces):
+    """The row limit check reads at most max_rows + 1 keys, never counts."""
+
+    # Arrange
+    qs = Workspace.objects.filter(organization=workspaces[0].organization)
+
+    # Act
+    with CaptureQueriesContext(connection) as queries:
+        qs.with_neighbours(max_rows=7)
+
+    # Assert
+    (guard,) = queries.captured_queries
+    assert "LIMIT 8" in guard["sql"]
+    assert "COUNT(" not in guard["sql"]
+    with pytest.raises(ValueError):
+        qs.with_neighbours(max_rows=6)
@@ -0,0 +1,48 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+def test_workspace_list(client, organization_factory, workspace_factory, user_factory):
+    """Workspaces of the organization are paged with keyset cursors."""
+
+    # Arrange
+    owner = user_factory.create()
+    organization = organization_factory.create(owner=owner.uuid)
+    workspaces = workspace_factory.create_batch(
+        3, owner=owner.uuid, organization=organization.uuid
+    )
+    workspace_factory.create(owner=owner.uuid, organization=owner.uuid)
+
+    # Act
+    page1 = client.get(
+        reverse("workspaces:list"), {"organization": organization.uuid, "limit": 2}
+    ).json()
+    page2 = client.get(
+        reverse("workspaces:list"),
+        {"organization": organization.uuid, "limit": 2, "cursor": page1["next"]},
+    ).json()
+    invalid = client.get(reverse("workspaces:list"), {"cursor": "invalid"})
+
+    # Assert
+    assert [w["uuid"] for w in page1["results"] + page2["results"]] == [
+        str(workspace.uuid) for workspace in workspaces
+    ]
+    assert page1["previous"] is None
+    assert page2["next"] is None
+    assert invalid.status_code == 400
+
+
+@pytest.mark.django_db
+def test_workspace_detail(
+    client, organization_factory, workspace_factory, user_factory
+):
+    # Arrange
+    owner = user_factory.create()
+    workspace = workspace_factory.create(owner=owner.uuid, organization=owner.uuid)
+
+    # Act
+    response = client.get(reverse("workspaces:detail", args=[workspace.uuid]))
+
+    # Assert
+    assert response.json()["name"] == workspace.name
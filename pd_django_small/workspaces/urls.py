@@ -0,0 +1,10 @@
+from django.urls import path
+
+from pd_django_small.workspaces import views
+
+app_name = "workspaces"
+
+urlpatterns = [
+    path("", views.workspace_list, name="list"),
+    path("<uuid:workspace>/", views.workspace_detail, name="detail"),
+]
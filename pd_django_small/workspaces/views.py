@@ -1,3 +1,41 @@
-from django.shortcuts import render
+from django.core.exceptions import BadRequest
+from django.http import Http404, JsonResponse
 
-# Create your views here.
+from pd_django_small.core.http import page_size, uuid_param
+from pd_django_small.workspaces.models import Workspace
+from pd_django_small.workspaces.pagination import InvalidCursor, KeysetPaginator
+from pd_django_small.workspaces.projections import WorkspaceRow
+
+WORKSPACE_FIELDS = WorkspaceRow._fields
+
+
+async def workspace_list(request):
+    """Workspaces by (created_at, uuid) with keyset "cursor" pagination."""
+
+    paginator = KeysetPaginator(
+        per_page=page_size(request),
+        organization=uuid_param(request, "organization"),
+        projection=WorkspaceRow,
+    )
+    try:
+        page = await paginator.apage(request.GET.get("cursor"))
+    except InvalidCursor:
+        raise BadRequest("Invalid cursor")
+
+    return JsonResponse(
+        {
+            "results": [workspace._asdict() for workspace in page.items],
+            "next": page.next_cursor,
+            "previous": page.previous_cursor,
+        }
+    )
+
+
+async def workspace_detail(request, workspace):
+    try:
+        workspace = await Workspace.objects.values(*WORKSPACE_FIELDS).aget(
+            uuid=workspace
+        )
+    except Workspace.DoesNotExist:
+        raise Http404("Workspace does not exist")
+    return JsonResponse(workspace)